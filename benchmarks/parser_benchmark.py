@@ -0,0 +1,40 @@
+"""Time CrewAgentParser on outputs larger than 100KB.
+
+Run with ``python benchmarks/parser_benchmark.py``. Each case used to
+backtrack quadratically in the old regex-based parser; they should all
+parse in a few milliseconds.
+"""
+
+import time
+from types import SimpleNamespace
+
+from crewai.agents.parser import CrewAgentParser, OutputParserException
+
+CASES = {
+    "repeated actions without input": "Thought: retry\n" + "Action: search\n" * 20000,
+    "large final answer": "Thought: done\nFinal Answer: "
+    + "lorem ipsum dolor sit amet " * 8000,
+    "large action input": "Thought: look\nAction: search\nAction Input: "
+    + '{"query": "%s"}' % ("x" * 200_000),
+    "large observation": "Observation: "
+    + "lorem ipsum dolor sit amet " * 8000
+    + "\nThought: next\nAction: search\nAction Input: {}",
+}
+
+
+def main(repeat: int = 20) -> None:
+    agent = SimpleNamespace(increment_formatting_errors=lambda: None)
+    parser = CrewAgentParser(agent)
+    for name, text in CASES.items():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            try:
+                parser.parse(text)
+            except OutputParserException:
+                pass
+        elapsed = (time.perf_counter() - started) / repeat
+        print(f"{name:<32} {len(text):>8} chars  {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
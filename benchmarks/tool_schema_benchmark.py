@@ -0,0 +1,59 @@
+"""Compare per-call argument handling with and without a precompiled schema.
+
+Run with ``python benchmarks/tool_schema_benchmark.py``. The uncompiled
+column renders the JSON schema and validates on every call, which is what
+ToolUsage did before CrewStructuredTool cached its schema.
+"""
+
+import time
+from typing import Optional
+
+from pydantic import create_model
+
+from crewai.tools.structured_tool import CrewStructuredTool
+
+
+def _large_schema():
+    leaf = create_model(
+        "Leaf", **{f"field_{i}": (Optional[str], None) for i in range(20)}
+    )
+    branch = create_model(
+        "Branch", **{f"leaf_{i}": (Optional[leaf], None) for i in range(10)}
+    )
+    return create_model(
+        "LargeSchema",
+        query=(str, ...),
+        **{f"branch_{i}": (Optional[branch], None) for i in range(10)},
+    )
+
+
+def main(calls: int = 200) -> None:
+    schema = _large_schema()
+
+    def run(**kwargs) -> str:
+        """Run with a large schema."""
+        return kwargs["query"]
+
+    tool = CrewStructuredTool.from_function(func=run, name="run", args_schema=schema)
+    arguments = {"query": "crewai", "branch_0": {"leaf_0": {"field_0": "x"}}}
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        accepted = schema.model_json_schema()["properties"].keys()
+        schema.model_validate(
+            {k: v for k, v in arguments.items() if k in accepted}
+        ).model_dump()
+    uncompiled = (time.perf_counter() - started) / calls
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        accepted = tool.accepted_args
+        tool.invoke({k: v for k, v in arguments.items() if k in accepted})
+    compiled = (time.perf_counter() - started) / calls
+
+    print(f"uncompiled {uncompiled * 1e6:10.1f} us/call")
+    print(f"compiled   {compiled * 1e6:10.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
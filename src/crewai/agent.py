@@ -1,13 +1,17 @@
+import asyncio
 import os
 import shutil
 import subprocess
+import warnings
+from copy import copy
+from dataclasses import replace
 from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import Field, InstanceOf, PrivateAttr, model_validator
 
 from crewai.agents import CacheHandler
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from crewai.agents.crew_agent_executor import CrewAgentExecutor
+from crewai.agents.crew_agent_executor import CompiledAgent, CrewAgentExecutor
 from crewai.cli.constants import ENV_VARS, LITELLM_PARAMS
 from crewai.knowledge.knowledge import Knowledge
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
@@ -18,6 +22,7 @@ from crewai.task import Task
 from crewai.tools import BaseTool
 from crewai.tools.agent_tools.agent_tools import AgentTools
 from crewai.tools.base_tool import Tool
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.utilities import Converter, Prompts
 from crewai.utilities.constants import TRAINED_AGENTS_DATA_FILE, TRAINING_DATA_FILE
 from crewai.utilities.converter import generate_model_description
@@ -63,12 +68,16 @@ class Agent(BaseAgent):
             tools: Tools at agents disposal
             step_callback: Callback to be executed after each step of the agent execution.
             knowledge_sources: Knowledge sources for the agent.
+            stable_prompt_prefix: Whether to lay out prompts so the provider can cache their prefix.
+            parallel_actions: Whether the agent can request several tool calls in one response.
+            max_tool_result_size: Tool results longer than this are stored on disk and read back in slices.
     """
 
     _times_executed: int = PrivateAttr(default=0)
+    _compiled_agent: Optional[CompiledAgent] = PrivateAttr(default=None)
     max_execution_time: Optional[int] = Field(
         default=None,
-        description="Maximum execution time for an agent to execute a task",
+        description="Maximum execution time in seconds for an agent to execute a task. Once reached, running tools are abandoned and the agent is asked for its final answer.",
     )
     agent_ops_agent_name: str = None  # type: ignore # Incompatible types in assignment (expression has type "None", variable has type "str")
     agent_ops_agent_id: str = None  # type: ignore # Incompatible types in assignment (expression has type "None", variable has type "str")
@@ -108,6 +117,20 @@ class Agent(BaseAgent):
         default=True,
         description="Keep messages under the context window size by summarizing content.",
     )
+    stable_prompt_prefix: bool = Field(
+        default=False,
+        description=(
+            "Keep the system prompt (role, tools and format instructions) byte-stable "
+            "across tasks, inputs and tool loops so provider prompt caching can reuse it."
+        ),
+    )
+    parallel_actions: bool = Field(
+        default=False,
+        description=(
+            "Let the agent request several independent actions in one response; "
+            "they run concurrently and their results come back in one observation."
+        ),
+    )
     max_iter: int = Field(
         default=20,
         description="Maximum number of iterations for an agent to execute a task before giving it's best answer",
@@ -120,6 +143,14 @@ class Agent(BaseAgent):
         default=False,
         description="Whether the agent is multimodal.",
     )
+    max_tool_result_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Tool results longer than this many characters are stored on disk and "
+            "replaced by a preview and a handle the agent can page through."
+        ),
+    )
     code_execution_mode: Literal["safe", "unsafe"] = Field(
         default="safe",
         description="Mode for code execution: 'safe' (using Docker) or 'unsafe' (direct execution).",
@@ -151,6 +182,14 @@ class Agent(BaseAgent):
         if self.allow_code_execution:
             self._validate_docker_installation()
 
+        if self.stable_prompt_prefix and (self.system_template or self.prompt_template):
+            warnings.warn(
+                "stable_prompt_prefix is ignored when system_template or "
+                "prompt_template is set.",
+                UserWarning,
+                stacklevel=2,
+            )
+
         return self
 
     def _setup_agent_executor(self):
@@ -189,6 +228,64 @@ class Agent(BaseAgent):
         Returns:
             Output of the agent
         """
+        task_prompt = self._prepare_task_execution(task, context, tools)
+
+        try:
+            result = self.agent_executor.invoke(
+                self._executor_inputs(task, task_prompt)
+            )["output"]
+        except Exception as e:
+            self._times_executed += 1
+            if self._times_executed > self.max_retry_limit:
+                raise e
+            result = self.execute_task(task, context, tools)
+
+        return self._finalize_task_result(result)
+
+    async def aexecute_task(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Execute a task with the agent asynchronously.
+
+        The prompt is built (memory and knowledge lookups included) in a worker
+        thread, while the agent loop itself awaits the LLM natively.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            Output of the agent
+        """
+        task_prompt = await asyncio.to_thread(
+            self._prepare_task_execution, task, context, tools
+        )
+
+        try:
+            result = (
+                await self.agent_executor.ainvoke(
+                    self._executor_inputs(task, task_prompt)
+                )
+            )["output"]
+        except Exception as e:
+            self._times_executed += 1
+            if self._times_executed > self.max_retry_limit:
+                raise e
+            result = await self.aexecute_task(task, context, tools)
+
+        return self._finalize_task_result(result)
+
+    def _prepare_task_execution(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Build the task prompt and the agent executor for the given task."""
         if self.tools_handler:
             self.tools_handler.last_used_tool = {}  # type: ignore # Incompatible types in assignment (expression has type "dict[Never, Never]", variable has type "ToolCalling")
 
@@ -251,21 +348,17 @@ class Agent(BaseAgent):
         else:
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
-        try:
-            result = self.agent_executor.invoke(
-                {
-                    "input": task_prompt,
-                    "tool_names": self.agent_executor.tools_names,
-                    "tools": self.agent_executor.tools_description,
-                    "ask_for_human_input": task.human_input,
-                }
-            )["output"]
-        except Exception as e:
-            self._times_executed += 1
-            if self._times_executed > self.max_retry_limit:
-                raise e
-            result = self.execute_task(task, context, tools)
+        return task_prompt
+
+    def _executor_inputs(self, task: Task, task_prompt: str) -> Dict[str, Any]:
+        return {
+            "input": task_prompt,
+            "tool_names": self.agent_executor.tools_names,
+            "tools": self.agent_executor.tools_description,
+            "ask_for_human_input": task.human_input,
+        }
 
+    def _finalize_task_result(self, result: str) -> str:
         if self.max_rpm and self._rpm_controller:
             self._rpm_controller.stop_rpm_counter()
 
@@ -286,14 +379,70 @@ class Agent(BaseAgent):
         Returns:
             An instance of the CrewAgentExecutor class.
         """
-        tools = tools or self.tools or []
-        parsed_tools = self._parse_tools(tools)
+        compiled = self._compile(tools or self.tools or [])
+        self.llm = self._llm_with_stop_words(compiled.stop_words)
+
+        self.agent_executor = CrewAgentExecutor(
+            llm=self.llm,
+            task=task,
+            agent=self,
+            crew=self.crew,
+            tools=compiled.tools,
+            prompt=compiled.prompt,
+            original_tools=compiled.original_tools,
+            stop_words=compiled.stop_words,
+            max_iter=self.max_iter,
+            tools_handler=self.tools_handler,
+            tools_names=compiled.tools_names,
+            tools_description=compiled.tools_description,
+            step_callback=self.step_callback,
+            function_calling_llm=self.function_calling_llm,
+            respect_context_window=self.respect_context_window,
+            request_within_rpm_limit=(
+                self._rpm_controller.check_or_wait if self._rpm_controller else None
+            ),
+            callbacks=[
+                TokenCalcHandler(
+                    self._token_process,
+                    agent_role=self.role,
+                    task_id=str(task.id) if task else None,
+                )
+            ],
+            tool_registry=compiled.tool_registry,
+            parallel_actions=self.parallel_actions,
+            max_execution_time=self.max_execution_time,
+        )
+
+    def _compile(self, tools: List[Any]) -> CompiledAgent:
+        """
+        Parse the tools and render the prompts, reusing the previous result
+        while the tools and the prompt-related agent fields are unchanged.
+        """
+        key = self._compile_key(tools)
+        compiled = self._compiled_agent
+        if compiled is not None and compiled.key == key:
+            if all(old is new for old, new in zip(compiled.original_tools, tools)):
+                return compiled
+            # Same tool definitions from new instances (e.g. delegation tools
+            # rebuilt on every kickoff): keep the prompts, rebind the tools
+            parsed_tools = self._parse_compiled_tools(tools)
+            self._compiled_agent = replace(
+                compiled,
+                tools=parsed_tools,
+                original_tools=list(tools),
+                tool_registry=ToolRegistry(parsed_tools),
+            )
+            return self._compiled_agent
+
+        parsed_tools = self._parse_compiled_tools(tools)
 
         prompt = Prompts(
             agent=self,
             tools=tools,
             i18n=self.i18n,
             use_system_prompt=self.use_system_prompt,
+            stable_prefix=self.stable_prompt_prefix,
+            parallel_actions=self.parallel_actions,
             system_template=self.system_template,
             prompt_template=self.prompt_template,
             response_template=self.response_template,
@@ -306,26 +455,69 @@ class Agent(BaseAgent):
                 self.response_template.split("{{ .Response }}")[1].strip()
             )
 
-        self.agent_executor = CrewAgentExecutor(
-            llm=self.llm,
-            task=task,
-            agent=self,
-            crew=self.crew,
+        self._compiled_agent = CompiledAgent(
+            key=key,
             tools=parsed_tools,
+            original_tools=list(tools),
             prompt=prompt,
-            original_tools=tools,
             stop_words=stop_words,
-            max_iter=self.max_iter,
-            tools_handler=self.tools_handler,
             tools_names=self.__tools_names(parsed_tools),
             tools_description=self._render_text_description_and_args(parsed_tools),
-            step_callback=self.step_callback,
-            function_calling_llm=self.function_calling_llm,
-            respect_context_window=self.respect_context_window,
-            request_within_rpm_limit=(
-                self._rpm_controller.check_or_wait if self._rpm_controller else None
+            tool_registry=ToolRegistry(parsed_tools),
+        )
+        return self._compiled_agent
+
+    def _llm_with_stop_words(self, stop_words: List[str]) -> Any:
+        """
+        The agent's LLM with the executor stop words appended. The LLM may be
+        shared with other agents, so it is copied rather than updated in place.
+        """
+        llm: Any = self.llm
+        current = llm.stop or []
+        if isinstance(current, str):
+            current = [current]
+        missing = [word for word in stop_words if word not in current]
+        if not missing:
+            return llm
+        llm = copy(llm)
+        llm.stop = list(current) + missing
+        return llm
+
+    def _parse_compiled_tools(self, tools: List[Any]) -> List[Any]:
+        parsed_tools = self._parse_tools(tools)
+        if self.stable_prompt_prefix:
+            # Tool order changes the rendered prompt, keep it deterministic
+            parsed_tools = sorted(parsed_tools, key=lambda tool: tool.name)
+        return parsed_tools
+
+    def _compile_key(self, tools: List[Any]) -> tuple:
+        """
+        Values that change the rendered prompts. Tools are keyed by their
+        definition rather than identity so that equivalent tools created for
+        a new kickoff still hit the cache.
+        """
+        return (
+            tuple(
+                (
+                    tool.name,
+                    getattr(tool, "description", None),
+                    getattr(tool, "args_schema", None),
+                )
+                for tool in tools
             ),
-            callbacks=[TokenCalcHandler(self._token_process)],
+            self.role,
+            self.goal,
+            self.backstory,
+            self._original_role,
+            self._original_goal,
+            self._original_backstory,
+            self.i18n.prompt_file,
+            self.use_system_prompt,
+            self.stable_prompt_prefix,
+            self.parallel_actions,
+            self.system_template,
+            self.prompt_template,
+            self.response_template,
         )
 
     def get_delegation_tools(self, agents: List[BaseAgent]):
@@ -338,6 +530,11 @@ class Agent(BaseAgent):
 
         return [AddImageTool()]
 
+    def get_tool_result_tools(self) -> List[BaseTool]:
+        from crewai.tools.agent_tools.read_tool_result_tool import ReadToolResultTool
+
+        return [ReadToolResultTool()]
+
     def get_code_execution_tools(self):
         try:
             from crewai_tools import CodeInterpreterTool
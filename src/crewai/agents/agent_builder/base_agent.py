@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from copy import copy as shallow_copy
@@ -53,6 +54,8 @@ class BaseAgent(ABC, BaseModel):
     Methods:
         execute_task(task: Any, context: Optional[str] = None, tools: Optional[List[BaseTool]] = None) -> str:
             Abstract method to execute a task.
+        aexecute_task(task: Any, context: Optional[str] = None, tools: Optional[List[BaseTool]] = None) -> str:
+            Execute a task asynchronously.
         create_agent_executor(tools=None) -> None:
             Abstract method to create an agent executor.
         _parse_tools(tools: List[BaseTool]) -> List[Any]:
@@ -178,7 +181,7 @@ class BaseAgent(ABC, BaseModel):
         self._logger = Logger(verbose=self.verbose)
         if self.max_rpm and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm, logger=self._logger, key=f"agent:{self.key}"
             )
         if not self._token_process:
             self._token_process = TokenProcess()
@@ -199,7 +202,7 @@ class BaseAgent(ABC, BaseModel):
         self._logger = Logger(verbose=self.verbose)
         if self.max_rpm and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm, logger=self._logger, key=f"agent:{self.key}"
             )
         if not self._token_process:
             self._token_process = TokenProcess()
@@ -223,6 +226,19 @@ class BaseAgent(ABC, BaseModel):
     ) -> str:
         pass
 
+    async def aexecute_task(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Execute a task asynchronously.
+
+        Agents without a native coroutine implementation run `execute_task`
+        in a worker thread.
+        """
+        return await asyncio.to_thread(self.execute_task, task, context, tools)
+
     @abstractmethod
     def create_agent_executor(self, tools=None) -> None:
         pass
@@ -263,6 +279,8 @@ class BaseAgent(ABC, BaseModel):
         copied_data = self.model_dump(exclude=exclude)
         copied_data = {k: v for k, v in copied_data.items() if v is not None}
         copied_agent = type(self)(**copied_data, llm=existing_llm, tools=self.tools)
+        if copied_agent._rpm_controller and self._rpm_controller:
+            copied_agent._rpm_controller.share_limiter(self._rpm_controller)
 
         return copied_agent
 
@@ -1,5 +1,11 @@
+from collections import deque
+from typing import Deque
+
+from crewai.types.performance_metrics import LLMCallRecord, PerformanceStats
 from crewai.types.usage_metrics import UsageMetrics
 
+MAX_LLM_CALL_RECORDS = 100
+
 
 class TokenProcess:
     def __init__(self) -> None:
@@ -8,6 +14,12 @@ class TokenProcess:
         self.cached_prompt_tokens: int = 0
         self.completion_tokens: int = 0
         self.successful_requests: int = 0
+        self.llm_cache_hits: int = 0
+        self.llm_cache_misses: int = 0
+        self.llm_cache_evictions: int = 0
+        self.performance = PerformanceStats()
+        # Latest calls only, for inspection; aggregates live in `performance`
+        self.llm_call_records: Deque[LLMCallRecord] = deque(maxlen=MAX_LLM_CALL_RECORDS)
 
     def sum_prompt_tokens(self, tokens: int) -> None:
         self.prompt_tokens += tokens
@@ -23,6 +35,17 @@ class TokenProcess:
     def sum_successful_requests(self, requests: int) -> None:
         self.successful_requests += requests
 
+    def sum_llm_cache_event(self, hit: bool, evictions: int = 0) -> None:
+        if hit:
+            self.llm_cache_hits += 1
+        else:
+            self.llm_cache_misses += 1
+        self.llm_cache_evictions += evictions
+
+    def record_llm_call(self, record: LLMCallRecord) -> None:
+        self.performance.add(record)
+        self.llm_call_records.append(record)
+
     def get_summary(self) -> UsageMetrics:
         return UsageMetrics(
             total_tokens=self.total_tokens,
@@ -30,4 +53,7 @@ class TokenProcess:
             cached_prompt_tokens=self.cached_prompt_tokens,
             completion_tokens=self.completion_tokens,
             successful_requests=self.successful_requests,
+            llm_cache_hits=self.llm_cache_hits,
+            llm_cache_misses=self.llm_cache_misses,
+            llm_cache_evictions=self.llm_cache_evictions,
         )
@@ -1,3 +1,4 @@
 from .cache_handler import CacheHandler
+from .tool_cache_storage import ToolCacheStorage
 
-__all__ = ["CacheHandler"]
+__all__ = ["CacheHandler", "ToolCacheStorage"]
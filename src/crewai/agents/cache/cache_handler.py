@@ -1,15 +1,187 @@
+import ast
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from crewai.agents.cache.tool_cache_storage import (
+    ToolCacheStorage,
+    get_tool_cache_storage,
+)
+
+
+@dataclass
+class _CacheEntry:
+    output: Any
+    size: int
+    expires_at: Optional[float]
+
+
+def _parse_input(input: str) -> Any:
+    for parse in (json.loads, ast.literal_eval):
+        try:
+            parsed = parse(input)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    return input
 
 
 class CacheHandler(BaseModel):
-    """Callback handler for tool usage."""
+    """
+    Thread-safe LRU cache of tool results, shared by the agents of a crew.
+
+    Keys are built from the tool name and the sorted-key JSON of its input,
+    so argument order does not matter. The least recently used entries are
+    evicted once `max_entries` or `max_bytes` is exceeded, and entries expire
+    after the tool's TTL, if any. With `persistent`, results are also written
+    to a SQLite file and misses fall back to it, so crew copies and other
+    processes reuse each other's results.
+    """
+
+    max_entries: Optional[int] = Field(
+        default=1000, ge=1, description="Maximum number of cached results."
+    )
+    max_bytes: Optional[int] = Field(
+        default=None, ge=1, description="Maximum total size of cached results."
+    )
+    ttl: Optional[float] = Field(
+        default=None, gt=0, description="Seconds a result stays valid, for every tool."
+    )
+    tool_ttls: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds a result stays valid, per tool name. Overrides ttl.",
+    )
+    persistent: bool = Field(
+        default=False,
+        description="Also keep results in a SQLite file shared across crews and processes.",
+    )
+    db_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file for persistent results. Defaults to the crewai storage directory.",
+    )
+
+    _entries: "OrderedDict[str, _CacheEntry]" = PrivateAttr(default_factory=OrderedDict)
+    _size: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+    _evictions: int = PrivateAttr(default=0)
+    _storage_evictions: int = PrivateAttr(default=0)
+    _storage: Optional[ToolCacheStorage] = PrivateAttr(default=None)
 
-    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    @model_validator(mode="after")
+    def set_storage(self) -> "CacheHandler":
+        if self.persistent:
+            self._storage = get_tool_cache_storage(self.db_path)
+        return self
 
-    def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+    @staticmethod
+    def make_key(tool: str, input: Any) -> str:
+        """
+        Hash of the tool name and the canonical JSON of its input. String
+        inputs holding a JSON object or a Python dict literal, as the cache
+        tool passes them, are parsed first so they match the original call.
+        """
+        if isinstance(input, str):
+            input = _parse_input(input)
+        canonical = json.dumps(
+            input, sort_keys=True, default=str, separators=(",", ":")
+        )
+        return hashlib.sha256(f"{tool}\x00{canonical}".encode("utf-8")).hexdigest()
+
+    def add(self, tool, input, output, persist: bool = True):
+        key = self.make_key(tool, input)
+        ttl = self.tool_ttls.get(tool, self.ttl)
+        evicted = 0
+        if self._storage is not None and persist:
+            evicted = self._storage.set(key, tool, output, ttl)
+        self._put(key, output, time.monotonic() + ttl if ttl else None, evicted)
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        key = self.make_key(tool, input)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None:
+                if entry.expires_at <= time.monotonic():
+                    self._remove(key)
+                    entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.output
+            if self._storage is None:
+                self._misses += 1
+                return None
+
+        stored = self._storage.get(key)
+        if stored is None:
+            with self._lock:
+                self._misses += 1
+            return None
+        output, expires_at = stored
+        if expires_at is not None:
+            expires_at = time.monotonic() + expires_at - time.time()
+        self._put(key, output, expires_at)
+        with self._lock:
+            self._hits += 1
+        return output
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit, miss and eviction counts, with the current entry count and size.
+        Evictions from persistent storage are counted on their own.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "storage_evictions": self._storage_evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def _put(
+        self, key: str, output: Any, expires_at: Optional[float], evicted: int = 0
+    ) -> None:
+        entry = _CacheEntry(
+            output=output,
+            size=len(str(output).encode("utf-8")),
+            expires_at=expires_at,
+        )
+        with self._lock:
+            self._storage_evictions += evicted
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            if self.max_bytes is not None and entry.size > self.max_bytes:
+                # Too large to keep, but the stale result must not be served
+                return
+            self._entries[key] = entry
+            self._size += entry.size
+            self._evict()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._size > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self._evictions += 1
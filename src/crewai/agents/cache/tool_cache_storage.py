@@ -0,0 +1,170 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.printer import Printer
+
+
+class ToolCacheStorage:
+    """
+    SQLite store for tool results, shared by every crew that points at the
+    same file, in this process or another one on the host.
+
+    Results are stored as JSON, so only JSON-serializable outputs persist.
+    Entries expire at their own `expires_at`, if set, and are evicted
+    least-recently-used first once the store holds more than `max_entries`.
+    """
+
+    def __init__(
+        self, db_path: Optional[str] = None, max_entries: int = 100_000
+    ) -> None:
+        if db_path is None:
+            db_path = str(Path(db_storage_path()).parent / "tool_cache.db")
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._printer: Printer = Printer()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _initialize_db(self) -> None:
+        try:
+            with self._connect() as conn:
+                # WAL lets readers in other processes proceed during a write
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tool_results (
+                        key TEXT PRIMARY KEY,
+                        tool TEXT,
+                        output TEXT,
+                        expires_at REAL,
+                        last_accessed REAL
+                    )
+                """
+                )
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS tool_results_last_accessed
+                    ON tool_results (last_accessed)
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred during database initialization: {e}",
+                color="red",
+            )
+
+    def get(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        Return `(output, expires_at)` for `key`, or None if missing or
+        expired. `expires_at` is a `time.time()` timestamp.
+        """
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT output, expires_at FROM tool_results WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None or (row[1] is not None and row[1] <= now):
+                    return None
+                conn.execute(
+                    "UPDATE tool_results SET last_accessed = ? WHERE key = ?",
+                    (now, key),
+                )
+                conn.commit()
+                return json.loads(row[0]), row[1]
+        except (sqlite3.Error, ValueError) as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred while reading the cache: {e}",
+                color="red",
+            )
+        return None
+
+    def set(self, key: str, tool: str, output: Any, ttl: Optional[float]) -> int:
+        """Store an output and return the number of entries evicted."""
+        if output is None:
+            return 0
+        try:
+            serialized = json.dumps(output)
+        except (TypeError, ValueError):
+            return 0
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO tool_results (key, tool, output, expires_at, last_accessed)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    (key, tool, serialized, expires_at, now),
+                )
+                evicted = conn.execute(
+                    "DELETE FROM tool_results WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (now,),
+                ).rowcount
+                overflow = (
+                    conn.execute("SELECT COUNT(*) FROM tool_results").fetchone()[0]
+                    - self.max_entries
+                )
+                if overflow > 0:
+                    evicted += conn.execute(
+                        """
+                        DELETE FROM tool_results WHERE key IN (
+                            SELECT key FROM tool_results
+                            ORDER BY last_accessed ASC
+                            LIMIT ?
+                        )
+                    """,
+                        (overflow,),
+                    ).rowcount
+                conn.commit()
+                return evicted
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred while writing the cache: {e}",
+                color="red",
+            )
+        return 0
+
+    def reset(self) -> None:
+        """Remove every cached output."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM tool_results")
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred while clearing the cache: {e}",
+                color="red",
+            )
+
+
+_tool_cache_storages: Dict[Tuple[str, int], ToolCacheStorage] = {}
+_tool_cache_storages_lock = threading.Lock()
+
+
+def get_tool_cache_storage(
+    db_path: Optional[str] = None, max_entries: int = 100_000
+) -> ToolCacheStorage:
+    """
+    Return the process-wide storage for `db_path`, so crew copies made by
+    `kickoff_for_each` share one instance instead of reopening the file.
+    """
+    if db_path is None:
+        db_path = str(Path(db_storage_path()).parent / "tool_cache.db")
+    with _tool_cache_storages_lock:
+        storage = _tool_cache_storages.get((db_path, max_entries))
+        if storage is None:
+            storage = ToolCacheStorage(db_path=db_path, max_entries=max_entries)
+            _tool_cache_storages[(db_path, max_entries)] = storage
+        return storage
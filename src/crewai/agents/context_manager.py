@@ -0,0 +1,201 @@
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import litellm
+
+from crewai.utilities import I18N
+
+MAX_PARALLEL_SUMMARIES = 4
+KEEP_RECENT_MESSAGES = 2
+# Rough size of a token when the model's tokenizer is unavailable
+CHARS_PER_TOKEN = 4
+
+
+class ContextWindowManager:
+    """
+    Keeps an agent's message history within the model's context window.
+
+    Token counts are computed locally (and memoized per message) before each
+    LLM call. When the history outgrows the budget, the messages between the
+    task prompt and the most recent turns are split into token-sized chunks
+    that are summarized concurrently. Summaries are cached by chunk content,
+    and summaries produced earlier are carried over verbatim, so a compacted
+    prefix is never summarized again.
+    """
+
+    def __init__(self, llm: Any, i18n: Optional[I18N] = None) -> None:
+        self.llm = llm
+        self._i18n = i18n or I18N()
+        self._token_counts: Dict[str, int] = {}
+        self._chunk_summaries: Dict[str, str] = {}
+        # Content of summary messages we produced -> the summary text they hold
+        self._summary_messages: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def budget(self) -> int:
+        return self.llm.get_context_window_size()
+
+    def count_tokens(self, messages: List[Dict[str, str]]) -> int:
+        return sum(
+            self._message_tokens(str(message["content"])) for message in messages
+        )
+
+    def fits(self, messages: List[Dict[str, str]]) -> bool:
+        return self.count_tokens(messages) <= self.budget
+
+    def compact(
+        self, messages: List[Dict[str, str]], callbacks: Optional[List[Any]] = None
+    ) -> List[Dict[str, str]]:
+        """Replace older messages with a summary, summarizing chunks in parallel."""
+        head, chunks, tail = self._plan(messages)
+        pending = [chunk for chunk, summary in chunks if summary is None]
+        if pending:
+            with ThreadPoolExecutor(
+                max_workers=min(len(pending), MAX_PARALLEL_SUMMARIES)
+            ) as pool:
+                results = list(
+                    pool.map(lambda chunk: self._summarize(chunk, callbacks), pending)
+                )
+            self._store_summaries(pending, results)
+        return head + [self._summary_message(chunks)] + tail
+
+    async def acompact(
+        self, messages: List[Dict[str, str]], callbacks: Optional[List[Any]] = None
+    ) -> List[Dict[str, str]]:
+        head, chunks, tail = self._plan(messages)
+        pending = [chunk for chunk, summary in chunks if summary is None]
+        if pending:
+            semaphore = asyncio.Semaphore(MAX_PARALLEL_SUMMARIES)
+
+            async def summarize(chunk: str) -> str:
+                async with semaphore:
+                    return await self.llm.acall(
+                        self._summary_request(chunk), callbacks=callbacks
+                    )
+
+            results = await asyncio.gather(*(summarize(chunk) for chunk in pending))
+            self._store_summaries(pending, list(results))
+        return head + [self._summary_message(chunks)] + tail
+
+    def _plan(
+        self, messages: List[Dict[str, str]]
+    ) -> Tuple[
+        List[Dict[str, str]], List[Tuple[str, Optional[str]]], List[Dict[str, str]]
+    ]:
+        """
+        Split `messages` into the kept head (up to the task prompt), the chunks
+        to summarize (with their cached summary, if any) and the kept tail.
+        """
+        head_size = next(
+            (i + 1 for i, message in enumerate(messages) if message["role"] == "user"),
+            0,
+        )
+        tail_start = max(head_size, len(messages) - KEEP_RECENT_MESSAGES)
+        head, middle, tail = (
+            messages[:head_size],
+            messages[head_size:tail_start],
+            messages[tail_start:],
+        )
+        if not middle or not self.fits(head + tail):
+            head, middle, tail = [], list(messages), []
+
+        chunk_size = max(self.budget // 2, 1)
+        chunks: List[Tuple[str, Optional[str]]] = []
+        group: List[str] = []
+        group_tokens = 0
+
+        def close_group():
+            nonlocal group, group_tokens
+            if group:
+                text = "\n\n".join(group)
+                chunks.append((text, self._chunk_summaries.get(self._key(text))))
+                group, group_tokens = [], 0
+
+        for message in middle:
+            # Multimodal content is a list of parts, summarize its text form
+            content = str(message["content"])
+            previous_summary = self._summary_messages.get(content)
+            if previous_summary is not None:
+                close_group()
+                chunks.append((content, previous_summary))
+                continue
+            tokens = self._message_tokens(content)
+            if group_tokens + tokens > chunk_size:
+                close_group()
+            if tokens > chunk_size:
+                for piece in self._split_text(content, chunk_size):
+                    group.append(piece)
+                    close_group()
+                continue
+            group.append(content)
+            group_tokens += tokens
+        close_group()
+        return head, chunks, tail
+
+    def _summary_message(
+        self, chunks: List[Tuple[str, Optional[str]]]
+    ) -> Dict[str, str]:
+        merged_summary = " ".join(
+            str(summary)
+            if summary is not None
+            else str(self._chunk_summaries[self._key(chunk)])
+            for chunk, summary in chunks
+        )
+        content = self._i18n.slice("summary").format(merged_summary=merged_summary)
+        with self._lock:
+            self._summary_messages[content] = merged_summary
+        return {"role": "user", "content": content}
+
+    def _summary_request(self, chunk: str) -> List[Dict[str, str]]:
+        return [
+            {
+                "role": "system",
+                "content": self._i18n.slice("summarizer_system_message"),
+            },
+            {
+                "role": "user",
+                "content": self._i18n.slice("summarize_instruction").format(
+                    group=chunk
+                ),
+            },
+        ]
+
+    def _summarize(self, chunk: str, callbacks: Optional[List[Any]]) -> str:
+        return self.llm.call(self._summary_request(chunk), callbacks=callbacks)
+
+    def _store_summaries(self, chunks: List[str], summaries: List[str]) -> None:
+        with self._lock:
+            for chunk, summary in zip(chunks, summaries):
+                self._chunk_summaries[self._key(chunk)] = summary
+
+    def _message_tokens(self, content: str) -> int:
+        key = self._key(content)
+        tokens = self._token_counts.get(key)
+        if tokens is None:
+            try:
+                tokens = litellm.token_counter(model=self.llm.model, text=content)
+            except Exception:
+                tokens = len(content) // CHARS_PER_TOKEN + 1
+            with self._lock:
+                self._token_counts[key] = tokens
+        return tokens
+
+    def _split_text(self, text: str, chunk_size: int) -> List[str]:
+        """Slice `text` into pieces of at most `chunk_size` tokens."""
+        try:
+            tokens = litellm.encode(model=self.llm.model, text=text)
+            return [
+                litellm.decode(model=self.llm.model, tokens=tokens[i : i + chunk_size])
+                for i in range(0, len(tokens), chunk_size)
+            ]
+        except Exception:
+            size = chunk_size * CHARS_PER_TOKEN
+            return [text[i : i + size] for i in range(0, len(text), size)]
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
@@ -1,10 +1,14 @@
+import asyncio
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.agent_builder.base_agent_executor_mixin import CrewAgentExecutorMixin
+from crewai.agents.context_manager import ContextWindowManager
 from crewai.agents.parser import (
     FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE,
     AgentAction,
@@ -14,6 +18,7 @@ from crewai.agents.parser import (
 )
 from crewai.agents.tools_handler import ToolsHandler
 from crewai.tools.base_tool import BaseTool
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.tools.tool_usage import ToolUsage, ToolUsageErrorException
 from crewai.utilities import I18N, Printer
 from crewai.utilities.constants import MAX_LLM_RETRY, TRAINING_DATA_FILE
@@ -23,6 +28,10 @@ from crewai.utilities.exceptions.context_window_exceeding_exception import (
 from crewai.utilities.logger import Logger
 from crewai.utilities.training_handler import CrewTrainingHandler
 
+MAX_PARALLEL_ACTIONS = 4
+
+_ACTION_NAME = re.compile(r"Action\s*\d*\s*:")
+
 
 @dataclass
 class ToolResult:
@@ -30,8 +39,27 @@ class ToolResult:
     result_as_answer: bool
 
 
+@dataclass(frozen=True)
+class CompiledAgent:
+    """
+    The parts of an agent executor that only depend on the agent's
+    configuration and tools, built once and shared by every task execution
+    until one of the inputs in `key` changes.
+    """
+
+    key: Tuple[Any, ...]
+    tools: List[Any]
+    original_tools: List[Any]
+    prompt: Dict[str, str]
+    stop_words: List[str]
+    tools_names: str
+    tools_description: str
+    tool_registry: ToolRegistry
+
+
 class CrewAgentExecutor(CrewAgentExecutorMixin):
     _logger: Logger = Logger()
+    _i18n: I18N = I18N()
 
     def __init__(
         self,
@@ -52,8 +80,10 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         respect_context_window: bool = False,
         request_within_rpm_limit: Optional[Callable[[], bool]] = None,
         callbacks: List[Any] = [],
+        tool_registry: Optional[ToolRegistry] = None,
+        parallel_actions: bool = False,
+        max_execution_time: Optional[int] = None,
     ):
-        self._i18n: I18N = I18N()
         self.llm = llm
         self.task = task
         self.agent = agent
@@ -72,29 +102,20 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.tools_description = tools_description
         self.function_calling_llm = function_calling_llm
         self.respect_context_window = respect_context_window
+        self.parallel_actions = parallel_actions
+        self.max_execution_time = max_execution_time
+        self._deadline: Optional[float] = None
+        self.context_manager = ContextWindowManager(self.llm, i18n=self._i18n)
         self.request_within_rpm_limit = request_within_rpm_limit
         self.ask_for_human_input = False
         self.messages: List[Dict[str, str]] = []
         self.iterations = 0
         self.log_error_after = 3
-        self.tool_name_to_tool_map: Dict[str, BaseTool] = {
-            tool.name: tool for tool in self.tools
-        }
-        if self.llm.stop:
-            self.llm.stop = list(set(self.llm.stop + self.stop))
-        else:
-            self.llm.stop = self.stop
+        self.tool_registry = tool_registry or ToolRegistry(self.tools)
 
     def invoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
-        if "system" in self.prompt:
-            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
-            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
-            self.messages.append(self._format_msg(system_prompt, role="system"))
-            self.messages.append(self._format_msg(user_prompt))
-        else:
-            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
-            self.messages.append(self._format_msg(user_prompt))
-
+        self._start_clock()
+        self._setup_messages(inputs)
         self._show_start_logs()
 
         self.ask_for_human_input = bool(inputs.get("ask_for_human_input", False))
@@ -107,6 +128,39 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._create_long_term_memory(formatted_answer)
         return {"output": formatted_answer.output}
 
+    async def ainvoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
+        """Asynchronous counterpart of `invoke` that awaits the LLM calls."""
+        self._start_clock()
+        self._setup_messages(inputs)
+        self._show_start_logs()
+
+        self.ask_for_human_input = bool(inputs.get("ask_for_human_input", False))
+        formatted_answer = await self._ainvoke_loop()
+
+        if self.ask_for_human_input:
+            # Human feedback blocks on stdin, keep it off the event loop.
+            formatted_answer = await asyncio.to_thread(
+                self._handle_human_feedback, formatted_answer
+            )
+
+        await asyncio.to_thread(self._create_short_term_memory, formatted_answer)
+        await asyncio.to_thread(self._create_long_term_memory, formatted_answer)
+        return {"output": formatted_answer.output}
+
+    def _start_clock(self) -> None:
+        if self.max_execution_time is not None:
+            self._deadline = time.monotonic() + self.max_execution_time
+
+    def _setup_messages(self, inputs: Dict[str, str]) -> None:
+        if "system" in self.prompt:
+            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
+            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
+            self.messages.append(self._format_msg(system_prompt, role="system"))
+            self.messages.append(self._format_msg(user_prompt))
+        else:
+            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
+            self.messages.append(self._format_msg(user_prompt))
+
     def _invoke_loop(self):
         """
         Main loop to invoke the agent's thought process until it reaches a conclusion
@@ -115,7 +169,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         formatted_answer = None
         while not isinstance(formatted_answer, AgentFinish):
             try:
-                if self._has_reached_max_iterations():
+                if self._has_reached_max_iterations() or self._is_out_of_time():
                     formatted_answer = self._handle_max_iterations_exceeded(
                         formatted_answer
                     )
@@ -127,7 +181,12 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
 
                 formatted_answer = self._process_llm_response(answer)
 
-                if isinstance(formatted_answer, AgentAction):
+                if isinstance(formatted_answer, list):
+                    tool_results = self._execute_tools_concurrently(formatted_answer)
+                    formatted_answer = self._handle_agent_actions(
+                        answer, formatted_answer, tool_results
+                    )
+                elif isinstance(formatted_answer, AgentAction):
                     tool_result = self._execute_tool_and_check_finality(
                         formatted_answer
                     )
@@ -149,10 +208,69 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._show_logs(formatted_answer)
         return formatted_answer
 
+    async def _ainvoke_loop(self):
+        """
+        Asynchronous version of `_invoke_loop`. LLM calls and tools are awaited
+        natively, other blocking work (rate limiting, summarization) runs in a
+        thread.
+        """
+        formatted_answer = None
+        while not isinstance(formatted_answer, AgentFinish):
+            try:
+                if self._has_reached_max_iterations() or self._is_out_of_time():
+                    formatted_answer = await self._ahandle_max_iterations_exceeded(
+                        formatted_answer
+                    )
+                    break
+
+                await asyncio.to_thread(self._enforce_rpm_limit)
+
+                answer = await self._aget_llm_response()
+
+                formatted_answer = self._process_llm_response(answer)
+
+                if isinstance(formatted_answer, list):
+                    tool_results = await self._aexecute_tools_concurrently(
+                        formatted_answer
+                    )
+                    formatted_answer = self._handle_agent_actions(
+                        answer, formatted_answer, tool_results
+                    )
+                elif isinstance(formatted_answer, AgentAction):
+                    tool_result = await self._aexecute_tool_and_check_finality(
+                        formatted_answer
+                    )
+                    formatted_answer = self._handle_agent_action(
+                        formatted_answer, tool_result
+                    )
+
+                self._invoke_step_callback(formatted_answer)
+                self._append_message(formatted_answer.text, role="assistant")
+
+            except OutputParserException as e:
+                formatted_answer = self._handle_output_parser_exception(e)
+
+            except Exception as e:
+                if self._is_context_length_exceeded(e):
+                    await self._ahandle_context_length()
+                    continue
+
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
     def _has_reached_max_iterations(self) -> bool:
         """Check if the maximum number of iterations has been reached."""
         return self.iterations >= self.max_iter
 
+    def _remaining_time(self) -> Optional[float]:
+        """Seconds left of the agent's max_execution_time, None if unbounded."""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def _is_out_of_time(self) -> bool:
+        return self._remaining_time() == 0
+
     def _enforce_rpm_limit(self) -> None:
         """Enforce the requests per minute (RPM) limit if applicable."""
         if self.request_within_rpm_limit:
@@ -160,11 +278,33 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
 
     def _get_llm_response(self) -> str:
         """Call the LLM and return the response, handling any invalid responses."""
+        if self.respect_context_window and not self.context_manager.fits(
+            self.messages
+        ):
+            self._print_compaction_notice()
+            self.messages = self.context_manager.compact(self.messages, self.callbacks)
         answer = self.llm.call(
             self.messages,
             callbacks=self.callbacks,
         )
+        return self._validate_llm_response(answer)
 
+    async def _aget_llm_response(self) -> str:
+        """Await the LLM and return the response, handling any invalid responses."""
+        if self.respect_context_window and not self.context_manager.fits(
+            self.messages
+        ):
+            self._print_compaction_notice()
+            self.messages = await self.context_manager.acompact(
+                self.messages, self.callbacks
+            )
+        answer = await self.llm.acall(
+            self.messages,
+            callbacks=self.callbacks,
+        )
+        return self._validate_llm_response(answer)
+
+    def _validate_llm_response(self, answer: Optional[str]) -> str:
         if not answer:
             self._printer.print(
                 content="Received None or empty response from LLM call.",
@@ -174,18 +314,117 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
 
         return answer
 
-    def _process_llm_response(self, answer: str) -> Union[AgentAction, AgentFinish]:
-        """Process the LLM response and format it into an AgentAction or AgentFinish."""
+    def _process_llm_response(
+        self, answer: str
+    ) -> Union[AgentAction, AgentFinish, List[AgentAction]]:
+        """
+        Process the LLM response and format it into an AgentAction or
+        AgentFinish, or a list of actions to run concurrently.
+        """
+        self.iterations += 1
         if not self.use_stop_words:
             try:
-                # Preliminary parsing to check for errors.
-                self._format_answer(answer)
+                return self._parse_response(answer)
             except OutputParserException as e:
-                if FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE in e.error:
-                    answer = answer.split("Observation:")[0].strip()
+                # Without stop words the LLM may hallucinate the observation
+                # and a final answer after the action: keep only the action.
+                if FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE not in e.error:
+                    raise
+                answer = self._drop_hallucinated_observations(answer)
 
-        self.iterations += 1
-        return self._format_answer(answer)
+        return self._parse_response(answer)
+
+    def _drop_hallucinated_observations(self, answer: str) -> str:
+        """
+        Cut the answer at the first 'Observation:'. With parallel actions, the
+        LLM may have invented an observation between two actions: drop each
+        observation up to the next action instead, and cut after the last one.
+        """
+        segments = answer.split("Observation:")
+        if not self.parallel_actions:
+            return segments[0].strip()
+        kept = segments[0]
+        for segment in segments[1:]:
+            next_action = _ACTION_NAME.search(segment)
+            if next_action is None:
+                break
+            kept += "\n" + segment[next_action.start() :]
+        return kept.strip()
+
+    def _parse_response(
+        self, answer: str
+    ) -> Union[AgentAction, AgentFinish, List[AgentAction]]:
+        if not self.parallel_actions:
+            return self._format_answer(answer)
+        result = CrewAgentParser(agent=self.agent).parse_actions(answer)
+        if isinstance(result, list) and len(result) == 1:
+            return result[0]
+        return result
+
+    def _execute_tools_concurrently(
+        self, agent_actions: List[AgentAction]
+    ) -> List[ToolResult]:
+        """Run the actions of one response on a bounded pool, in order."""
+        with ThreadPoolExecutor(
+            max_workers=min(len(agent_actions), MAX_PARALLEL_ACTIONS)
+        ) as pool:
+            return list(pool.map(self._execute_tool_and_check_finality, agent_actions))
+
+    async def _aexecute_tools_concurrently(
+        self, agent_actions: List[AgentAction]
+    ) -> List[ToolResult]:
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_ACTIONS)
+
+        async def execute(agent_action: AgentAction) -> ToolResult:
+            async with semaphore:
+                return await self._aexecute_tool_and_check_finality(agent_action)
+
+        return list(
+            await asyncio.gather(*(execute(action) for action in agent_actions))
+        )
+
+    def _handle_agent_actions(
+        self,
+        answer: str,
+        agent_actions: List[AgentAction],
+        tool_results: List[ToolResult],
+    ) -> Union[AgentAction, AgentFinish]:
+        """Feed the results of concurrently run actions back as one observation."""
+        add_image_tool = self._i18n.tools("add_image")
+        add_image_name = (
+            add_image_tool.get("name", "").casefold().strip()
+            if isinstance(add_image_tool, dict)
+            else None
+        )
+        observations = []
+        final_result: Optional[ToolResult] = None
+        for agent_action, tool_result in zip(agent_actions, tool_results):
+            if agent_action.tool.casefold().strip() == add_image_name:
+                self.messages.append(tool_result.result)
+                continue
+            if self.step_callback:
+                self.step_callback(tool_result)
+            agent_action.result = tool_result.result
+            observations.append(f"{agent_action.tool}: {tool_result.result}")
+            if tool_result.result_as_answer:
+                final_result = tool_result
+
+        observation = "\n\n".join(observations)
+        text = f"{answer}\nObservation: {observation}"
+        if final_result is not None:
+            return AgentFinish(thought="", output=final_result.result, text=text)
+
+        formatted_answer = AgentAction(
+            thought=agent_actions[0].thought,
+            tool=", ".join(agent_action.tool for agent_action in agent_actions),
+            tool_input="\n".join(
+                agent_action.tool_input for agent_action in agent_actions
+            ),
+            text=text,
+        )
+        formatted_answer.result = observation
+        self._show_logs(formatted_answer)
+        return formatted_answer
 
     def _handle_agent_action(
         self, formatted_answer: AgentAction, tool_result: ToolResult
@@ -303,7 +542,27 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                 )
 
     def _execute_tool_and_check_finality(self, agent_action: AgentAction) -> ToolResult:
-        tool_usage = ToolUsage(
+        tool_usage = self._tool_usage(agent_action)
+        tool_calling = tool_usage.parse_tool_calling(agent_action.text)
+        tool = self._called_tool(tool_calling)
+        if tool is None:
+            return self._tool_calling_error(tool_calling)
+        tool_result = tool_usage.use(tool_calling, agent_action.text)
+        return ToolResult(result=tool_result, result_as_answer=tool.result_as_answer)
+
+    async def _aexecute_tool_and_check_finality(
+        self, agent_action: AgentAction
+    ) -> ToolResult:
+        tool_usage = self._tool_usage(agent_action)
+        tool_calling = await tool_usage.aparse_tool_calling(agent_action.text)
+        tool = self._called_tool(tool_calling)
+        if tool is None:
+            return self._tool_calling_error(tool_calling)
+        tool_result = await tool_usage.ause(tool_calling, agent_action.text)
+        return ToolResult(result=tool_result, result_as_answer=tool.result_as_answer)
+
+    def _tool_usage(self, agent_action: AgentAction) -> ToolUsage:
+        return ToolUsage(
             tools_handler=self.tools_handler,
             tools=self.tools,
             original_tools=self.original_tools,
@@ -313,69 +572,55 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             task=self.task,  # type: ignore[arg-type]
             agent=self.agent,
             action=agent_action,
+            tool_registry=self.tool_registry,
+            parallel_actions=self.parallel_actions,
+            timeout=self._remaining_time(),
         )
-        tool_calling = tool_usage.parse_tool_calling(agent_action.text)
 
+    def _called_tool(self, tool_calling: Any) -> Optional[Any]:
+        if isinstance(tool_calling, ToolUsageErrorException):
+            return None
+        return self.tool_registry.get(tool_calling.tool_name)
+
+    def _tool_calling_error(self, tool_calling: Any) -> ToolResult:
         if isinstance(tool_calling, ToolUsageErrorException):
             tool_result = tool_calling.message
-            return ToolResult(result=tool_result, result_as_answer=False)
         else:
-            if tool_calling.tool_name.casefold().strip() in [
-                name.casefold().strip() for name in self.tool_name_to_tool_map
-            ] or tool_calling.tool_name.casefold().replace("_", " ") in [
-                name.casefold().strip() for name in self.tool_name_to_tool_map
-            ]:
-                tool_result = tool_usage.use(tool_calling, agent_action.text)
-                tool = self.tool_name_to_tool_map.get(tool_calling.tool_name)
-                if tool:
-                    return ToolResult(
-                        result=tool_result, result_as_answer=tool.result_as_answer
-                    )
-            else:
-                tool_result = self._i18n.errors("wrong_tool_name").format(
-                    tool=tool_calling.tool_name,
-                    tools=", ".join([tool.name.casefold() for tool in self.tools]),
-                )
+            error = (
+                "wrong_tool_name_parallel" if self.parallel_actions else "wrong_tool_name"
+            )
+            tool_result = self._i18n.errors(error).format(
+                tool=tool_calling.tool_name,
+                tools=", ".join(self.tool_registry.names),
+            )
         return ToolResult(result=tool_result, result_as_answer=False)
 
     def _summarize_messages(self) -> None:
-        messages_groups = []
-        for message in self.messages:
-            content = message["content"]
-            cut_size = self.llm.get_context_window_size()
-            for i in range(0, len(content), cut_size):
-                messages_groups.append(content[i : i + cut_size])
-
-        summarized_contents = []
-        for group in messages_groups:
-            summary = self.llm.call(
-                [
-                    self._format_msg(
-                        self._i18n.slice("summarizer_system_message"), role="system"
-                    ),
-                    self._format_msg(
-                        self._i18n.slice("summarize_instruction").format(group=group),
-                    ),
-                ],
-                callbacks=self.callbacks,
-            )
-            summarized_contents.append(summary)
-
-        merged_summary = " ".join(str(content) for content in summarized_contents)
+        self.messages = self.context_manager.compact(self.messages, self.callbacks)
 
-        self.messages = [
-            self._format_msg(
-                self._i18n.slice("summary").format(merged_summary=merged_summary)
-            )
-        ]
+    def _print_compaction_notice(self) -> None:
+        self._printer.print(
+            content="Context window almost full. Summarizing older messages to fit the model context window.",
+            color="yellow",
+        )
 
     def _handle_context_length(self) -> None:
+        self._check_context_length_handling()
+        self._summarize_messages()
+
+    async def _ahandle_context_length(self) -> None:
+        self._check_context_length_handling()
+        self.messages = await self.context_manager.acompact(
+            self.messages, self.callbacks
+        )
+
+    def _check_context_length_handling(self) -> None:
+        """Announce the summarization, or stop if the user opted out of it."""
         if self.respect_context_window:
             self._printer.print(
                 content="Context length exceeded. Summarizing content to fit the model context window.",
                 color="yellow",
             )
-            self._summarize_messages()
         else:
             self._printer.print(
                 content="Context length exceeded. Consider using smaller text or RAG tools from crewai_tools.",
@@ -541,8 +786,34 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         Returns:
             The final formatted answer after exceeding max iterations.
         """
+        self._append_force_final_answer(formatted_answer)
+
+        # Perform one more LLM call to get the final answer
+        answer = self.llm.call(
+            self.messages,
+            callbacks=self.callbacks,
+        )
+        answer = self._validate_llm_response(answer)
+
+        # Return the formatted answer, regardless of its type
+        return self._format_answer(answer)
+
+    async def _ahandle_max_iterations_exceeded(self, formatted_answer):
+        """Asynchronous version of `_handle_max_iterations_exceeded`."""
+        self._append_force_final_answer(formatted_answer)
+
+        answer = await self.llm.acall(
+            self.messages,
+            callbacks=self.callbacks,
+        )
+        answer = self._validate_llm_response(answer)
+
+        return self._format_answer(answer)
+
+    def _append_force_final_answer(self, formatted_answer) -> None:
+        limit = "execution time" if self._is_out_of_time() else "iterations"
         self._printer.print(
-            content="Maximum iterations reached. Requesting final answer.",
+            content=f"Maximum {limit} reached. Requesting final answer.",
             color="yellow",
         )
 
@@ -554,20 +825,3 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             assistant_message = self._i18n.errors("force_final_answer")
 
         self.messages.append(self._format_msg(assistant_message, role="assistant"))
-
-        # Perform one more LLM call to get the final answer
-        answer = self.llm.call(
-            self.messages,
-            callbacks=self.callbacks,
-        )
-
-        if answer is None or answer == "":
-            self._printer.print(
-                content="Received None or empty response from LLM call.",
-                color="red",
-            )
-            raise ValueError("Invalid response from LLM call - None or empty.")
-
-        formatted_answer = self._format_answer(answer)
-        # Return the formatted answer, regardless of its type
-        return formatted_answer
@@ -1,5 +1,6 @@
+import json
 import re
-from typing import Any, Union
+from typing import Any, List, Optional, Tuple, Union
 
 from json_repair import repair_json
 
@@ -10,6 +11,10 @@ MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE = "I did it wrong. Invalid Format: I
 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action Input:' after 'Action:'. I will do right next, and don't use a tool I have already used.\n"
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = "I did it wrong. Tried to both perform Action and give a Final Answer at the same time, I must do one or the other"
 
+_ACTION_MARKERS = re.compile(
+    r"(?P<action_input>Action\s*\d*\s*Input\s*\d*\s*:)|(?P<action>Action\s*\d*\s*:)"
+)
+
 
 class AgentAction:
     thought: str
@@ -73,19 +78,16 @@ class CrewAgentParser:
     def parse(self, text: str) -> Union[AgentAction, AgentFinish]:
         thought = self._extract_thought(text)
         includes_answer = FINAL_ANSWER_ACTION in text
-        regex = (
-            r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
-        )
-        action_match = re.search(regex, text, re.DOTALL)
-        if action_match:
+        action_span, input_end, has_action_input = self._scan_action(text)
+        if action_span and input_end is not None:
             if includes_answer:
                 raise OutputParserException(
                     f"{FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE}"
                 )
-            action = action_match.group(1)
+            action = text[action_span[0] : action_span[1]]
             clean_action = self._clean_action(action)
 
-            action_input = action_match.group(2).strip()
+            action_input = text[input_end:].strip()
 
             tool_input = action_input.strip(" ").strip('"')
             safe_tool_input = self._safe_repair_json(tool_input)
@@ -93,17 +95,15 @@ class CrewAgentParser:
             return AgentAction(thought, clean_action, safe_tool_input, text)
 
         elif includes_answer:
-            final_answer = text.split(FINAL_ANSWER_ACTION)[-1].strip()
+            final_answer = text.rpartition(FINAL_ANSWER_ACTION)[2].strip()
             return AgentFinish(thought, final_answer, text)
 
-        if not re.search(r"Action\s*\d*\s*:[\s]*(.*?)", text, re.DOTALL):
+        if not action_span:
             self.agent.increment_formatting_errors()
             raise OutputParserException(
                 f"{MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE}\n{self._i18n.slice('final_answer_format')}",
             )
-        elif not re.search(
-            r"[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)", text, re.DOTALL
-        ):
+        elif not has_action_input:
             self.agent.increment_formatting_errors()
             raise OutputParserException(
                 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE,
@@ -116,11 +116,91 @@ class CrewAgentParser:
                 error,
             )
 
+    def parse_actions(self, text: str) -> Union[List[AgentAction], AgentFinish]:
+        """
+        Parse a response that may hold several Action/Action Input blocks,
+        each input running until the next action. Responses with a single
+        block are parsed exactly like `parse`.
+        """
+        blocks = self._scan_action_blocks(text)
+        if len(blocks) < 2:
+            result = self.parse(text)
+            return result if isinstance(result, AgentFinish) else [result]
+
+        if FINAL_ANSWER_ACTION in text:
+            raise OutputParserException(
+                f"{FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE}"
+            )
+
+        thought = self._extract_thought(text)
+        actions = []
+        for block_start, name_start, name_end, input_start, block_end in blocks:
+            # Drop the thought leading to the next action from the input
+            action_input = text[input_start:block_end].split("\nThought:")[0]
+            tool_input = action_input.strip().strip(" ").strip('"')
+            actions.append(
+                AgentAction(
+                    thought,
+                    self._clean_action(text[name_start:name_end]),
+                    self._safe_repair_json(tool_input),
+                    text[block_start:block_end].strip(),
+                )
+            )
+        return actions
+
+    def _scan_action_blocks(self, text: str) -> List[Tuple[int, int, int, int, int]]:
+        """
+        Offsets of every complete action block: where it starts, where the
+        action name starts and ends, where its input starts and where it ends.
+        """
+        blocks: List[Tuple[int, int, int, int, int]] = []
+        pending: Optional[Tuple[int, int]] = None
+        for marker in _ACTION_MARKERS.finditer(text):
+            if marker.lastgroup == "action":
+                if blocks and blocks[-1][4] == len(text):
+                    # The previous input ends where the next action begins
+                    blocks[-1] = blocks[-1][:4] + (marker.start(),)
+                pending = (marker.start(), marker.end())
+            elif pending is not None:
+                blocks.append(
+                    (pending[0], pending[1], marker.start(), marker.end(), len(text))
+                )
+                pending = None
+        return blocks
+
+    def _scan_action(
+        self, text: str
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[int], bool]:
+        """
+        Find the first 'Action:' and the first 'Action Input:' after it in a
+        single pass over the markers, without backtracking over the text.
+
+        Returns:
+            The span of the action name (None if there is no 'Action:'), the
+            offset where the action input starts (None if no 'Action Input:'
+            follows the action) and whether 'Action Input:' appears at all.
+        """
+        action_start: Optional[int] = None
+        has_action_input = False
+        for marker in _ACTION_MARKERS.finditer(text):
+            if marker.lastgroup == "action_input":
+                has_action_input = True
+                if action_start is not None:
+                    return (action_start, marker.start()), marker.end(), True
+            elif action_start is None:
+                action_start = marker.end()
+        if action_start is None:
+            return None, None, has_action_input
+        return (action_start, len(text)), None, has_action_input
+
     def _extract_thought(self, text: str) -> str:
-        regex = r"(.*?)(?:\n\nAction|\n\nFinal Answer)"
-        thought_match = re.search(regex, text, re.DOTALL)
-        if thought_match:
-            return thought_match.group(1).strip()
+        ends = [
+            index
+            for index in (text.find("\n\nAction"), text.find("\n\nFinal Answer"))
+            if index != -1
+        ]
+        if ends:
+            return text[: min(ends)].strip()
         return ""
 
     def _clean_action(self, text: str) -> str:
@@ -144,8 +224,18 @@ class CrewAgentParser:
 
         tool_input = tool_input.replace('"""', '"')
 
-        result = repair_json(tool_input)
-        if result in UNABLE_TO_REPAIR_JSON_RESULTS:
+        # Valid JSON objects need no repair, which is slow on large inputs
+        if tool_input.startswith("{"):
+            try:
+                if isinstance(json.loads(tool_input), dict):
+                    return tool_input
+            except ValueError:
+                pass
+
+        result = str(repair_json(tool_input))
+        # Only accept repairs that produce an argument object, plain text
+        # inputs would otherwise be turned into arrays or strings
+        if result in UNABLE_TO_REPAIR_JSON_RESULTS or not result.startswith("{"):
             return tool_input
 
-        return str(result)
+        return result
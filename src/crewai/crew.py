@@ -3,9 +3,23 @@ import json
 import re
 import uuid
 import warnings
-from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from hashlib import md5
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from pydantic import (
     UUID4,
@@ -22,6 +36,8 @@ from pydantic_core import PydanticCustomError
 from crewai.agent import Agent
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.cache import CacheHandler
+from crewai.crews.batch import iter_batch
+from crewai.crews.crew_batch_result import CrewBatchResult
 from crewai.crews.crew_output import CrewOutput
 from crewai.knowledge.knowledge import Knowledge
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
@@ -36,8 +52,9 @@ from crewai.tasks.conditional_task import ConditionalTask
 from crewai.tasks.task_output import TaskOutput
 from crewai.telemetry import Telemetry
 from crewai.tools.agent_tools.agent_tools import AgentTools
-from crewai.tools.base_tool import Tool
+from crewai.tools.base_tool import BaseTool, Tool
 from crewai.types.crew_chat import ChatInputs
+from crewai.types.performance_metrics import PerformanceMetrics, PerformanceStats
 from crewai.types.usage_metrics import UsageMetrics
 from crewai.utilities import I18N, FileHandler, Logger, RPMController
 from crewai.utilities.constants import TRAINING_DATA_FILE
@@ -50,6 +67,7 @@ from crewai.utilities.formatter import (
 from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.planning_handler import CrewPlanner
 from crewai.utilities.task_output_storage_handler import TaskOutputStorageHandler
+from crewai.utilities.task_pool import TaskPool
 from crewai.utilities.training_handler import CrewTrainingHandler
 
 try:
@@ -89,9 +107,10 @@ class Crew(BaseModel):
     __hash__ = object.__hash__  # type: ignore
     _execution_span: Any = PrivateAttr()
     _rpm_controller: RPMController = PrivateAttr()
+    _task_pool: TaskPool = PrivateAttr()
     _logger: Logger = PrivateAttr()
     _file_handler: FileHandler = PrivateAttr()
-    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default=CacheHandler())
+    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default_factory=CacheHandler)
     _short_term_memory: Optional[InstanceOf[ShortTermMemory]] = PrivateAttr()
     _long_term_memory: Optional[InstanceOf[LongTermMemory]] = PrivateAttr()
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
@@ -108,9 +127,18 @@ class Crew(BaseModel):
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
+    tool_cache_config: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Settings for the tool result cache: max_entries, max_bytes, ttl, tool_ttls, and persistent with an optional db_path to share results across crews and processes.",
+    )
     tasks: List[Task] = Field(default_factory=list)
     agents: List[BaseAgent] = Field(default_factory=list)
     process: Process = Field(default=Process.sequential)
+    max_parallel_tasks: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of this crew's tasks running at once, for async tasks and the graph process. Defaults to no cap besides the process-wide task executor's size.",
+    )
     verbose: bool = Field(default=False)
     memory: bool = Field(
         default=False,
@@ -144,6 +172,10 @@ class Crew(BaseModel):
         default=None,
         description="Metrics for the LLM usage during all tasks execution.",
     )
+    performance_metrics: Optional[PerformanceMetrics] = Field(
+        default=None,
+        description="Latency metrics for the LLM calls made during all tasks execution.",
+    )
     manager_llm: Optional[Any] = Field(
         description="Language model that will run the agent.", default=None
     )
@@ -241,11 +273,12 @@ class Crew(BaseModel):
     @model_validator(mode="after")
     def set_private_attrs(self) -> "Crew":
         """Set private attributes."""
-        self._cache_handler = CacheHandler()
+        self._cache_handler = CacheHandler(**(self.tool_cache_config or {}))
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+        self._rpm_controller = self._create_rpm_controller()
+        self._task_pool = TaskPool(max_workers=self.max_parallel_tasks)
         if self.function_calling_llm and not isinstance(self.function_calling_llm, LLM):
             self.function_calling_llm = create_llm(self.function_calling_llm)
 
@@ -253,6 +286,11 @@ class Crew(BaseModel):
         self._telemetry.set_tracer()
         return self
 
+    def _create_rpm_controller(self) -> RPMController:
+        return RPMController(
+            max_rpm=self.max_rpm, logger=self._logger, key=f"crew:{self.key}"
+        )
+
     @model_validator(mode="after")
     def create_crew_memory(self) -> "Crew":
         """Set private attributes."""
@@ -335,6 +373,7 @@ class Crew(BaseModel):
 
         if self.config:
             self._setup_from_config()
+            self._rpm_controller = self._create_rpm_controller()
 
         if self.agents:
             for agent in self.agents:
@@ -346,7 +385,7 @@ class Crew(BaseModel):
 
     @model_validator(mode="after")
     def validate_tasks(self):
-        if self.process == Process.sequential:
+        if self.process in (Process.sequential, Process.graph):
             for task in self.tasks:
                 if task.agent is None:
                     raise PydanticCustomError(
@@ -360,6 +399,8 @@ class Crew(BaseModel):
     @model_validator(mode="after")
     def validate_end_with_at_most_one_async_task(self):
         """Validates that the crew ends with at most one asynchronous task."""
+        if self.process == Process.graph:
+            return self
         final_async_task_count = 0
 
         # Traverse tasks backward
@@ -408,6 +449,8 @@ class Crew(BaseModel):
         it cannot include other asynchronous tasks in its context unless
         separated by a synchronous task.
         """
+        if self.process == Process.graph:
+            return self
         for i, task in enumerate(self.tasks):
             if task.async_execution and task.context:
                 for context_task in task.context:
@@ -512,12 +555,60 @@ class Crew(BaseModel):
         self,
         inputs: Optional[Dict[str, Any]] = None,
     ) -> CrewOutput:
+        """Starts the crew to work on its assigned tasks."""
+        self._prepare_kickoff(inputs)
+
+        if self.planning:
+            self._handle_crew_planning()
+
+        if self.process == Process.sequential:
+            result = self._run_sequential_process()
+        elif self.process == Process.hierarchical:
+            result = self._run_hierarchical_process()
+        elif self.process == Process.graph:
+            result = self._run_graph_process()
+        else:
+            raise NotImplementedError(
+                f"The process '{self.process}' is not implemented yet."
+            )
+
+        return self._finalize_kickoff(result)
+
+    async def akickoff(
+        self,
+        inputs: Optional[Dict[str, Any]] = None,
+    ) -> CrewOutput:
+        """Starts the crew as a coroutine, awaiting agents and LLM calls natively.
+
+        Unlike `kickoff_async`, no thread is held for the whole execution, so
+        many crews can run concurrently on a single event loop.
+        """
+        self._prepare_kickoff(inputs)
+
+        if self.planning:
+            await asyncio.to_thread(self._handle_crew_planning)
+
+        if self.process == Process.sequential:
+            result = await self._aexecute_tasks(self.tasks)
+        elif self.process == Process.hierarchical:
+            self._create_manager_agent()
+            result = await self._aexecute_tasks(self.tasks)
+        elif self.process == Process.graph:
+            result = await asyncio.to_thread(self._run_graph_process)
+        else:
+            raise NotImplementedError(
+                f"The process '{self.process}' is not implemented yet."
+            )
+
+        return self._finalize_kickoff(result)
+
+    def _prepare_kickoff(self, inputs: Optional[Dict[str, Any]]) -> None:
+        """Runs the before kickoff callbacks and sets agents and tasks up."""
         for before_callback in self.before_kickoff_callbacks:
             if inputs is None:
                 inputs = {}
             inputs = before_callback(inputs)
 
-        """Starts the crew to work on its assigned tasks."""
         self._execution_span = self._telemetry.crew_execution_span(self, inputs)
         self._task_output_handler.reset()
         self._logging_color = "bold_purple"
@@ -542,24 +633,14 @@ class Crew(BaseModel):
 
             agent.create_agent_executor()
 
-        if self.planning:
-            self._handle_crew_planning()
-
-        metrics: List[UsageMetrics] = []
-
-        if self.process == Process.sequential:
-            result = self._run_sequential_process()
-        elif self.process == Process.hierarchical:
-            result = self._run_hierarchical_process()
-        else:
-            raise NotImplementedError(
-                f"The process '{self.process}' is not implemented yet."
-            )
-
+    def _finalize_kickoff(self, result: CrewOutput) -> CrewOutput:
+        """Runs the after kickoff callbacks and aggregates the usage metrics."""
         for after_callback in self.after_kickoff_callbacks:
             result = after_callback(result)
 
-        metrics += [agent._token_process.get_summary() for agent in self.agents]
+        metrics: List[UsageMetrics] = [
+            agent._token_process.get_summary() for agent in self.agents
+        ]
 
         self.usage_metrics = UsageMetrics()
         for metric in metrics:
@@ -573,6 +654,7 @@ class Crew(BaseModel):
 
         # Initialize the parent crew's usage metrics
         total_usage_metrics = UsageMetrics()
+        performance_stats = PerformanceStats()
 
         for input_data in inputs:
             crew = self.copy()
@@ -581,10 +663,12 @@ class Crew(BaseModel):
 
             if crew.usage_metrics:
                 total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+            performance_stats.merge(crew._performance_stats())
 
             results.append(output)
 
         self.usage_metrics = total_usage_metrics
+        self.performance_metrics = performance_stats.summary()
         self._task_output_handler.reset()
         return results
 
@@ -606,14 +690,155 @@ class Crew(BaseModel):
         results = await asyncio.gather(*tasks)
 
         total_usage_metrics = UsageMetrics()
+        performance_stats = PerformanceStats()
         for crew in crew_copies:
             if crew.usage_metrics:
                 total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+            performance_stats.merge(crew._performance_stats())
 
         self.usage_metrics = total_usage_metrics
+        self.performance_metrics = performance_stats.summary()
         self._task_output_handler.reset()
         return results
 
+    def kickoff_batch(
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        max_concurrency: int = 4,
+        ordered: bool = False,
+    ) -> Iterator[CrewBatchResult]:
+        """Kicks off a copy of the crew per input, with at most `max_concurrency` running.
+
+        Inputs are read and crews copied only as slots free up, so `inputs` may
+        be a lazy iterable. Results are yielded as they finish, or in input
+        order with `ordered`. A failing input yields a result carrying its
+        error instead of stopping the batch. The usage metrics of every input
+        are summed into this crew's `usage_metrics` as results arrive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        performance_stats = PerformanceStats()
+        self.usage_metrics = UsageMetrics()
+
+        pool = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="crewai-batch"
+        )
+        try:
+            for result, crew in iter_batch(
+                lambda index, input_data: pool.submit(
+                    self._kickoff_batch_item, index, input_data
+                ),
+                inputs,
+                max_concurrency,
+                ordered,
+            ):
+                self._add_batch_metrics(crew, performance_stats)
+                yield result
+        finally:
+            pool.shutdown(wait=True)
+            self.performance_metrics = performance_stats.summary()
+            self._task_output_handler.reset()
+
+    async def akickoff_batch(
+        self,
+        inputs: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        max_concurrency: int = 4,
+        ordered: bool = False,
+    ) -> AsyncIterator[CrewBatchResult]:
+        """Asynchronous counterpart of `kickoff_batch`, also accepting an async iterable."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        if isinstance(inputs, AsyncIterable):
+            async_inputs = inputs.__aiter__()
+        else:
+            sync_inputs = iter(inputs)
+
+        async def next_input() -> Optional[Dict[str, Any]]:
+            try:
+                if isinstance(inputs, AsyncIterable):
+                    return await async_inputs.__anext__()
+                return next(sync_inputs)
+            except (StopIteration, StopAsyncIteration):
+                return None
+
+        running: Set[asyncio.Task[Tuple[CrewBatchResult, Optional["Crew"]]]] = set()
+        finished: Dict[int, CrewBatchResult] = {}
+        index = next_index = 0
+        exhausted = False
+        performance_stats = PerformanceStats()
+        self.usage_metrics = UsageMetrics()
+
+        try:
+            while True:
+                while not exhausted and len(running) < max_concurrency:
+                    input_data = await next_input()
+                    if input_data is None:
+                        exhausted = True
+                        break
+                    running.add(
+                        asyncio.create_task(
+                            self._akickoff_batch_item(index, input_data)
+                        )
+                    )
+                    index += 1
+                if not running:
+                    break
+                done, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for completed in done:
+                    result, crew = completed.result()
+                    self._add_batch_metrics(crew, performance_stats)
+                    if ordered:
+                        finished[result.index] = result
+                    else:
+                        yield result
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+        finally:
+            for pending in running:
+                pending.cancel()
+            self.performance_metrics = performance_stats.summary()
+            self._task_output_handler.reset()
+
+    def _kickoff_batch_item(
+        self, index: int, input_data: Dict[str, Any]
+    ) -> Tuple[CrewBatchResult, Optional["Crew"]]:
+        crew: Optional[Crew] = None
+        try:
+            crew = self.copy()
+            # copy() carries this crew's running batch totals over
+            crew.usage_metrics = None
+            output = crew.kickoff(inputs=input_data)
+        except Exception as e:
+            return CrewBatchResult(index=index, inputs=input_data, error=e), crew
+        return CrewBatchResult(index=index, inputs=input_data, output=output), crew
+
+    async def _akickoff_batch_item(
+        self, index: int, input_data: Dict[str, Any]
+    ) -> Tuple[CrewBatchResult, Optional["Crew"]]:
+        crew: Optional[Crew] = None
+        try:
+            crew = self.copy()
+            crew.usage_metrics = None
+            output = await crew.kickoff_async(inputs=input_data)
+        except Exception as e:
+            return CrewBatchResult(index=index, inputs=input_data, error=e), crew
+        return CrewBatchResult(index=index, inputs=input_data, output=output), crew
+
+    def _add_batch_metrics(
+        self, crew: Optional["Crew"], performance_stats: PerformanceStats
+    ) -> None:
+        if crew is None or self.usage_metrics is None:
+            return
+        # A failed kickoff leaves no usage_metrics, but its tokens were spent
+        usage_metrics = crew.usage_metrics or crew.calculate_usage_metrics()
+        self.usage_metrics.add_usage_metrics(usage_metrics)
+        performance_stats.merge(crew._performance_stats())
+
     def _handle_crew_planning(self):
         """Handles the Crew planning."""
         self._logger.log("info", "Planning the crew execution")
@@ -662,6 +887,10 @@ class Crew(BaseModel):
         self._create_manager_agent()
         return self._execute_tasks(self.tasks)
 
+    def _run_graph_process(self) -> CrewOutput:
+        """Executes each task as soon as its dependencies are done and returns the final output."""
+        return self._execute_task_graph(self.tasks)
+
     def _create_manager_agent(self):
         i18n = I18N(prompt_file=self.prompt_file)
         if self.manager_agent is not None:
@@ -749,6 +978,7 @@ class Crew(BaseModel):
                     agent=agent_to_use,
                     context=context,
                     tools=tools_for_task,
+                    pool=self._task_pool,
                 )
                 futures.append((task, future, task_index))
             else:
@@ -771,6 +1001,222 @@ class Crew(BaseModel):
 
         return self._create_crew_output(task_outputs)
 
+    async def _aexecute_tasks(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Asynchronous counterpart of `_execute_tasks`.
+
+        Tasks flagged with `async_execution` are scheduled as asyncio tasks on the
+        running loop instead of being handed to a thread.
+        """
+
+        task_outputs: List[TaskOutput] = []
+        pending: List[Tuple[Task, asyncio.Task[TaskOutput], int]] = []
+        last_sync_output: Optional[TaskOutput] = None
+
+        for task_index, task in enumerate(tasks):
+            if start_index is not None and task_index < start_index:
+                if task.output:
+                    if task.async_execution:
+                        task_outputs.append(task.output)
+                    else:
+                        task_outputs = [task.output]
+                        last_sync_output = task.output
+                continue
+
+            agent_to_use = self._get_agent_to_use(task)
+            if agent_to_use is None:
+                raise ValueError(
+                    f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                )
+
+            tools_for_task = cast(
+                List[BaseTool],
+                self._prepare_tools(
+                    agent_to_use,
+                    task,
+                    cast(List[Tool], task.tools or agent_to_use.tools or []),
+                ),
+            )
+
+            self._log_task_start(task, agent_to_use.role)
+
+            if isinstance(task, ConditionalTask):
+                if pending:
+                    task_outputs = await self._aprocess_async_tasks(
+                        pending, was_replayed
+                    )
+                    pending.clear()
+                skipped_task_output = self._check_conditional_task(
+                    task, task_outputs, task_index, was_replayed
+                )
+                if skipped_task_output:
+                    continue
+
+            if task.async_execution:
+                context = self._get_context(
+                    task, [last_sync_output] if last_sync_output else []
+                )
+                pending.append(
+                    (
+                        task,
+                        asyncio.create_task(
+                            task.aexecute_sync(
+                                agent=agent_to_use,
+                                context=context,
+                                tools=tools_for_task,
+                            )
+                        ),
+                        task_index,
+                    )
+                )
+            else:
+                if pending:
+                    task_outputs = await self._aprocess_async_tasks(
+                        pending, was_replayed
+                    )
+                    pending.clear()
+
+                context = self._get_context(task, task_outputs)
+                task_output = await task.aexecute_sync(
+                    agent=agent_to_use,
+                    context=context,
+                    tools=tools_for_task,
+                )
+                task_outputs = [task_output]
+                self._process_task_result(task, task_output)
+                self._store_execution_log(task, task_output, task_index, was_replayed)
+
+        if pending:
+            task_outputs = await self._aprocess_async_tasks(pending, was_replayed)
+
+        return self._create_crew_output(task_outputs)
+
+    def _task_dependencies(self, tasks: List[Task]) -> List[Set[int]]:
+        """
+        Indices of the tasks each task waits for: the tasks in its `context`,
+        or the previous task when it has none. A conditional task also waits
+        for the previous task, whose output its condition is checked against.
+        """
+        task_indices = {id(task): i for i, task in enumerate(tasks)}
+        dependencies: List[Set[int]] = []
+        for task_index, task in enumerate(tasks):
+            if task.context is None:
+                depends_on = {task_index - 1} if task_index else set()
+            else:
+                depends_on = {
+                    task_indices[id(context_task)]
+                    for context_task in task.context
+                    if id(context_task) in task_indices
+                }
+            if isinstance(task, ConditionalTask) and task_index:
+                depends_on.add(task_index - 1)
+            dependencies.append(depends_on)
+        return dependencies
+
+    def _execute_task_graph(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Executes tasks on the crew's task pool as soon as their dependencies are done.
+
+        Context lists may only point at earlier tasks, so the graph is acyclic
+        and list order is a valid topological order. A task whose agent is
+        busy waits for it, since an agent holds per-run state. The first
+        failure cancels the tasks that have not started and is raised.
+
+        Args:
+            tasks (List[Task]): List of tasks to execute
+            start_index (Optional[int]): Index of the first task to run, when replaying
+            was_replayed (bool): Whether the tasks are being replayed
+
+        Returns:
+            CrewOutput: Final output of the crew
+        """
+        dependencies = self._task_dependencies(tasks)
+        done: Set[int] = set(range(start_index or 0))
+        pending = [i for i in range(len(tasks)) if i not in done]
+        running: Dict[Future[TaskOutput], int] = {}
+        busy_agents: Set[int] = set()
+
+        try:
+            while pending or running:
+                for task_index in list(pending):
+                    task = tasks[task_index]
+                    agent_to_use = self._get_agent_to_use(task)
+                    if agent_to_use is None:
+                        raise ValueError(
+                            f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                        )
+                    if (
+                        not dependencies[task_index] <= done
+                        or id(agent_to_use) in busy_agents
+                    ):
+                        continue
+                    pending.remove(task_index)
+                    tools_for_task = cast(
+                        List[BaseTool],
+                        self._prepare_tools(
+                            agent_to_use,
+                            task,
+                            cast(List[Tool], task.tools or agent_to_use.tools or []),
+                        ),
+                    )
+                    self._log_task_start(task, agent_to_use.role)
+
+                    if isinstance(task, ConditionalTask):
+                        previous_task = tasks[task_index - 1]
+                        if self._skip_conditional_task(
+                            task, previous_task.output, task_index, was_replayed
+                        ):
+                            done.add(task_index)
+                            continue
+
+                    context = self._get_context(
+                        task,
+                        [
+                            cast(TaskOutput, tasks[i].output)
+                            for i in sorted(dependencies[task_index])
+                            if tasks[i].output
+                        ],
+                    )
+                    future = task.execute_async(
+                        agent=agent_to_use,
+                        context=context,
+                        tools=tools_for_task,
+                        pool=self._task_pool,
+                    )
+                    running[future] = task_index
+                    busy_agents.add(id(agent_to_use))
+
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    task_index = running.pop(future)
+                    busy_agents.discard(id(self._get_agent_to_use(tasks[task_index])))
+                    task_output = future.result()
+                    self._process_task_result(tasks[task_index], task_output)
+                    self._store_execution_log(
+                        tasks[task_index], task_output, task_index, was_replayed
+                    )
+                    done.add(task_index)
+        except BaseException:
+            for future in running:
+                future.cancel()
+            raise
+
+        # A skipped final conditional task leaves the previous output as the result
+        final_output = next(
+            (task.output for task in reversed(tasks) if task.output), None
+        )
+        return self._create_crew_output([final_output] if final_output else [])
+
     def _handle_conditional_task(
         self,
         task: ConditionalTask,
@@ -783,7 +1229,29 @@ class Crew(BaseModel):
             task_outputs = self._process_async_tasks(futures, was_replayed)
             futures.clear()
 
+        return self._check_conditional_task(
+            task, task_outputs, task_index, was_replayed
+        )
+
+    def _check_conditional_task(
+        self,
+        task: ConditionalTask,
+        task_outputs: List[TaskOutput],
+        task_index: int,
+        was_replayed: bool,
+    ) -> Optional[TaskOutput]:
         previous_output = task_outputs[task_index - 1] if task_outputs else None
+        return self._skip_conditional_task(
+            task, previous_output, task_index, was_replayed
+        )
+
+    def _skip_conditional_task(
+        self,
+        task: ConditionalTask,
+        previous_output: Optional[TaskOutput],
+        task_index: int,
+        was_replayed: bool,
+    ) -> Optional[TaskOutput]:
         if previous_output is not None and not task.should_execute(previous_output):
             self._logger.log(
                 "debug",
@@ -820,6 +1288,9 @@ class Crew(BaseModel):
         if agent and agent.multimodal:
             tools = self._add_multimodal_tools(agent, tools)
 
+        if agent and getattr(agent, "max_tool_result_size", None):
+            tools = self._add_tool_result_tools(agent, tools)
+
         return tools
 
     def _get_agent_to_use(self, task: Task) -> Optional[BaseAgent]:
@@ -855,6 +1326,10 @@ class Crew(BaseModel):
         multimodal_tools = agent.get_multimodal_tools()
         return self._merge_tools(tools, multimodal_tools)
 
+    def _add_tool_result_tools(self, agent: BaseAgent, tools: List[Tool]):
+        tool_result_tools = agent.get_tool_result_tools()  # type: ignore[attr-defined]
+        return self._merge_tools(tools, tool_result_tools)
+
     def _add_code_execution_tools(self, agent: BaseAgent, tools: List[Tool]):
         code_tools = agent.get_code_execution_tools()
         return self._merge_tools(tools, code_tools)
@@ -913,6 +1388,7 @@ class Crew(BaseModel):
         final_string_output = final_task_output.raw
         self._finish_execution(final_string_output)
         token_usage = self.calculate_usage_metrics()
+        performance_metrics = self.calculate_performance_metrics()
 
         return CrewOutput(
             raw=final_task_output.raw,
@@ -920,6 +1396,7 @@ class Crew(BaseModel):
             json_dict=final_task_output.json_dict,
             tasks_output=[task.output for task in self.tasks if task.output],
             token_usage=token_usage,
+            performance_metrics=performance_metrics,
         )
 
     def _process_async_tasks(
@@ -928,8 +1405,15 @@ class Crew(BaseModel):
         was_replayed: bool = False,
     ) -> List[TaskOutput]:
         task_outputs: List[TaskOutput] = []
-        for future_task, future, task_index in futures:
-            task_output = future.result()
+        for position, (future_task, future, task_index) in enumerate(futures):
+            try:
+                task_output = future.result()
+            except BaseException:
+                # Fail fast: the async tasks that have not started are dropped,
+                # latest first so none of them can start in between
+                for _, pending_future, _ in reversed(futures[position + 1 :]):
+                    pending_future.cancel()
+                raise
             task_outputs.append(task_output)
             self._process_task_result(future_task, task_output)
             self._store_execution_log(
@@ -937,6 +1421,30 @@ class Crew(BaseModel):
             )
         return task_outputs
 
+    async def _aprocess_async_tasks(
+        self,
+        pending: List[Tuple[Task, "asyncio.Task[TaskOutput]", int]],
+        was_replayed: bool = False,
+    ) -> List[TaskOutput]:
+        task_outputs: List[TaskOutput] = []
+        for position, (pending_task, running, task_index) in enumerate(pending):
+            try:
+                task_output = await running
+            except BaseException:
+                # Fail fast like the sync path: cancel the other async tasks
+                # and wait for them, so none is left running unobserved
+                siblings = [sibling for _, sibling, _ in pending[position:]]
+                for sibling in siblings:
+                    sibling.cancel()
+                await asyncio.gather(*siblings, return_exceptions=True)
+                raise
+            task_outputs.append(task_output)
+            self._process_task_result(pending_task, task_output)
+            self._store_execution_log(
+                pending_task, task_output, task_index, was_replayed
+            )
+        return task_outputs
+
     def _find_task_index(
         self, task_id: str, stored_outputs: List[Any]
     ) -> Optional[int]:
@@ -987,6 +1495,8 @@ class Crew(BaseModel):
             self.tasks[i].output = task_output
 
         self._logging_color = "bold_blue"
+        if self.process == Process.graph:
+            return self._execute_task_graph(self.tasks, start_index, True)
         result = self._execute_tasks(self.tasks, start_index, True)
         return result
 
@@ -1063,6 +1573,7 @@ class Crew(BaseModel):
         copied_data.pop("tasks", None)
 
         copied_crew = Crew(**copied_data, agents=cloned_agents, tasks=cloned_tasks)
+        copied_crew._rpm_controller.share_limiter(self._rpm_controller)
 
         return copied_crew
 
@@ -1106,9 +1617,28 @@ class Crew(BaseModel):
         if self.manager_agent and hasattr(self.manager_agent, "_token_process"):
             token_sum = self.manager_agent._token_process.get_summary()
             total_usage_metrics.add_usage_metrics(token_sum)
+        cache_stats = self._cache_handler.stats()
+        total_usage_metrics.tool_cache_hits = cache_stats["hits"]
+        total_usage_metrics.tool_cache_misses = cache_stats["misses"]
+        total_usage_metrics.tool_cache_evictions = cache_stats["evictions"]
         self.usage_metrics = total_usage_metrics
         return total_usage_metrics
 
+    def calculate_performance_metrics(self) -> PerformanceMetrics:
+        """Calculates and returns the LLM latency metrics."""
+        self.performance_metrics = self._performance_stats().summary()
+        return self.performance_metrics
+
+    def _performance_stats(self) -> PerformanceStats:
+        stats = PerformanceStats()
+        agents = list(self.agents)
+        if self.manager_agent:
+            agents.append(self.manager_agent)
+        for agent in agents:
+            if hasattr(agent, "_token_process"):
+                stats.merge(agent._token_process.performance)
+        return stats
+
     def test(
         self,
         n_iterations: int,
@@ -1,3 +1,4 @@
+from .crew_batch_result import CrewBatchResult
 from .crew_output import CrewOutput
 
-__all__ = ["CrewOutput"]
+__all__ = ["CrewBatchResult", "CrewOutput"]
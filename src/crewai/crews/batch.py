@@ -0,0 +1,46 @@
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Set, Tuple
+
+from crewai.crews.crew_batch_result import CrewBatchResult
+
+BatchItem = Tuple[CrewBatchResult, Any]
+
+
+def iter_batch(
+    submit: Callable[[int, Dict[str, Any]], "Future[BatchItem]"],
+    inputs: Iterable[Dict[str, Any]],
+    max_in_flight: int,
+    ordered: bool = False,
+) -> Iterator[BatchItem]:
+    """
+    Submit `(index, input)` pairs with at most `max_in_flight` unfinished,
+    reading `inputs` only as slots free up. Yields what each future returns,
+    a result and whatever the caller attached to it, in completion order or,
+    with `ordered`, in input order.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    pending_inputs = enumerate(inputs)
+    running: Set["Future[BatchItem]"] = set()
+    finished: Dict[int, BatchItem] = {}
+    next_index = 0
+
+    while True:
+        while len(running) < max_in_flight:
+            item = next(pending_inputs, None)
+            if item is None:
+                break
+            running.add(submit(*item))
+        if not running:
+            break
+        done, running = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            batch_item = future.result()
+            if ordered:
+                finished[batch_item[0].index] = batch_item
+            else:
+                yield batch_item
+        while next_index in finished:
+            yield finished.pop(next_index)
+            next_index += 1
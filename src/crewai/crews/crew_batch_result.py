@@ -0,0 +1,24 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from crewai.crews.crew_output import CrewOutput
+
+
+class CrewBatchResult(BaseModel):
+    """Outcome of one input of a batch kickoff: its output, or the error it raised."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(description="Position of the input in the batch")
+    inputs: Dict[str, Any] = Field(description="Inputs the crew was kicked off with")
+    output: Optional[CrewOutput] = Field(
+        description="Output of the crew, if it finished", default=None
+    )
+    error: Optional[Exception] = Field(
+        description="Exception the crew raised, if it failed", default=None
+    )
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from crewai.tasks.output_format import OutputFormat
 from crewai.tasks.task_output import TaskOutput
+from crewai.types.performance_metrics import PerformanceMetrics
 from crewai.types.usage_metrics import UsageMetrics
 
 
@@ -22,6 +23,9 @@ class CrewOutput(BaseModel):
         description="Output of each task", default=[]
     )
     token_usage: UsageMetrics = Field(description="Processed token summary", default={})
+    performance_metrics: Optional[PerformanceMetrics] = Field(
+        description="LLM latency summary", default=None
+    )
 
     @property
     def json(self) -> Optional[str]:
@@ -0,0 +1,440 @@
+import importlib
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from crewai.agent import Agent
+from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.crew import Crew
+from crewai.llm import LLM, HedgingPolicy
+from crewai.task import Task
+from crewai.tasks.conditional_task import ConditionalTask
+from crewai.tools.base_tool import BaseTool, Tool, tool
+from crewai.utilities.llm_response_cache import LLMResponseCache
+
+# Constructor arguments of LLM that are plain data. Credentials are left out:
+# workers read them from the environment, like any other process would.
+LLM_SPEC_FIELDS = (
+    "timeout",
+    "temperature",
+    "top_p",
+    "n",
+    "stop",
+    "max_completion_tokens",
+    "max_tokens",
+    "presence_penalty",
+    "frequency_penalty",
+    "logit_bias",
+    "response_format",
+    "seed",
+    "logprobs",
+    "top_logprobs",
+    "base_url",
+    "api_version",
+    "max_rpm",
+    "max_tpm",
+    "stream",
+)
+HEDGING_POLICY_SPEC_FIELDS = (
+    "percentile",
+    "initial_delay",
+    "min_delay",
+    "max_delay",
+    "min_samples",
+    "window",
+)
+RESPONSE_CACHE_SPEC_FIELDS = ("db_path", "ttl", "max_entries")
+AGENT_SPEC_FIELDS = {
+    "allow_delegation",
+    "allow_code_execution",
+    "cache",
+    "code_execution_mode",
+    "embedder_config",
+    "max_execution_time",
+    "max_iter",
+    "max_retry_limit",
+    "max_rpm",
+    "max_tokens",
+    "max_tool_result_size",
+    "multimodal",
+    "parallel_actions",
+    "prompt_template",
+    "respect_context_window",
+    "response_template",
+    "stable_prompt_prefix",
+    "system_template",
+    "use_system_prompt",
+    "verbose",
+}
+TASK_SPEC_FIELDS = {
+    "async_execution",
+    "human_input",
+    "max_retries",
+    "name",
+    "output_file",
+}
+CREW_SPEC_FIELDS = {
+    "cache",
+    "embedder",
+    "max_parallel_tasks",
+    "max_rpm",
+    "memory",
+    "memory_config",
+    "name",
+    "output_log_file",
+    "planning",
+    "process",
+    "prompt_file",
+    "share_crew",
+    "tool_cache_config",
+    "verbose",
+}
+
+
+def import_path(obj: Any) -> str:
+    """Return the `module:qualname` path `obj` can be imported back from."""
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        raise ValueError(
+            f"{obj!r} cannot be imported by path. Define it at module level."
+        )
+    return f"{module}:{qualname}"
+
+
+def load_import_path(path: str) -> Any:
+    module_name, _, qualname = path.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def _optional_path(obj: Any) -> Optional[str]:
+    return import_path(obj) if obj is not None else None
+
+
+def _optional_import(path: Optional[str]) -> Any:
+    return load_import_path(path) if path is not None else None
+
+
+def _reject_unsupported(obj: Any, fields: List[str]) -> None:
+    for field in fields:
+        if getattr(obj, field, None):
+            raise ValueError(
+                f"{type(obj).__name__}.{field} cannot be serialized in a spec."
+            )
+
+
+TOOL_SPEC_FIELDS = {"max_concurrency", "result_as_answer", "timeout"}
+
+
+class ToolSpec(BaseModel):
+    """Serializable definition of a tool: where to import it and how it was named."""
+
+    path: str
+    name: str
+    description: str
+    settings: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_tool(cls, crew_tool: BaseTool, tool_paths: Dict[str, str]) -> "ToolSpec":
+        if crew_tool.name in tool_paths:
+            path = tool_paths[crew_tool.name]
+        elif isinstance(crew_tool, Tool):
+            # @tool replaces the function with the Tool under the same name
+            path = import_path(crew_tool.func)
+        else:
+            path = import_path(type(crew_tool))
+        return cls(
+            path=path,
+            name=crew_tool.name,
+            description=crew_tool.description,
+            settings=crew_tool.model_dump(include=TOOL_SPEC_FIELDS, mode="json"),
+        )
+
+    def build(self) -> BaseTool:
+        obj = load_import_path(self.path)
+        if isinstance(obj, BaseTool):
+            return obj
+        if isinstance(obj, type) and issubclass(obj, BaseTool):
+            # Tool classes set their name and description as field defaults
+            built = obj(**self.settings)  # type: ignore[call-arg]
+        elif callable(obj):
+            built = (
+                tool(obj)
+                if obj.__doc__
+                else Tool(name=self.name, description="", func=obj)
+            )
+            for field, value in self.settings.items():
+                setattr(built, field, value)
+        else:
+            raise ValueError(f"'{self.path}' is not a tool.")
+        # Show agents the same name and description as in the original crew
+        built.name = self.name
+        built.description = self.description
+        return built
+
+
+def _llm_spec(llm: Any) -> Optional[Dict[str, Any]]:
+    if llm is None:
+        return None
+    if isinstance(llm, str):
+        return {"model": llm}
+    if not isinstance(llm, LLM):
+        raise ValueError(f"Only crewai LLMs can be serialized, got {type(llm)}.")
+    _reject_unsupported(llm, ["callbacks"])
+    spec: Dict[str, Any] = {"model": llm.model}
+    spec.update(
+        (field, getattr(llm, field))
+        for field in LLM_SPEC_FIELDS
+        if getattr(llm, field, None) is not None
+    )
+    if llm.stream_callback is not None:
+        spec["stream_callback"] = import_path(llm.stream_callback)
+    if llm.hedging_policy is not None:
+        spec["hedging_policy"] = {
+            field: getattr(llm.hedging_policy, field)
+            for field in HEDGING_POLICY_SPEC_FIELDS
+        }
+    if llm.response_cache is not None:
+        spec["response_cache"] = {
+            field: getattr(llm.response_cache, field)
+            for field in RESPONSE_CACHE_SPEC_FIELDS
+        }
+    if llm.fallbacks:
+        spec["fallbacks"] = [_llm_spec(fallback) for fallback in llm.fallbacks]
+    return spec
+
+
+def _build_llm(spec: Optional[Dict[str, Any]]) -> Optional[LLM]:
+    if spec is None:
+        return None
+    params = dict(spec)
+    if "stream_callback" in params:
+        params["stream_callback"] = load_import_path(params["stream_callback"])
+    if "hedging_policy" in params:
+        params["hedging_policy"] = HedgingPolicy(**params["hedging_policy"])
+    if "response_cache" in params:
+        params["response_cache"] = LLMResponseCache(**params["response_cache"])
+    if "fallbacks" in params:
+        params["fallbacks"] = [_build_llm(fallback) for fallback in params["fallbacks"]]
+    return LLM(**params)
+
+
+class AgentSpec(BaseModel):
+    """Serializable definition of an agent."""
+
+    role: str
+    goal: str
+    backstory: str
+    llm: Optional[Dict[str, Any]] = None
+    function_calling_llm: Optional[Dict[str, Any]] = None
+    tools: List[ToolSpec] = Field(default_factory=list)
+    step_callback: Optional[str] = None
+    settings: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_agent(cls, agent: Agent, tool_paths: Dict[str, str]) -> "AgentSpec":
+        _reject_unsupported(agent, ["knowledge_sources"])
+        return cls(
+            role=agent._original_role or agent.role,
+            goal=agent._original_goal or agent.goal,
+            backstory=agent._original_backstory or agent.backstory,
+            llm=_llm_spec(agent.llm),
+            function_calling_llm=_llm_spec(agent.function_calling_llm),
+            tools=[
+                ToolSpec.from_tool(agent_tool, tool_paths)
+                for agent_tool in agent.tools or []
+            ],
+            step_callback=_optional_path(agent.step_callback),
+            settings=agent.model_dump(include=AGENT_SPEC_FIELDS, mode="json"),
+        )
+
+    def build(self) -> Agent:
+        return Agent(
+            role=self.role,
+            goal=self.goal,
+            backstory=self.backstory,
+            llm=_build_llm(self.llm),
+            function_calling_llm=_build_llm(self.function_calling_llm),
+            tools=[tool_spec.build() for tool_spec in self.tools],
+            step_callback=_optional_import(self.step_callback),
+            **self.settings,
+        )
+
+
+class TaskSpec(BaseModel):
+    """Serializable definition of a task. Agents and context are crew indices."""
+
+    description: str
+    expected_output: str
+    agent: Optional[int] = None
+    context: Optional[List[int]] = None
+    tools: List[ToolSpec] = Field(default_factory=list)
+    output_json: Optional[str] = None
+    output_pydantic: Optional[str] = None
+    callback: Optional[str] = None
+    guardrail: Optional[str] = None
+    converter_cls: Optional[str] = None
+    condition: Optional[str] = None
+    settings: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_task(
+        cls, task: Task, crew: Crew, tool_paths: Dict[str, str]
+    ) -> "TaskSpec":
+        return cls(
+            description=task._original_description or task.description,
+            expected_output=task._original_expected_output or task.expected_output,
+            agent=crew.agents.index(task.agent) if task.agent else None,
+            context=(
+                [crew.tasks.index(context_task) for context_task in task.context]
+                if task.context is not None
+                else None
+            ),
+            tools=[
+                ToolSpec.from_tool(task_tool, tool_paths)
+                for task_tool in task.tools or []
+            ],
+            output_json=_optional_path(task.output_json),
+            output_pydantic=_optional_path(task.output_pydantic),
+            callback=_optional_path(task.callback),
+            guardrail=_optional_path(task.guardrail),
+            converter_cls=_optional_path(task.converter_cls),
+            condition=(
+                import_path(task.condition)
+                if isinstance(task, ConditionalTask)
+                else None
+            ),
+            settings=task.model_dump(include=TASK_SPEC_FIELDS, mode="json"),
+        )
+
+    def build(self, agents: List[BaseAgent], tasks: List[Task]) -> Task:
+        params: Dict[str, Any] = dict(
+            description=self.description,
+            expected_output=self.expected_output,
+            agent=agents[self.agent] if self.agent is not None else None,
+            context=(
+                [tasks[index] for index in self.context]
+                if self.context is not None
+                else None
+            ),
+            tools=[tool_spec.build() for tool_spec in self.tools],
+            output_json=_optional_import(self.output_json),
+            output_pydantic=_optional_import(self.output_pydantic),
+            callback=_optional_import(self.callback),
+            guardrail=_optional_import(self.guardrail),
+            converter_cls=_optional_import(self.converter_cls),
+            **self.settings,
+        )
+        if self.condition is not None:
+            return ConditionalTask(condition=load_import_path(self.condition), **params)
+        return Task(**params)
+
+
+class CrewSpec(BaseModel):
+    """
+    Serializable definition of a crew, to rebuild it in another process.
+
+    Tools, output models, callbacks, guardrails and conditions are stored by
+    import path, so they must be defined at module level. Settings a spec
+    cannot carry, such as knowledge sources, custom memory instances or LLM
+    callbacks, raise a ValueError instead of being dropped. A tool is rebuilt from its
+    path: a tool instance is used as is, while a tool class or a plain
+    function is rebuilt with the tool's original name and description.
+    Pass `tool_paths` to point a tool's name at a configured instance
+    instead.
+    """
+
+    agents: List[AgentSpec]
+    tasks: List[TaskSpec]
+    manager_llm: Optional[Dict[str, Any]] = None
+    manager_agent: Optional[AgentSpec] = None
+    planning_llm: Optional[Dict[str, Any]] = None
+    function_calling_llm: Optional[Dict[str, Any]] = None
+    step_callback: Optional[str] = None
+    task_callback: Optional[str] = None
+    before_kickoff_callbacks: List[str] = Field(default_factory=list)
+    after_kickoff_callbacks: List[str] = Field(default_factory=list)
+    settings: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_crew(
+        cls, crew: Crew, tool_paths: Optional[Dict[str, str]] = None
+    ) -> "CrewSpec":
+        tool_paths = tool_paths or {}
+        _reject_unsupported(
+            crew,
+            [
+                "knowledge_sources",
+                "short_term_memory",
+                "long_term_memory",
+                "entity_memory",
+                "user_memory",
+            ],
+        )
+        # The manager a hierarchical crew builds from manager_llm carries the
+        # delegation tools, while a custom manager_agent must have none
+        manager_agent = crew.manager_agent
+        if manager_agent is not None and manager_agent.tools:
+            manager_agent = None
+        for agent in [*crew.agents, manager_agent]:
+            if agent is not None and not isinstance(agent, Agent):
+                raise ValueError(
+                    f"Only crewai Agents can be serialized, got {type(agent)}."
+                )
+        return cls(
+            agents=[
+                AgentSpec.from_agent(agent, tool_paths)  # type: ignore[arg-type]
+                for agent in crew.agents
+            ],
+            tasks=[TaskSpec.from_task(task, crew, tool_paths) for task in crew.tasks],
+            manager_llm=_llm_spec(crew.manager_llm),
+            manager_agent=(
+                AgentSpec.from_agent(manager_agent, tool_paths)  # type: ignore[arg-type]
+                if manager_agent is not None
+                else None
+            ),
+            planning_llm=_llm_spec(crew.planning_llm),
+            function_calling_llm=_llm_spec(crew.function_calling_llm),
+            step_callback=_optional_path(crew.step_callback),
+            task_callback=_optional_path(crew.task_callback),
+            before_kickoff_callbacks=[
+                import_path(callback) for callback in crew.before_kickoff_callbacks
+            ],
+            after_kickoff_callbacks=[
+                import_path(callback) for callback in crew.after_kickoff_callbacks
+            ],
+            settings=crew.model_dump(
+                include=CREW_SPEC_FIELDS, mode="json", exclude_none=True
+            ),
+        )
+
+    def build(self) -> Crew:
+        agents: List[BaseAgent] = [agent.build() for agent in self.agents]
+        tasks: List[Task] = []
+        for task in self.tasks:
+            tasks.append(task.build(agents, tasks))
+        params: Dict[str, Any] = dict(self.settings)
+        for name in ("manager_llm", "planning_llm", "function_calling_llm"):
+            llm = _build_llm(getattr(self, name))
+            if llm is not None:
+                params[name] = llm
+        for name in ("step_callback", "task_callback"):
+            callback = _optional_import(getattr(self, name))
+            if callback is not None:
+                params[name] = callback
+        if self.manager_agent is not None:
+            params["manager_agent"] = self.manager_agent.build()
+        return Crew(
+            agents=agents,
+            tasks=tasks,
+            before_kickoff_callbacks=[
+                load_import_path(path) for path in self.before_kickoff_callbacks
+            ],
+            after_kickoff_callbacks=[
+                load_import_path(path) for path in self.after_kickoff_callbacks
+            ],
+            **params,
+        )
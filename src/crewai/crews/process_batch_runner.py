@@ -0,0 +1,150 @@
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from crewai.crew import Crew
+from crewai.crews.batch import iter_batch
+from crewai.crews.crew_batch_result import CrewBatchResult
+from crewai.crews.crew_spec import CrewSpec
+from crewai.types.performance_metrics import PerformanceMetrics, PerformanceStats
+from crewai.types.usage_metrics import UsageMetrics
+
+WorkerResult = Tuple[CrewBatchResult, Tuple[UsageMetrics, PerformanceStats]]
+
+# Crew each worker process rebuilds once from the spec and copies per input
+_worker_crew: Optional[Crew] = None
+
+
+def _init_worker(spec_json: str) -> None:
+    global _worker_crew
+    _worker_crew = CrewSpec.model_validate_json(spec_json).build()
+
+
+def _picklable_error(error: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+    return error
+
+
+def _run_input(index: int, input_data: Dict[str, Any]) -> WorkerResult:
+    if _worker_crew is None:
+        raise RuntimeError("Worker was started without a crew spec.")
+    crew: Optional[Crew] = None
+    try:
+        crew = _worker_crew.copy()
+        result = CrewBatchResult(
+            index=index, inputs=input_data, output=crew.kickoff(inputs=input_data)
+        )
+    except Exception as e:
+        result = CrewBatchResult(
+            index=index, inputs=input_data, error=_picklable_error(e)
+        )
+    if crew is None:
+        return result, (UsageMetrics(), PerformanceStats())
+    # A failed kickoff leaves no usage_metrics, but its tokens were spent
+    usage_metrics = crew.usage_metrics or crew.calculate_usage_metrics()
+    return result, (usage_metrics, crew._performance_stats())
+
+
+class ProcessBatchRunner:
+    """
+    Runs batch kickoffs of one crew across worker processes.
+
+    Thread-based batches share one interpreter, so the CPU-bound parts of a
+    run (knowledge parsing, output conversion, validation) contend for the
+    GIL. Each worker here rebuilds the crew once from a `CrewSpec` and
+    reuses it for every input it receives; results and usage metrics come
+    back through the pool. Credentials are not part of the spec, so workers
+    read them from the environment.
+
+    Use it as a context manager, or call `close` when done, to stop the
+    workers.
+    """
+
+    def __init__(
+        self,
+        spec: CrewSpec,
+        processes: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> None:
+        if processes is not None and processes < 1:
+            raise ValueError("processes must be at least 1")
+        self.spec = spec
+        self.processes = processes or os.cpu_count() or 1
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+        self.usage_metrics: Optional[UsageMetrics] = None
+        self.performance_metrics: Optional[PerformanceMetrics] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def from_crew(
+        cls,
+        crew: Crew,
+        processes: Optional[int] = None,
+        tool_paths: Optional[Dict[str, str]] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> "ProcessBatchRunner":
+        return cls(
+            CrewSpec.from_crew(crew, tool_paths=tool_paths),
+            processes=processes,
+            mp_context=mp_context,
+        )
+
+    def kickoff_batch(
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        ordered: bool = False,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[CrewBatchResult]:
+        """Kicks off the crew once per input on the worker processes.
+
+        Like `Crew.kickoff_batch`, inputs are read lazily, results are yielded
+        as they finish or in input order with `ordered`, and a failing input
+        yields a result carrying its error. At most `max_pending` inputs,
+        twice the number of processes by default, are sent ahead so workers
+        never wait on the parent. Usage metrics of every input are summed
+        into `usage_metrics`.
+        """
+        executor = self._get_executor()
+        performance_stats = PerformanceStats()
+        self.usage_metrics = UsageMetrics()
+        try:
+            for result, (usage_metrics, stats) in iter_batch(
+                lambda index, input_data: executor.submit(
+                    _run_input, index, input_data
+                ),
+                inputs,
+                max_pending or 2 * self.processes,
+                ordered,
+            ):
+                self.usage_metrics.add_usage_metrics(usage_metrics)
+                performance_stats.merge(stats)
+                yield result
+        finally:
+            self.performance_metrics = performance_stats.summary()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=(self.spec.model_dump_json(),),
+            )
+        return self._executor
+
+    def __enter__(self) -> "ProcessBatchRunner":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -1,24 +1,51 @@
+import asyncio
+import inspect
 import json
 import logging
+import math
 import os
 import sys
 import threading
+import time
 import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Union, cast
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from dotenv import load_dotenv
 
 with warnings.catch_warnings():
     warnings.simplefilter("ignore", UserWarning)
     import litellm
-    from litellm import Choices, get_supported_openai_params
+    from litellm import Choices
     from litellm.types.utils import ModelResponse
 
 
+from crewai.utilities.asyncio_utils import run_awaitable
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
+from crewai.utilities.llm_response_cache import LLMResponseCache
+from crewai.utilities.model_capabilities import (
+    ModelCapabilities,
+    ModelCapabilityRegistry,
+)
+from crewai.utilities.rate_limiter import RateLimiter, get_rate_limiter
 
 load_dotenv()
 
@@ -45,6 +72,147 @@ class FilteredStream:
             return self._original_stream.flush()
 
 
+class StreamStopDetector:
+    """
+    Incrementally scans streamed text for stop words.
+
+    Text is only released once it can no longer be the start of a stop word,
+    so partial markers such as "Observ" never reach the consumer. Each chunk
+    is matched against the tail of the buffer only, keeping the scan linear in
+    the length of the completion.
+    """
+
+    def __init__(self, stop_words: List[str]):
+        self.stop_words = [word for word in stop_words if word]
+        self._holdback = max((len(word) for word in self.stop_words), default=1) - 1
+        self._buffer = ""
+        self._released = 0
+        self.stopped = False
+
+    @property
+    def text(self) -> str:
+        return self._buffer
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk and return the text that is now safe to release."""
+        if self.stopped:
+            return ""
+
+        search_start = max(0, len(self._buffer) - self._holdback)
+        self._buffer += chunk
+
+        stop_index = -1
+        for word in self.stop_words:
+            index = self._buffer.find(word, search_start)
+            if index != -1 and (stop_index == -1 or index < stop_index):
+                stop_index = index
+
+        if stop_index != -1:
+            self.stopped = True
+            self._buffer = self._buffer[:stop_index]
+            return self.flush()
+
+        safe_end = len(self._buffer) - self._holdback
+        if safe_end <= self._released:
+            return ""
+        released = self._buffer[self._released : safe_end]
+        self._released = safe_end
+        return released
+
+    def flush(self) -> str:
+        """Release whatever is still held back."""
+        released = self._buffer[self._released :]
+        self._released = len(self._buffer)
+        return released
+
+
+class LLMCallTimer:
+    """Wall-clock timing of a single provider request."""
+
+    def __init__(self) -> None:
+        self.start_time = datetime.now()
+        self.end_time: Optional[datetime] = None
+        self._started = time.perf_counter()
+        self._first_token_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+        # Fallback attempts after a failure, and duplicates sent to cut latency
+        self.retries = 0
+        self.hedges = 0
+
+    def mark_first_token(self) -> None:
+        if self._first_token_at is None:
+            self._first_token_at = time.perf_counter()
+
+    def stop(self) -> None:
+        self.end_time = datetime.now()
+        self._stopped_at = time.perf_counter()
+
+    @property
+    def latency(self) -> float:
+        return (self._stopped_at or time.perf_counter()) - self._started
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        if self._first_token_at is None:
+            return None
+        return self._first_token_at - self._started
+
+
+def is_failover_error(error: BaseException) -> bool:
+    """Whether a failed request should be retried on the next fallback model."""
+    if isinstance(error, (litellm.Timeout, litellm.APIConnectionError)):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and status_code >= 500
+
+
+class HedgingPolicy:
+    """
+    Decides when a slow LLM request gets a duplicate (hedged) request.
+
+    The delay is the given percentile of the latencies recently observed for
+    the model, clamped to [min_delay, max_delay]; until `min_samples`
+    latencies are known, `initial_delay` is used instead.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        initial_delay: float = 10.0,
+        min_delay: float = 0.5,
+        max_delay: Optional[float] = None,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, latency: float) -> None:
+        with self._lock:
+            self._latencies.setdefault(model, deque(maxlen=self.window)).append(
+                latency
+            )
+
+    def delay(self, model: str) -> float:
+        with self._lock:
+            latencies = sorted(self._latencies.get(model, ()))
+        if len(latencies) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            rank = max(1, math.ceil(self.percentile / 100 * len(latencies)))
+            delay = latencies[rank - 1]
+        delay = max(delay, self.min_delay)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+
 LLM_CONTEXT_WINDOW_SIZES = {
     # openai
     "gpt-4": 8192,
@@ -91,8 +259,20 @@ LLM_CONTEXT_WINDOW_SIZES = {
 }
 
 DEFAULT_CONTEXT_WINDOW_SIZE = 8192
+MAX_PARALLEL_TOOL_CALLS = 8
+# Completion params tied to one provider, not passed on to string fallbacks
+PROVIDER_CONNECTION_PARAMS = frozenset(
+    {"api_key", "api_base", "base_url", "api_version"}
+)
+# Follow-up turns to allow while the model keeps requesting tools
+MAX_TOOL_CALL_ROUNDS = 10
 CONTEXT_WINDOW_USAGE_RATIO = 0.75
 
+# Process-wide capability lookups, shared by every LLM instance
+MODEL_CAPABILITIES = ModelCapabilityRegistry(
+    LLM_CONTEXT_WINDOW_SIZES, DEFAULT_CONTEXT_WINDOW_SIZE
+)
+
 
 @contextmanager
 def suppress_warnings():
@@ -136,6 +316,13 @@ class LLM:
         api_version: Optional[str] = None,
         api_key: Optional[str] = None,
         callbacks: List[Any] = [],
+        stream: bool = False,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        max_rpm: Optional[int] = None,
+        max_tpm: Optional[int] = None,
+        fallbacks: Optional[List[Union[str, "LLM"]]] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
     ):
         self.model = model
         self.timeout = timeout
@@ -156,6 +343,18 @@ class LLM:
         self.api_version = api_version
         self.api_key = api_key
         self.callbacks = callbacks
+        self.stream = stream
+        self.stream_callback = stream_callback
+        self.response_cache = response_cache
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self.fallbacks = fallbacks or []
+        self.hedging_policy = hedging_policy
+        self._rate_limiter: Optional[RateLimiter] = (
+            get_rate_limiter(f"llm:{model}", max_rpm=max_rpm, max_tpm=max_tpm)
+            if max_rpm or max_tpm
+            else None
+        )
         self.context_window_size = 0
 
         litellm.drop_params = True
@@ -174,124 +373,756 @@ class LLM:
         High-level call method that:
           1) Calls litellm.completion
           2) Checks for function/tool calls
-          3) If a tool call is found:
-               a) executes the function
-               b) returns the result
-          4) If no tool call, returns the text response
+          3) If tool calls are found:
+               a) executes every requested function, concurrently when
+                  there are several
+               b) sends all results back to the model in one follow-up
+                  turn, repeating while the model keeps requesting tools
+          4) Returns the model's final text response
+
+        When `stream` is enabled and no tools are passed, the completion is
+        consumed chunk by chunk through `stream_tokens` instead, and cut at
+        the first stop word.
+
+        With a `response_cache`, tool-less calls are served from the cache
+        when an identical request was answered before.
 
         :param messages: The conversation messages
         :param tools: Optional list of function schemas for function calling
         :param callbacks: Optional list of callbacks
         :param available_functions: A dictionary mapping function_name -> actual Python function
-        :return: Final text response from the LLM or the tool result
+        :return: Final text response from the LLM
         """
         with suppress_warnings():
             if callbacks and len(callbacks) > 0:
                 self.set_callbacks(callbacks)
 
             try:
-                # --- 1) Make the completion call
-                params = {
-                    "model": self.model,
-                    "messages": messages,
-                    "timeout": self.timeout,
-                    "temperature": self.temperature,
-                    "top_p": self.top_p,
-                    "n": self.n,
-                    "stop": self.stop,
-                    "max_tokens": self.max_tokens or self.max_completion_tokens,
-                    "presence_penalty": self.presence_penalty,
-                    "frequency_penalty": self.frequency_penalty,
-                    "logit_bias": self.logit_bias,
-                    "response_format": self.response_format,
-                    "seed": self.seed,
-                    "logprobs": self.logprobs,
-                    "top_logprobs": self.top_logprobs,
-                    "api_base": self.base_url,
-                    "api_version": self.api_version,
-                    "api_key": self.api_key,
-                    "stream": False,
-                    "tools": tools,  # pass the tool schema
-                }
+                if self.response_cache is not None and not tools:
+                    return self._cached_call(
+                        messages,
+                        callbacks,
+                        lambda: self._complete(
+                            messages, tools, callbacks, available_functions
+                        ),
+                    )
+                return self._complete(messages, tools, callbacks, available_functions)
 
-                params = {k: v for k, v in params.items() if v is not None}
-
-                response = litellm.completion(**params)
-                response_message = cast(Choices, cast(ModelResponse, response).choices)[
-                    0
-                ].message
-                text_response = response_message.content or ""
-                tool_calls = getattr(response_message, "tool_calls", [])
-                
-                # Ensure callbacks get the full response object with usage info
-                if callbacks and len(callbacks) > 0:
-                    for callback in callbacks:
-                        if hasattr(callback, "log_success_event"):
-                            usage_info = getattr(response, "usage", None)
-                            if usage_info:
-                                callback.log_success_event(
-                                    kwargs=params,
-                                    response_obj={"usage": usage_info},
-                                    start_time=0,
-                                    end_time=0,
-                                )
-
-                # --- 2) If no tool calls, return the text response
-                if not tool_calls or not available_functions:
-                    return text_response
-
-                # --- 3) Handle the tool call
-                tool_call = tool_calls[0]
-                function_name = tool_call.function.name
-
-                if function_name in available_functions:
-                    try:
-                        function_args = json.loads(tool_call.function.arguments)
-                    except json.JSONDecodeError as e:
-                        logging.warning(f"Failed to parse function arguments: {e}")
-                        return text_response
-
-                    fn = available_functions[function_name]
-                    try:
-                        # Call the actual tool function
-                        result = fn(**function_args)
-
-                        return result
-
-                    except Exception as e:
-                        logging.error(
-                            f"Error executing function '{function_name}': {e}"
-                        )
-                        return text_response
+            except Exception as e:
+                self._log_call_error(e)
+                raise
+
+    def _complete(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[dict]],
+        callbacks: Optional[List[Any]],
+        available_functions: Optional[Dict[str, Any]],
+        tool_rounds: int = 0,
+    ) -> str:
+        # --- 1) Make the completion call
+        if self.stream and not tools:
+            return "".join(self.stream_tokens(messages, callbacks))
+
+        params = self._prepare_completion_params(messages, tools)
+        self._wait_for_rate_limit()
+        timer = LLMCallTimer()
+        try:
+            response = self._send_completion(params, timer)
+        except Exception as e:
+            self._report_llm_call(callbacks, timer, e)
+            raise
+        timer.stop()
+        self._report_llm_call(callbacks, timer)
+        self._record_rate_limit_usage(getattr(response, "usage", None))
+        text_response, tool_calls = self._handle_completion_response(
+            response, params, callbacks, available_functions, timer
+        )
+        if not tool_calls:
+            return text_response
+        if tool_rounds >= MAX_TOOL_CALL_ROUNDS:
+            logging.warning(
+                f"Model still requested tools after {MAX_TOOL_CALL_ROUNDS} rounds"
+            )
+            return text_response
 
-                else:
-                    logging.warning(
-                        f"Tool call requested unknown function '{function_name}'"
+        # --- 3) Run every tool call, concurrently when there are several,
+        # and send all results back to the model in a single follow-up turn
+        functions = cast(Dict[str, Any], available_functions)
+        if len(tool_calls) == 1:
+            results = [self._run_tool_call(tool_calls[0], functions)]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(tool_calls), MAX_PARALLEL_TOOL_CALLS)
+            ) as pool:
+                results = list(
+                    pool.map(
+                        lambda tool_call: self._run_tool_call(tool_call, functions),
+                        tool_calls,
                     )
-                    return text_response
+                )
+        return self._complete(
+            self._append_tool_results(messages, text_response, tool_calls, results),
+            tools,
+            callbacks,
+            available_functions,
+            tool_rounds + 1,
+        )
+
+    async def acall(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Asynchronous counterpart of `call`, built on litellm.acompletion.
+
+        Coroutine functions in `available_functions` are awaited, while regular
+        functions run in a thread, so a single event loop can drive many
+        concurrent LLM calls without holding an OS thread per request.
+
+        :param messages: The conversation messages
+        :param tools: Optional list of function schemas for function calling
+        :param callbacks: Optional list of callbacks
+        :param available_functions: A dictionary mapping function_name -> actual Python function
+        :return: Final text response from the LLM
+        """
+        with suppress_warnings():
+            if callbacks and len(callbacks) > 0:
+                self.set_callbacks(callbacks)
+
+            try:
+                if self.response_cache is not None and not tools:
+                    return await self._acached_call(
+                        messages,
+                        callbacks,
+                        lambda: self._acomplete(
+                            messages, tools, callbacks, available_functions
+                        ),
+                    )
+                return await self._acomplete(
+                    messages, tools, callbacks, available_functions
+                )
 
             except Exception as e:
-                if not LLMContextLengthExceededException(
-                    str(e)
-                )._is_context_limit_error(str(e)):
-                    logging.error(f"LiteLLM call failed: {str(e)}")
+                self._log_call_error(e)
                 raise
 
-    def supports_function_calling(self) -> bool:
+    async def _acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[dict]],
+        callbacks: Optional[List[Any]],
+        available_functions: Optional[Dict[str, Any]],
+        tool_rounds: int = 0,
+    ) -> str:
+        if self.stream and not tools:
+            return "".join(
+                [token async for token in self.astream_tokens(messages, callbacks)]
+            )
+
+        params = self._prepare_completion_params(messages, tools)
+        await self._await_rate_limit()
+        timer = LLMCallTimer()
         try:
-            params = get_supported_openai_params(model=self.model)
-            return "response_format" in params
+            response = await self._asend_completion(params, timer)
         except Exception as e:
-            logging.error(f"Failed to get supported params: {str(e)}")
-            return False
+            self._report_llm_call(callbacks, timer, e)
+            raise
+        timer.stop()
+        self._report_llm_call(callbacks, timer)
+        self._record_rate_limit_usage(getattr(response, "usage", None))
+        text_response, tool_calls = self._handle_completion_response(
+            response, params, callbacks, available_functions, timer
+        )
+        if not tool_calls:
+            return text_response
+        if tool_rounds >= MAX_TOOL_CALL_ROUNDS:
+            logging.warning(
+                f"Model still requested tools after {MAX_TOOL_CALL_ROUNDS} rounds"
+            )
+            return text_response
 
-    def supports_stop_words(self) -> bool:
+        functions = cast(Dict[str, Any], available_functions)
+        results = await asyncio.gather(
+            *[self._arun_tool_call(tool_call, functions) for tool_call in tool_calls]
+        )
+        return await self._acomplete(
+            self._append_tool_results(messages, text_response, tool_calls, results),
+            tools,
+            callbacks,
+            available_functions,
+            tool_rounds + 1,
+        )
+
+    def _cached_call(
+        self,
+        messages: List[Dict[str, str]],
+        callbacks: Optional[List[Any]],
+        compute: Callable[[], str],
+    ) -> str:
+        cache = cast(LLMResponseCache, self.response_cache)
+        key = cache.make_key(self._prepare_completion_params(messages))
+        response, hit, evictions = cache.get_or_compute(key, compute)
+        self._report_cache_event(callbacks, hit, evictions)
+        return response
+
+    async def _acached_call(
+        self,
+        messages: List[Dict[str, str]],
+        callbacks: Optional[List[Any]],
+        compute: Callable[[], Awaitable[str]],
+    ) -> str:
+        cache = cast(LLMResponseCache, self.response_cache)
+        key = cache.make_key(self._prepare_completion_params(messages))
+        response, hit, evictions = await cache.aget_or_compute(key, compute)
+        self._report_cache_event(callbacks, hit, evictions)
+        return response
+
+    @staticmethod
+    def _report_cache_event(
+        callbacks: Optional[List[Any]], hit: bool, evictions: int
+    ) -> None:
+        for callback in callbacks or []:
+            if hasattr(callback, "log_llm_cache_event"):
+                callback.log_llm_cache_event(hit=hit, evictions=evictions)
+
+    def _prepare_completion_params(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[dict]] = None,
+    ) -> Dict[str, Any]:
+        """Build the keyword arguments for a litellm completion request."""
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "timeout": self.timeout,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "n": self.n,
+            "stop": self.stop,
+            "max_tokens": self.max_tokens or self.max_completion_tokens,
+            "presence_penalty": self.presence_penalty,
+            "frequency_penalty": self.frequency_penalty,
+            "logit_bias": self.logit_bias,
+            "response_format": self.response_format,
+            "seed": self.seed,
+            "logprobs": self.logprobs,
+            "top_logprobs": self.top_logprobs,
+            "api_base": self.base_url,
+            "api_version": self.api_version,
+            "api_key": self.api_key,
+            "stream": False,
+            "tools": tools,  # pass the tool schema
+        }
+
+        return {k: v for k, v in params.items() if v is not None}
+
+    def _handle_completion_response(
+        self,
+        response: Any,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]],
+        available_functions: Optional[Dict[str, Any]],
+        timer: Optional[LLMCallTimer] = None,
+    ) -> Tuple[str, List[Any]]:
+        """
+        Report usage to the callbacks and collect the tool calls, if any.
+
+        Tool calls are only returned when `available_functions` were given.
+        """
+        response_message = cast(Choices, cast(ModelResponse, response).choices)[
+            0
+        ].message
+        text_response = response_message.content or ""
+        tool_calls = getattr(response_message, "tool_calls", [])
+
+        # Ensure callbacks get the full response object with usage info
+        if callbacks and len(callbacks) > 0:
+            for callback in callbacks:
+                if hasattr(callback, "log_success_event"):
+                    usage_info = getattr(response, "usage", None)
+                    if usage_info:
+                        callback.log_success_event(
+                            kwargs=params,
+                            response_obj={"usage": usage_info},
+                            start_time=timer.start_time if timer else 0,
+                            end_time=timer.end_time if timer else 0,
+                        )
+
+        # --- 2) If no tool calls, return the text response
+        if not tool_calls or not available_functions:
+            return text_response, []
+
+        return text_response, list(tool_calls)
+
+    @staticmethod
+    def _resolve_tool_call(
+        tool_call: Any, available_functions: Dict[str, Any]
+    ) -> Optional[Tuple[str, Any, Dict[str, Any]]]:
+        """Map a tool call to `(name, function, arguments)`, or None if invalid."""
+        function_name = tool_call.function.name
+
+        if function_name not in available_functions:
+            logging.warning(f"Tool call requested unknown function '{function_name}'")
+            return None
+
+        try:
+            function_args = json.loads(tool_call.function.arguments)
+        except json.JSONDecodeError as e:
+            logging.warning(f"Failed to parse function arguments: {e}")
+            return None
+
+        return function_name, available_functions[function_name], function_args
+
+    def _run_tool_call(self, tool_call: Any, available_functions: Dict[str, Any]) -> str:
+        resolved = self._resolve_tool_call(tool_call, available_functions)
+        if resolved is None:
+            return f"Error: could not call function '{tool_call.function.name}'"
+        function_name, fn, function_args = resolved
         try:
-            params = get_supported_openai_params(model=self.model)
-            return "stop" in params
+            result = fn(**function_args)
+            if inspect.isawaitable(result):
+                result = run_awaitable(result)
+            return str(result)
         except Exception as e:
-            logging.error(f"Failed to get supported params: {str(e)}")
-            return False
+            logging.error(f"Error executing function '{function_name}': {e}")
+            return f"Error executing function '{function_name}': {e}"
+
+    async def _arun_tool_call(
+        self, tool_call: Any, available_functions: Dict[str, Any]
+    ) -> str:
+        resolved = self._resolve_tool_call(tool_call, available_functions)
+        if resolved is None:
+            return f"Error: could not call function '{tool_call.function.name}'"
+        function_name, fn, function_args = resolved
+        try:
+            if inspect.iscoroutinefunction(fn):
+                result = await fn(**function_args)
+            else:
+                result = await asyncio.to_thread(fn, **function_args)
+                if inspect.isawaitable(result):
+                    result = await result
+            return str(result)
+        except Exception as e:
+            logging.error(f"Error executing function '{function_name}': {e}")
+            return f"Error executing function '{function_name}': {e}"
+
+    @staticmethod
+    def _append_tool_results(
+        messages: List[Dict[str, Any]],
+        text_response: str,
+        tool_calls: List[Any],
+        results: List[str],
+    ) -> List[Dict[str, Any]]:
+        """Return a copy of `messages` with the tool calls and their results."""
+        assistant_message = {
+            "role": "assistant",
+            "content": text_response or None,
+            "tool_calls": [
+                {
+                    "id": tool_call.id,
+                    "type": "function",
+                    "function": {
+                        "name": tool_call.function.name,
+                        "arguments": tool_call.function.arguments,
+                    },
+                }
+                for tool_call in tool_calls
+            ],
+        }
+        tool_messages = [
+            {
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "name": tool_call.function.name,
+                "content": result,
+            }
+            for tool_call, result in zip(tool_calls, results)
+        ]
+        return [*messages, assistant_message, *tool_messages]
+
+    def stream_tokens(
+        self,
+        messages: List[Dict[str, str]],
+        callbacks: Optional[List[Any]] = None,
+    ) -> Iterator[str]:
+        """
+        Stream the completion as partial tokens.
+
+        Stop words are detected client-side, so the stream is abandoned as soon
+        as one shows up (e.g. "\nObservation:" right after an Action Input),
+        even for providers that ignore the `stop` parameter. Every released
+        token is also passed to `stream_callback`, if set.
+        """
+        params = self._prepare_stream_params(messages)
+        detector = StreamStopDetector(self._stop_words())
+        usage = None
+        self._wait_for_rate_limit()
+        timer = LLMCallTimer()
+        try:
+            response = self._send_completion(params, timer, hedge=False)
+        except Exception as e:
+            self._report_llm_call(callbacks, timer, e)
+            raise
+        try:
+            for chunk in response:
+                usage = getattr(chunk, "usage", None) or usage
+                content = self._chunk_content(chunk)
+                if content:
+                    timer.mark_first_token()
+                token = detector.feed(content)
+                if token:
+                    yield self._emit_token(token)
+                if detector.stopped:
+                    break
+            token = detector.flush()
+            if token:
+                yield self._emit_token(token)
+        except Exception as e:
+            self._report_llm_call(callbacks, timer, e)
+            raise
+        finally:
+            self._close_stream(response)
+        timer.stop()
+        self._report_llm_call(callbacks, timer)
+        self._record_rate_limit_usage(usage)
+        self._report_stream_usage(params, callbacks, usage, detector.text, timer)
+
+    async def astream_tokens(
+        self,
+        messages: List[Dict[str, str]],
+        callbacks: Optional[List[Any]] = None,
+    ) -> AsyncIterator[str]:
+        """Asynchronous counterpart of `stream_tokens`."""
+        params = self._prepare_stream_params(messages)
+        detector = StreamStopDetector(self._stop_words())
+        usage = None
+        await self._await_rate_limit()
+        timer = LLMCallTimer()
+        try:
+            response = await self._asend_completion(params, timer, hedge=False)
+        except Exception as e:
+            self._report_llm_call(callbacks, timer, e)
+            raise
+        try:
+            async for chunk in response:
+                usage = getattr(chunk, "usage", None) or usage
+                content = self._chunk_content(chunk)
+                if content:
+                    timer.mark_first_token()
+                token = detector.feed(content)
+                if token:
+                    yield self._emit_token(token)
+                if detector.stopped:
+                    break
+            token = detector.flush()
+            if token:
+                yield self._emit_token(token)
+        except Exception as e:
+            self._report_llm_call(callbacks, timer, e)
+            raise
+        finally:
+            close_result = self._close_stream(response)
+            if inspect.isawaitable(close_result):
+                await close_result
+        timer.stop()
+        self._report_llm_call(callbacks, timer)
+        self._record_rate_limit_usage(usage)
+        self._report_stream_usage(params, callbacks, usage, detector.text, timer)
+
+    def _completion_attempts(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Request params for this model followed by each fallback, in order."""
+        attempts = [params]
+        for fallback in self.fallbacks:
+            if isinstance(fallback, LLM):
+                fallback_params = fallback._prepare_completion_params(
+                    params["messages"], params.get("tools")
+                )
+                fallback_params["stream"] = params["stream"]
+                if "stream_options" in params:
+                    fallback_params["stream_options"] = params["stream_options"]
+            else:
+                # The primary's credentials and endpoint belong to its provider
+                fallback_params = {
+                    key: value
+                    for key, value in params.items()
+                    if key not in PROVIDER_CONNECTION_PARAMS
+                }
+                fallback_params["model"] = fallback
+            attempts.append(fallback_params)
+        return attempts
+
+    def _send_completion(
+        self, params: Dict[str, Any], timer: LLMCallTimer, hedge: bool = True
+    ) -> Any:
+        """
+        Send a completion request, failing over to the next fallback model
+        on 5xx or timeout errors and hedging slow requests if a policy is set.
+        """
+        attempts = self._completion_attempts(params)
+        if hedge and self.hedging_policy is not None:
+            return self._hedged_completion(attempts, timer)
+
+        for index, attempt in enumerate(attempts):
+            try:
+                return self._timed_completion(attempt)
+            except Exception as e:
+                if index == len(attempts) - 1 or not is_failover_error(e):
+                    raise
+                timer.retries += 1
+                logging.warning(
+                    f"LLM call to '{attempt['model']}' failed, falling back: {e}"
+                )
+
+    async def _asend_completion(
+        self, params: Dict[str, Any], timer: LLMCallTimer, hedge: bool = True
+    ) -> Any:
+        """Asynchronous counterpart of `_send_completion`."""
+        attempts = self._completion_attempts(params)
+        if hedge and self.hedging_policy is not None:
+            return await self._ahedged_completion(attempts, timer)
+
+        for index, attempt in enumerate(attempts):
+            try:
+                return await self._atimed_completion(attempt)
+            except Exception as e:
+                if index == len(attempts) - 1 or not is_failover_error(e):
+                    raise
+                timer.retries += 1
+                logging.warning(
+                    f"LLM call to '{attempt['model']}' failed, falling back: {e}"
+                )
+
+    def _timed_completion(self, params: Dict[str, Any]) -> Any:
+        started = time.perf_counter()
+        response = litellm.completion(**params)
+        if self.hedging_policy is not None:
+            self.hedging_policy.record(params["model"], time.perf_counter() - started)
+        return response
+
+    async def _atimed_completion(self, params: Dict[str, Any]) -> Any:
+        started = time.perf_counter()
+        response = await litellm.acompletion(**params)
+        if self.hedging_policy is not None:
+            self.hedging_policy.record(params["model"], time.perf_counter() - started)
+        return response
+
+    def _hedged_completion(
+        self, attempts: List[Dict[str, Any]], timer: LLMCallTimer
+    ) -> Any:
+        """
+        Fire the request and, if it is still running after the policy's delay,
+        a duplicate to the next fallback (or the same model). The first
+        successful response wins; failed requests move on to the next attempt.
+
+        A request already running in a thread cannot be cancelled: the losing
+        request runs to completion in the background and is still billed by
+        the provider. `acall` cancels the losing request instead.
+        """
+        policy = cast(HedgingPolicy, self.hedging_policy)
+        pool = ThreadPoolExecutor(max_workers=len(attempts) + 1)
+        try:
+            pending = {pool.submit(self._timed_completion, attempts[0])}
+            next_attempt = 1
+            hedged = False
+            last_error: Optional[BaseException] = None
+            while pending:
+                timeout = None if hedged else policy.delay(attempts[0]["model"])
+                done, pending = wait(
+                    pending, timeout=timeout, return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    # Still waiting: hedge with a duplicate request
+                    hedged = True
+                    target = attempts[min(next_attempt, len(attempts) - 1)]
+                    next_attempt += 1
+                    timer.hedges += 1
+                    pending.add(pool.submit(self._timed_completion, target))
+                    continue
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        for loser in pending:
+                            loser.cancel()
+                        return future.result()
+                    last_error = error
+                    if is_failover_error(error) and next_attempt < len(attempts):
+                        timer.retries += 1
+                        pending.add(
+                            pool.submit(self._timed_completion, attempts[next_attempt])
+                        )
+                        next_attempt += 1
+            raise cast(BaseException, last_error)
+        finally:
+            pool.shutdown(wait=False)
+
+    async def _ahedged_completion(
+        self, attempts: List[Dict[str, Any]], timer: LLMCallTimer
+    ) -> Any:
+        """Asynchronous counterpart of `_hedged_completion` that cancels the loser."""
+        policy = cast(HedgingPolicy, self.hedging_policy)
+        pending = {asyncio.ensure_future(self._atimed_completion(attempts[0]))}
+        next_attempt = 1
+        hedged = False
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                timeout = None if hedged else policy.delay(attempts[0]["model"])
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedged = True
+                    target = attempts[min(next_attempt, len(attempts) - 1)]
+                    next_attempt += 1
+                    timer.hedges += 1
+                    pending.add(asyncio.ensure_future(self._atimed_completion(target)))
+                    continue
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    last_error = error
+                    if is_failover_error(error) and next_attempt < len(attempts):
+                        timer.retries += 1
+                        pending.add(
+                            asyncio.ensure_future(
+                                self._atimed_completion(attempts[next_attempt])
+                            )
+                        )
+                        next_attempt += 1
+            raise cast(BaseException, last_error)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _report_llm_call(
+        self,
+        callbacks: Optional[List[Any]],
+        timer: LLMCallTimer,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Pass the timing of a provider request to the callbacks that track it."""
+        for callback in callbacks or []:
+            if hasattr(callback, "log_llm_call"):
+                callback.log_llm_call(
+                    model=self.model,
+                    latency=timer.latency,
+                    time_to_first_token=timer.time_to_first_token,
+                    retries=timer.retries,
+                    hedges=timer.hedges,
+                    error=str(error) if error else None,
+                )
+
+    def _wait_for_rate_limit(self) -> None:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+    async def _await_rate_limit(self) -> None:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.aacquire()
+
+    def _record_rate_limit_usage(self, usage: Any) -> None:
+        if self._rate_limiter is not None and usage:
+            self._rate_limiter.record_tokens(getattr(usage, "total_tokens", 0) or 0)
+
+    def _prepare_stream_params(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        params = self._prepare_completion_params(messages)
+        params["stream"] = True
+        params["stream_options"] = {"include_usage": True}
+        return params
+
+    def _stop_words(self) -> List[str]:
+        if not self.stop:
+            return []
+        if isinstance(self.stop, str):
+            return [self.stop]
+        return list(self.stop)
+
+    @staticmethod
+    def _chunk_content(chunk: Any) -> str:
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            return ""
+        delta = getattr(choices[0], "delta", None)
+        return getattr(delta, "content", None) or ""
+
+    def _emit_token(self, token: str) -> str:
+        if self.stream_callback:
+            try:
+                self.stream_callback(token)
+            except Exception as e:
+                logging.warning(f"Stream callback failed: {e}")
+        return token
+
+    @staticmethod
+    def _close_stream(response: Any) -> Any:
+        """Close the underlying HTTP stream so the provider stops generating."""
+        for stream in (getattr(response, "completion_stream", None), response):
+            close = getattr(stream, "close", None) or getattr(stream, "aclose", None)
+            if callable(close):
+                try:
+                    return close()
+                except Exception:
+                    return None
+        return None
+
+    def _report_stream_usage(
+        self,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]],
+        usage: Any,
+        completion_text: str,
+        timer: Optional[LLMCallTimer] = None,
+    ) -> None:
+        """
+        Report usage for a streamed call. Streams cut at a stop word never
+        receive the final usage chunk, so usage is counted locally instead.
+        """
+        if not callbacks:
+            return
+        if not usage:
+            try:
+                prompt_tokens = litellm.token_counter(
+                    model=self.model, messages=params["messages"]
+                )
+                completion_tokens = litellm.token_counter(
+                    model=self.model, text=completion_text
+                )
+            except Exception as e:
+                logging.warning(f"Failed to count streamed tokens: {e}")
+                return
+            usage = litellm.Usage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            )
+        for callback in callbacks:
+            if hasattr(callback, "log_success_event"):
+                callback.log_success_event(
+                    kwargs=params,
+                    response_obj={"usage": usage},
+                    start_time=timer.start_time if timer else 0,
+                    end_time=timer.end_time if timer else 0,
+                )
+
+    def _log_call_error(self, error: Exception) -> None:
+        if not LLMContextLengthExceededException(
+            str(error)
+        )._is_context_limit_error(str(error)):
+            logging.error(f"LiteLLM call failed: {str(error)}")
+
+    def capabilities(self) -> ModelCapabilities:
+        return MODEL_CAPABILITIES.get(self.model)
+
+    def supports_function_calling(self) -> bool:
+        return self.capabilities().supports_function_calling
+
+    def supports_stop_words(self) -> bool:
+        return self.capabilities().supports_stop_words
 
     def get_context_window_size(self) -> int:
         """
@@ -302,11 +1133,8 @@ class LLM:
             return self.context_window_size
 
         self.context_window_size = int(
-            DEFAULT_CONTEXT_WINDOW_SIZE * CONTEXT_WINDOW_USAGE_RATIO
+            self.capabilities().context_window * CONTEXT_WINDOW_USAGE_RATIO
         )
-        for key, value in LLM_CONTEXT_WINDOW_SIZES.items():
-            if self.model.startswith(key):
-                self.context_window_size = int(value * CONTEXT_WINDOW_USAGE_RATIO)
         return self.context_window_size
 
     def set_callbacks(self, callbacks: List[Any]):
@@ -8,4 +8,6 @@ class Process(str, Enum):
 
     sequential = "sequential"
     hierarchical = "hierarchical"
+    # Runs every task as soon as the tasks in its context have finished
+    graph = "graph"
     # TODO: consensual = 'consensual'
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import inspect
 import json
@@ -42,6 +43,7 @@ from crewai.utilities.config import process_config
 from crewai.utilities.converter import Converter, convert_to_model
 from crewai.utilities.i18n import I18N
 from crewai.utilities.printer import Printer
+from crewai.utilities.task_pool import TaskPool, get_task_pool
 
 
 class Task(BaseModel):
@@ -320,34 +322,88 @@ class Task(BaseModel):
         agent: BaseAgent | None = None,
         context: Optional[str] = None,
         tools: Optional[List[BaseTool]] = None,
+        pool: Optional[TaskPool] = None,
     ) -> Future[TaskOutput]:
-        """Execute the task asynchronously."""
-        future: Future[TaskOutput] = Future()
-        threading.Thread(
-            daemon=True,
-            target=self._execute_task_async,
-            args=(agent, context, tools, future),
-        ).start()
-        return future
-
-    def _execute_task_async(
+        """Execute the task asynchronously on `pool`, or the process-wide one.
+
+        The returned future receives the task output, or the exception the
+        task raised, and can be cancelled until the task starts.
+        """
+        return (pool or get_task_pool()).submit(
+            self._execute_core, agent, context, tools
+        )
+
+    async def aexecute_sync(
+        self,
+        agent: Optional[BaseAgent] = None,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> TaskOutput:
+        """Execute the task as a coroutine, awaiting the agent natively."""
+        return await self._aexecute_core(agent, context, tools)
+
+    def _execute_core(
         self,
         agent: Optional[BaseAgent],
         context: Optional[str],
         tools: Optional[List[Any]],
-        future: Future[TaskOutput],
-    ) -> None:
-        """Execute the task asynchronously with context handling."""
-        result = self._execute_core(agent, context, tools)
-        future.set_result(result)
+    ) -> TaskOutput:
+        """Run the core execution logic of the task."""
+        agent = self._start_execution(agent, context)
+        tools = tools or self.tools or []
 
-    def _execute_core(
+        result = agent.execute_task(
+            task=self,
+            context=context,
+            tools=tools,
+        )
+
+        task_output = self._build_task_output(agent, result)
+        file_content = self._file_content(task_output)
+
+        if self.guardrail:
+            guardrail_result = GuardrailResult.from_tuple(self.guardrail(task_output))
+            if not guardrail_result.success:
+                context = self._guardrail_retry_context(guardrail_result, task_output)
+                return self._execute_core(agent, context, tools)
+            task_output = self._apply_guardrail_result(guardrail_result, task_output)
+
+        return self._complete_execution(agent, task_output, file_content)
+
+    async def _aexecute_core(
         self,
         agent: Optional[BaseAgent],
         context: Optional[str],
         tools: Optional[List[Any]],
     ) -> TaskOutput:
-        """Run the core execution logic of the task."""
+        """Run the core execution logic of the task as a coroutine."""
+        agent = self._start_execution(agent, context)
+        tools = tools or self.tools or []
+
+        result = await agent.aexecute_task(
+            task=self,
+            context=context,
+            tools=tools,
+        )
+
+        # Output conversion may call the LLM synchronously.
+        task_output = await asyncio.to_thread(self._build_task_output, agent, result)
+        file_content = self._file_content(task_output)
+
+        if self.guardrail:
+            guardrail_result = GuardrailResult.from_tuple(self.guardrail(task_output))
+            if not guardrail_result.success:
+                context = self._guardrail_retry_context(guardrail_result, task_output)
+                return await self._aexecute_core(agent, context, tools)
+            task_output = await asyncio.to_thread(
+                self._apply_guardrail_result, guardrail_result, task_output
+            )
+
+        return self._complete_execution(agent, task_output, file_content)
+
+    def _start_execution(
+        self, agent: Optional[BaseAgent], context: Optional[str]
+    ) -> BaseAgent:
         agent = agent or self.agent
         self.agent = agent
         if not agent:
@@ -359,18 +415,25 @@ class Task(BaseModel):
         self._execution_span = self._telemetry.task_started(crew=agent.crew, task=self)
 
         self.prompt_context = context
-        tools = tools or self.tools or []
-
         self.processed_by_agents.add(agent.role)
-
-        result = agent.execute_task(
-            task=self,
-            context=context,
-            tools=tools,
+        return agent
+
+    @staticmethod
+    def _file_content(task_output: TaskOutput) -> Any:
+        """What `output_file` receives: the agent's output, before any guardrail."""
+        return (
+            task_output.json_dict
+            if task_output.json_dict
+            else (
+                task_output.pydantic.model_dump_json()
+                if task_output.pydantic
+                else task_output.raw
+            )
         )
 
+    def _build_task_output(self, agent: BaseAgent, result: str) -> TaskOutput:
         pydantic_output, json_output = self._export_output(result)
-        task_output = TaskOutput(
+        return TaskOutput(
             name=self.name,
             description=self.description,
             expected_output=self.expected_output,
@@ -381,42 +444,49 @@ class Task(BaseModel):
             output_format=self._get_output_format(),
         )
 
-        if self.guardrail:
-            guardrail_result = GuardrailResult.from_tuple(self.guardrail(task_output))
-            if not guardrail_result.success:
-                if self.retry_count >= self.max_retries:
-                    raise Exception(
-                        f"Task failed guardrail validation after {self.max_retries} retries. "
-                        f"Last error: {guardrail_result.error}"
-                    )
+    def _guardrail_retry_context(
+        self, guardrail_result: GuardrailResult, task_output: TaskOutput
+    ) -> str:
+        if self.retry_count >= self.max_retries:
+            raise Exception(
+                f"Task failed guardrail validation after {self.max_retries} retries. "
+                f"Last error: {guardrail_result.error}"
+            )
 
-                self.retry_count += 1
-                context = self.i18n.errors("validation_error").format(
-                    guardrail_result_error=guardrail_result.error,
-                    task_output=task_output.raw,
-                )
-                printer = Printer()
-                printer.print(
-                    content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
-                    color="yellow",
-                )
-                return self._execute_core(agent, context, tools)
+        self.retry_count += 1
+        context = self.i18n.errors("validation_error").format(
+            guardrail_result_error=guardrail_result.error,
+            task_output=task_output.raw,
+        )
+        printer = Printer()
+        printer.print(
+            content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
+            color="yellow",
+        )
+        return context
 
-            if guardrail_result.result is None:
-                raise Exception(
-                    "Task guardrail returned None as result. This is not allowed."
-                )
+    def _apply_guardrail_result(
+        self, guardrail_result: GuardrailResult, task_output: TaskOutput
+    ) -> TaskOutput:
+        if guardrail_result.result is None:
+            raise Exception(
+                "Task guardrail returned None as result. This is not allowed."
+            )
 
-            if isinstance(guardrail_result.result, str):
-                task_output.raw = guardrail_result.result
-                pydantic_output, json_output = self._export_output(
-                    guardrail_result.result
-                )
-                task_output.pydantic = pydantic_output
-                task_output.json_dict = json_output
-            elif isinstance(guardrail_result.result, TaskOutput):
-                task_output = guardrail_result.result
+        if isinstance(guardrail_result.result, str):
+            task_output.raw = guardrail_result.result
+            pydantic_output, json_output = self._export_output(
+                guardrail_result.result
+            )
+            task_output.pydantic = pydantic_output
+            task_output.json_dict = json_output
+        elif isinstance(guardrail_result.result, TaskOutput):
+            task_output = guardrail_result.result
+        return task_output
 
+    def _complete_execution(
+        self, agent: BaseAgent, task_output: TaskOutput, file_content: Any
+    ) -> TaskOutput:
         self.output = task_output
         self.end_time = datetime.datetime.now()
 
@@ -428,12 +498,7 @@ class Task(BaseModel):
             self._execution_span = None
 
         if self.output_file:
-            content = (
-                json_output
-                if json_output
-                else pydantic_output.model_dump_json() if pydantic_output else result
-            )
-            self._save_file(content)
+            self._save_file(file_content)
 
         return task_output
 
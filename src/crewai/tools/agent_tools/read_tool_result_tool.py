@@ -0,0 +1,33 @@
+from pydantic import BaseModel, Field
+
+from crewai.tools.base_tool import BaseTool
+from crewai.utilities import I18N
+from crewai.utilities.tool_result_store import get_tool_result_store
+
+i18n = I18N()
+
+
+class ReadToolResultToolSchema(BaseModel):
+    handle: str = Field(..., description="The handle of the stored result")
+    offset: int = Field(default=0, description="Byte offset to start reading at")
+    length: int = Field(default=4000, description="Number of bytes to read")
+
+
+class ReadToolResultTool(BaseTool):
+    """Tool for paging through tool results that were stored on disk"""
+
+    name: str = Field(default_factory=lambda: i18n.tools("read_tool_result")["name"])  # type: ignore
+    description: str = Field(
+        default_factory=lambda: i18n.tools("read_tool_result")["description"]  # type: ignore
+    )
+    args_schema: type[BaseModel] = ReadToolResultToolSchema
+
+    def _run(self, handle: str, offset: int = 0, length: int = 4000, **kwargs) -> str:
+        store = get_tool_result_store()
+        try:
+            size = store.size(handle)
+            content = store.read(handle, offset, length)
+        except KeyError as e:
+            return str(e.args[0])
+        end = min(size, max(0, offset) + max(0, length))
+        return f"{content}\n\n[bytes {max(0, offset)}-{end} of {size}]"
@@ -1,7 +1,7 @@
 import warnings
 from abc import ABC, abstractmethod
-from inspect import signature
-from typing import Any, Callable, Type, get_args, get_origin
+from inspect import iscoroutinefunction, signature
+from typing import Any, Callable, Optional, Type, get_args, get_origin
 
 from pydantic import (
     BaseModel,
@@ -37,6 +37,10 @@ class BaseTool(BaseModel, ABC):
     """Function that will be used to determine if the tool should be cached, should return a boolean. If None, the tool will be cached."""
     result_as_answer: bool = False
     """Flag to check if the tool should be the final agent answer."""
+    timeout: Optional[float] = Field(default=None, gt=0)
+    """Seconds a single run may take before the agent stops waiting for it. If None, the agent waits until it finishes."""
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+    """Maximum runs of this tool in flight at once, across every agent and crew in the process. If None, runs are not capped."""
 
     @validator("args_schema", always=True, pre=True)
     def _default_args_schema(
@@ -85,6 +89,8 @@ class BaseTool(BaseModel, ABC):
             args_schema=self.args_schema,
             func=self._run,
             result_as_answer=self.result_as_answer,
+            timeout=self.timeout,
+            max_concurrency=self.max_concurrency,
         )
 
     @classmethod
@@ -186,6 +192,13 @@ class Tool(BaseTool):
     def _run(self, *args: Any, **kwargs: Any) -> Any:
         return self.func(*args, **kwargs)
 
+    def to_structured_tool(self) -> CrewStructuredTool:
+        structured_tool = super().to_structured_tool()
+        if iscoroutinefunction(self.func):
+            # Let async callers await the coroutine instead of using a thread
+            structured_tool.func = self.func
+        return structured_tool
+
     @classmethod
     def from_langchain(cls, tool: Any) -> "Tool":
         """Create a Tool instance from a CrewStructuredTool.
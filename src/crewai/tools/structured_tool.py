@@ -1,13 +1,97 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import inspect
 import textwrap
-from typing import Any, Callable, Optional, Union, get_type_hints
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from pydantic import BaseModel, Field, create_model
-
+from pydantic.fields import FieldInfo
+
+from crewai.tools.tool_limits import (
+    acall_with_limits,
+    call_with_limits,
+    get_tool_executor,
+)
+from crewai.utilities.asyncio_utils import run_awaitable
 from crewai.utilities.logger import Logger
 
+_FAST_PATH_TYPES = (str, int, float, bool)
+
+# Config options that change what validation returns, with their defaults
+_VALIDATING_CONFIG_DEFAULTS: Dict[str, Any] = {
+    "str_strip_whitespace": False,
+    "str_to_lower": False,
+    "str_to_upper": False,
+    "str_min_length": 0,
+    "str_max_length": None,
+    "strict": False,
+    "coerce_numbers_to_str": False,
+    "validate_default": False,
+    "allow_inf_nan": True,
+}
+
+def _fast_path_fields(
+    args_schema: type[BaseModel],
+) -> Optional[Dict[str, Tuple[Tuple[type, ...], FieldInfo]]]:
+    """
+    Accepted types per field when validating `args_schema` reduces to exact
+    type checks: flat scalar fields, no aliases, constraints, validators,
+    extra fields or config options that transform values. Returns None for
+    any other schema.
+    """
+    decorators = args_schema.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or decorators.computed_fields
+        or args_schema.model_config.get("extra") not in (None, "ignore")
+        or any(
+            args_schema.model_config.get(key, default) != default
+            for key, default in _VALIDATING_CONFIG_DEFAULTS.items()
+        )
+    ):
+        return None
+
+    fields = {}
+    for name, field in args_schema.model_fields.items():
+        if (
+            field.alias
+            or field.validation_alias
+            or field.metadata
+            or field.validate_default
+        ):
+            return None
+        annotation = field.annotation
+        if annotation in _FAST_PATH_TYPES:
+            accepted: Tuple[type, ...] = (annotation,)  # type: ignore[assignment]
+        elif get_origin(annotation) in (Union, types.UnionType) and all(
+            arg in _FAST_PATH_TYPES or arg is type(None)
+            for arg in get_args(annotation)
+        ):
+            accepted = get_args(annotation)
+        else:
+            return None
+        fields[name] = (accepted, field)
+    return fields
+
 
 class CrewStructuredTool:
     """A structured tool that can operate on any number of inputs.
@@ -23,6 +107,8 @@ class CrewStructuredTool:
         args_schema: type[BaseModel],
         func: Callable[..., Any],
         result_as_answer: bool = False,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         """Initialize the structured tool.
 
@@ -32,6 +118,8 @@ class CrewStructuredTool:
             args_schema: The pydantic model for the tool's arguments
             func: The function to run when the tool is called
             result_as_answer: Whether to return the output directly
+            timeout: Seconds a single run may take before it is abandoned
+            max_concurrency: Runs of this tool allowed in flight process-wide
         """
         self.name = name
         self.description = description
@@ -39,9 +127,41 @@ class CrewStructuredTool:
         self.func = func
         self._logger = Logger()
         self.result_as_answer = result_as_answer
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._compiled_schema: Optional[type[BaseModel]] = None
+        self._json_schema: Optional[dict] = None
+        self._accepted_args: Optional[FrozenSet[str]] = None
+        self._fast_fields: Optional[
+            Dict[str, Tuple[Tuple[type, ...], FieldInfo]]
+        ] = None
 
         # Validate the function signature matches the schema
         self._validate_function_signature()
+        self._compile_schema()
+
+    def _compile_schema(self) -> None:
+        """
+        Compute the JSON schema, accepted argument names and fast validation
+        plan once per args_schema, instead of on every invocation.
+        """
+        if self._compiled_schema is self.args_schema:
+            return
+        try:
+            self._json_schema = self.args_schema.model_json_schema()
+            self._accepted_args = frozenset(self._json_schema["properties"])
+        except Exception:
+            # Some schemas can validate but not render (e.g. arbitrary types)
+            self._json_schema = None
+            self._accepted_args = None
+        self._fast_fields = _fast_path_fields(self.args_schema)
+        self._compiled_schema = self.args_schema
+
+    @property
+    def accepted_args(self) -> Optional[FrozenSet[str]]:
+        """Argument names in the JSON schema, None if it cannot be generated."""
+        self._compile_schema()
+        return self._accepted_args
 
     @classmethod
     def from_function(
@@ -187,12 +307,36 @@ class CrewStructuredTool:
             except json.JSONDecodeError as e:
                 raise ValueError(f"Failed to parse arguments as JSON: {e}")
 
+        self._compile_schema()
+        if isinstance(raw_args, dict) and self._fast_fields is not None:
+            parsed_args = self._parse_args_fast(raw_args)
+            if parsed_args is not None:
+                return parsed_args
+
         try:
             validated_args = self.args_schema.model_validate(raw_args)
             return validated_args.model_dump()
         except Exception as e:
             raise ValueError(f"Arguments validation failed: {e}")
 
+    def _parse_args_fast(self, raw_args: dict) -> Optional[dict]:
+        """
+        Same result as validating and dumping, for inputs whose values already
+        have the exact field types. Returns None when full validation is needed.
+        """
+        parsed_args = {}
+        for name, (accepted, field) in self._fast_fields.items():  # type: ignore[union-attr]
+            if name in raw_args:
+                value = raw_args[name]
+                if type(value) not in accepted:
+                    return None
+                parsed_args[name] = value
+            elif field.is_required():
+                return None
+            else:
+                parsed_args[name] = field.get_default(call_default_factory=True)
+        return parsed_args
+
     async def ainvoke(
         self,
         input: Union[str, dict],
@@ -210,16 +354,27 @@ class CrewStructuredTool:
             The result of the tool execution
         """
         parsed_args = self._parse_args(input)
-
-        if inspect.iscoroutinefunction(self.func):
-            return await self.func(**parsed_args, **kwargs)
+        func = functools.partial(self.func, **parsed_args, **kwargs)
+        timeout = self._run_timeout(config)
+
+        if timeout is not None or self.max_concurrency:
+            result = await acall_with_limits(
+                self.name,
+                func,
+                timeout=timeout,
+                max_concurrency=self.max_concurrency,
+                executor=get_tool_executor(),
+            )
+        elif inspect.iscoroutinefunction(self.func):
+            return await func()
         else:
-            # Run sync functions in a thread pool
-            import asyncio
-
-            return await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self.func(**parsed_args, **kwargs)
+            # Run sync functions on the shared pool, not the loop's default one
+            result = await asyncio.get_running_loop().run_in_executor(
+                get_tool_executor(), func
             )
+        if inspect.isawaitable(result):
+            result = await result
+        return result
 
     def _run(self, *args, **kwargs) -> Any:
         """Legacy method for compatibility."""
@@ -233,12 +388,36 @@ class CrewStructuredTool:
     ) -> Any:
         """Main method for tool execution."""
         parsed_args = self._parse_args(input)
-        return self.func(**parsed_args, **kwargs)
+        return call_with_limits(
+            self.name,
+            functools.partial(self._call, parsed_args, kwargs),
+            timeout=self._run_timeout(config),
+            max_concurrency=self.max_concurrency,
+        )
+
+    def _call(self, parsed_args: dict, kwargs: dict) -> Any:
+        result = self.func(**parsed_args, **kwargs)
+        if inspect.isawaitable(result):
+            result = run_awaitable(result)
+        return result
+
+    def _run_timeout(self, config: Optional[dict]) -> Optional[float]:
+        """
+        The tool's own timeout, shortened by a `timeout` in `config` (e.g.
+        the time the agent has left).
+        """
+        timeouts = [
+            t for t in (self.timeout, (config or {}).get("timeout")) if t is not None
+        ]
+        return min(timeouts) if timeouts else None
 
     @property
     def args(self) -> dict:
         """Get the tool's input arguments schema."""
-        return self.args_schema.model_json_schema()["properties"]
+        self._compile_schema()
+        if self._json_schema is None:
+            return self.args_schema.model_json_schema()["properties"]
+        return self._json_schema["properties"]
 
     def __repr__(self) -> str:
         return (
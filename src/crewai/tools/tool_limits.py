@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class ToolTimeoutError(Exception):
+    """Raised when a tool run, or the wait for a free slot, exceeds its timeout."""
+
+    def __init__(self, tool_name: str, timeout: float) -> None:
+        self.tool_name = tool_name
+        self.timeout = timeout
+        super().__init__(
+            f"Tool '{tool_name}' did not finish within {timeout:g} seconds."
+        )
+
+
+# Upper bound on sync tool calls running at once for async agents or timeouts
+MAX_TOOL_WORKERS = 16
+
+_tool_executor: Optional[ThreadPoolExecutor] = None
+_tool_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """Bounded thread pool shared by every sync tool run off the caller's thread."""
+    global _tool_executor
+    if _tool_executor is None:
+        with _tool_executor_lock:
+            if _tool_executor is None:
+                _tool_executor = ThreadPoolExecutor(
+                    max_workers=MAX_TOOL_WORKERS, thread_name_prefix="crewai-tool"
+                )
+    return _tool_executor
+
+
+_tool_semaphores: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+_tool_semaphores_lock = threading.Lock()
+
+
+def get_tool_semaphore(
+    tool_name: str, max_concurrency: int
+) -> threading.BoundedSemaphore:
+    """
+    Return the process-wide semaphore capping in-flight runs of `tool_name`.
+    Every agent and crew in the process shares it, so a cap of 8 means at
+    most 8 runs of the tool at once overall.
+    """
+    with _tool_semaphores_lock:
+        semaphore = _tool_semaphores.get((tool_name, max_concurrency))
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max_concurrency)
+            _tool_semaphores[(tool_name, max_concurrency)] = semaphore
+        return semaphore
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def _submit(
+    func: Callable[[], Any],
+    semaphore: Optional[threading.BoundedSemaphore],
+    executor: Optional[Executor] = None,
+) -> "Future[Any]":
+    """
+    Run `func` on `executor`, or the shared tool pool, holding `semaphore`
+    until it is done. Python cannot stop a running thread, so a timed out
+    run keeps its slot and worker until it actually finishes.
+    """
+    future = (executor or get_tool_executor()).submit(func)
+    if semaphore is not None:
+        future.add_done_callback(lambda _: semaphore.release())
+    return future
+
+
+def call_with_limits(
+    tool_name: str,
+    func: Callable[[], Any],
+    timeout: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+) -> Any:
+    """
+    Call `func` once a concurrency slot for `tool_name` is free, giving up
+    with ToolTimeoutError once `timeout` seconds have passed, slot wait
+    included.
+    """
+    if timeout is None and max_concurrency is None:
+        return func()
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    semaphore = (
+        get_tool_semaphore(tool_name, max_concurrency) if max_concurrency else None
+    )
+    if semaphore is not None and not semaphore.acquire(timeout=timeout):
+        raise ToolTimeoutError(tool_name, timeout)  # type: ignore[arg-type]
+
+    if timeout is None:
+        try:
+            return func()
+        finally:
+            semaphore.release()  # type: ignore[union-attr]
+
+    future = _submit(func, semaphore)
+    try:
+        return future.result(timeout=_remaining(deadline))
+    except FutureTimeoutError:
+        future.cancel()
+        raise ToolTimeoutError(tool_name, timeout) from None
+
+
+async def _aacquire(
+    semaphore: threading.BoundedSemaphore, deadline: Optional[float]
+) -> bool:
+    """
+    Acquire a thread semaphore without blocking the event loop. Waiters
+    block in the semaphore itself, so they are served in arrival order.
+    """
+    if semaphore.acquire(blocking=False):
+        return True
+    acquiring = asyncio.get_running_loop().run_in_executor(
+        None, semaphore.acquire, True, _remaining(deadline)
+    )
+    try:
+        return await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        # Hand back a slot acquired after the caller stopped waiting
+        acquiring.add_done_callback(
+            lambda done: (
+                semaphore.release() if not done.cancelled() and done.result() else None
+            )
+        )
+        raise
+
+
+async def acall_with_limits(
+    tool_name: str,
+    func: Callable[[], Any],
+    timeout: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Any:
+    """
+    Asynchronous counterpart of `call_with_limits`. A coroutine function is
+    cancelled on timeout. A sync function runs on `executor`, or the shared
+    tool pool, and is abandoned on timeout.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    semaphore = (
+        get_tool_semaphore(tool_name, max_concurrency) if max_concurrency else None
+    )
+    if semaphore is not None and not await _aacquire(semaphore, deadline):
+        raise ToolTimeoutError(tool_name, timeout)  # type: ignore[arg-type]
+
+    if asyncio.iscoroutinefunction(func):
+        try:
+            return await asyncio.wait_for(func(), _remaining(deadline))
+        except asyncio.TimeoutError:
+            raise ToolTimeoutError(tool_name, timeout) from None  # type: ignore[arg-type]
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    if deadline is None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, func)
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    awaitable: Awaitable[Any] = asyncio.wrap_future(_submit(func, semaphore, executor))
+    try:
+        return await asyncio.wait_for(awaitable, _remaining(deadline))
+    except asyncio.TimeoutError:
+        raise ToolTimeoutError(tool_name, timeout) from None  # type: ignore[arg-type]
@@ -0,0 +1,113 @@
+import threading
+from collections import OrderedDict, defaultdict
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+FUZZY_MATCH_THRESHOLD = 0.85
+MAX_MEMOIZED_NAMES = 256
+
+
+def normalize_tool_name(name: str) -> str:
+    return name.casefold().strip()
+
+
+def _loose_tool_name(name: str) -> str:
+    """Name with underscores and runs of whitespace collapsed to one space."""
+    return " ".join(name.casefold().replace("_", " ").split())
+
+
+def _trigrams(name: str) -> Set[str]:
+    padded = f"^{name}$"
+    return {padded[i : i + 3] for i in range(max(len(padded) - 2, 1))}
+
+
+class ToolRegistry:
+    """
+    Immutable name index over an agent's tools, built once per executor.
+
+    Exact, underscore and whitespace variants of a name resolve with a dict
+    lookup. Misspelled names are matched with the same similarity threshold
+    as before, but only against tools sharing a trigram with the name, and
+    the outcome is memoized so a repeated misspelling is resolved once.
+    """
+
+    def __init__(self, tools: Sequence[Any]) -> None:
+        self._tools: Tuple[Any, ...] = tuple(tools)
+        self._names: Tuple[str, ...] = tuple(
+            normalize_tool_name(tool.name) for tool in self._tools
+        )
+        self._exact: Dict[str, Any] = {}
+        self._loose: Dict[str, Any] = {}
+        trigram_index: Dict[str, List[int]] = defaultdict(list)
+        for position, (tool, name) in enumerate(zip(self._tools, self._names)):
+            self._exact.setdefault(name, tool)
+            self._loose.setdefault(_loose_tool_name(name), tool)
+            for trigram in _trigrams(name):
+                trigram_index[trigram].append(position)
+        self._trigram_index = dict(trigram_index)
+        self._memo: "OrderedDict[str, Optional[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def tools(self) -> Tuple[Any, ...]:
+        return self._tools
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Normalized tool names, in the order the tools were given."""
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._tools)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def get(self, name: str) -> Optional[Any]:
+        """Look a tool up by name, ignoring case, underscores and extra spaces."""
+        tool = self._exact.get(normalize_tool_name(name))
+        if tool is None:
+            tool = self._loose.get(_loose_tool_name(name))
+        return tool
+
+    def resolve(self, name: str) -> Optional[Any]:
+        """Look a tool up by name, falling back to the most similar tool name."""
+        tool = self.get(name)
+        if tool is not None or not name:
+            return tool
+
+        key = normalize_tool_name(name)
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+
+        tool = self._fuzzy_match(key)
+        with self._lock:
+            self._memo[key] = tool
+            if len(self._memo) > MAX_MEMOIZED_NAMES:
+                self._memo.popitem(last=False)
+        return tool
+
+    def _fuzzy_match(self, name: str) -> Optional[Any]:
+        candidates: Set[int] = set()
+        for trigram in _trigrams(name):
+            candidates.update(self._trigram_index.get(trigram, ()))
+
+        best: Optional[Tuple[float, int]] = None
+        matcher = SequenceMatcher(None, b=name)
+        for position in sorted(candidates):
+            matcher.set_seq1(self._names[position])
+            # Cheap upper bounds first, the full ratio only for close names
+            if (
+                matcher.real_quick_ratio() <= FUZZY_MATCH_THRESHOLD
+                or matcher.quick_ratio() <= FUZZY_MATCH_THRESHOLD
+            ):
+                continue
+            ratio = matcher.ratio()
+            if ratio > FUZZY_MATCH_THRESHOLD and (best is None or ratio > best[0]):
+                best = (ratio, position)
+        return self._tools[best[1]] if best else None
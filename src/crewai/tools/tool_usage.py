@@ -1,11 +1,10 @@
-import ast
+import asyncio
 import datetime
-import json
-import re
+import functools
+import threading
 import time
-from difflib import SequenceMatcher
 from textwrap import dedent
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
 from json_repair import repair_json
 
@@ -14,10 +13,13 @@ from crewai.agents.tools_handler import ToolsHandler
 from crewai.task import Task
 from crewai.telemetry import Telemetry
 from crewai.tools import BaseTool
-from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.structured_tool import CrewStructuredTool, get_tool_executor
 from crewai.tools.tool_calling import InstructorToolCalling, ToolCalling
+from crewai.tools.tool_limits import ToolTimeoutError
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.tools.tool_usage_events import ToolUsageError, ToolUsageFinished
 from crewai.utilities import I18N, Converter, ConverterError, Printer
+from crewai.utilities.tool_result_store import get_tool_result_store
 
 try:
     import agentops  # type: ignore
@@ -33,6 +35,9 @@ OPENAI_BIGGER_MODELS = [
     "o3-mini",
 ]
 
+# Characters of a stored result shown to the agent in its place
+SPILLED_RESULT_PREVIEW_CHARS = 1000
+
 
 class ToolUsageErrorException(Exception):
     """Exception raised for errors in the tool usage."""
@@ -54,8 +59,15 @@ class ToolUsage:
       tools_description: Description of the tools available for the agent.
       tools_names: Names of the tools available for the agent.
       function_calling_llm: Language model to be used for the tool usage.
+      tool_registry: Name index over the tools, shared by the executor's steps.
+      parallel_actions: Whether the agent may request several actions per response.
+      timeout: Upper bound in seconds for this run, e.g. the agent's remaining execution time.
     """
 
+    # Task counters, agent.tools_results and the tools handler are shared by
+    # every ToolUsage of a crew, and actions can run on several threads.
+    _state_lock = threading.RLock()
+
     def __init__(
         self,
         tools_handler: ToolsHandler,
@@ -67,6 +79,9 @@ class ToolUsage:
         function_calling_llm: Any,
         agent: Any,
         action: Any,
+        tool_registry: Optional[ToolRegistry] = None,
+        parallel_actions: bool = False,
+        timeout: Optional[float] = None,
     ) -> None:
         self._i18n: I18N = agent.i18n
         self._printer: Printer = Printer()
@@ -80,9 +95,12 @@ class ToolUsage:
         self.tools_handler = tools_handler
         self.original_tools = original_tools
         self.tools = tools
+        self.tool_registry = tool_registry or ToolRegistry(tools)
         self.task = task
         self.action = action
         self.function_calling_llm = function_calling_llm
+        self.parallel_actions = parallel_actions
+        self.timeout = timeout
 
         # Set the maximum parsing attempts for bigger models
         if (
@@ -96,47 +114,200 @@ class ToolUsage:
         """Parse the tool string and return the tool calling."""
         return self._tool_calling(tool_string)
 
+    async def aparse_tool_calling(self, tool_string: str):
+        """Like `parse_tool_calling`; a function calling LLM runs in a thread."""
+        if self.function_calling_llm:
+            return await asyncio.to_thread(self._tool_calling, tool_string)
+        return self._tool_calling(tool_string)
+
     def use(
         self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
     ) -> str:
+        tool = self._prepare_use(calling)
+        if isinstance(tool, str):
+            return tool
+
+        if self._is_add_image_tool(tool):
+            try:
+                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
+                return result
+
+            except Exception as e:
+                return self._tool_error(e)
+
+        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+
+    async def ause(
+        self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
+    ) -> str:
+        """
+        Same as `use`, but coroutine tools are awaited and sync tools run on
+        the shared tool thread pool, so the event loop is never blocked.
+        """
+        tool = self._prepare_use(calling)
+        if isinstance(tool, str):
+            return tool
+
+        if self._is_add_image_tool(tool):
+            try:
+                return await self._ause(
+                    tool_string=tool_string, tool=tool, calling=calling
+                )
+            except Exception as e:
+                return self._tool_error(e)
+
+        return (
+            f"{await self._ause(tool_string=tool_string, tool=tool, calling=calling)}"
+        )
+
+    def _prepare_use(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Union[Any, str]:
+        """Select the tool to run, or return the error to report instead."""
         if isinstance(calling, ToolUsageErrorException):
             error = calling.message
             if self.agent.verbose:
                 self._printer.print(content=f"\n\n{error}\n", color="red")
-            self.task.increment_tools_errors()
+            self._increment_tools_errors()
             return error
 
         try:
-            tool = self._select_tool(calling.tool_name)
+            return self._select_tool(calling.tool_name)
         except Exception as e:
-            error = getattr(e, "message", str(e))
+            return self._tool_error(e)
+
+    def _increment_tools_errors(self) -> None:
+        with self._state_lock:
             self.task.increment_tools_errors()
-            if self.agent.verbose:
-                self._printer.print(content=f"\n\n{error}\n", color="red")
-            return error
 
-        if isinstance(tool, CrewStructuredTool) and tool.name == self._i18n.tools("add_image")["name"]:  # type: ignore
-            try:
-                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
-                return result
+    def _format_slice(self) -> str:
+        """The response format reminder, matching the agent's action mode."""
+        name = "parallel_format" if self.parallel_actions else "format"
+        return self._i18n.slice(name).format(tool_names=self.tools_names)
+
+    def _tool_error(self, e: Exception) -> str:
+        error = getattr(e, "message", str(e))
+        self._increment_tools_errors()
+        if self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        return error
+
+    def _is_add_image_tool(self, tool: Any) -> bool:
+        return (
+            isinstance(tool, CrewStructuredTool)
+            and tool.name == self._i18n.tools("add_image")["name"]  # type: ignore
+        )
 
+    def _use(
+        self,
+        tool_string: str,
+        tool: Any,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> str:  # TODO: Fix this return type
+        tool_event = agentops.ToolEvent(name=calling.tool_name) if agentops else None  # type: ignore
+        repeated_usage = self._repeated_usage_result(tool, calling)
+        if repeated_usage is not None:
+            return repeated_usage
+
+        started_at = time.time()
+        result, from_cache = self._read_cache(calling)
+
+        if result is None:  #! finecwg: if not result --> if result is None
+            try:
+                self._count_delegation(calling)
+                arguments = self._tool_arguments(tool, calling)
+                try:
+                    result = self._invoke_tool(tool, arguments)
+                except ToolTimeoutError:
+                    raise
+                except Exception:
+                    if arguments is calling.arguments or not calling.arguments:
+                        raise
+                    result = self._invoke_tool(tool, calling.arguments)
+            except ToolTimeoutError as e:
+                return self._tool_timeout(tool, calling, e)
             except Exception as e:
-                error = getattr(e, "message", str(e))
-                self.task.increment_tools_errors()
-                if self.agent.verbose:
-                    self._printer.print(content=f"\n\n{error}\n", color="red")
-                return error
+                error = self._handle_tool_error(tool, calling, e, tool_event)
+                if error is not None:
+                    return error  # type: ignore # No return value expected
+                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
 
-        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+            # Spill first so the cache only ever holds the preview
+            spilled = self._spill_oversized_result(tool, result)
+            self._cache_result(tool, calling, result, spilled)
+            result = spilled
+        else:
+            result = self._spill_oversized_result(tool, result)
 
-    def _use(
+        return self._finish_use(
+            tool, calling, result, from_cache, started_at, tool_event
+        )
+
+    async def _ause(
         self,
         tool_string: str,
         tool: Any,
         calling: Union[ToolCalling, InstructorToolCalling],
-    ) -> str:  # TODO: Fix this return type
+    ) -> str:
         tool_event = agentops.ToolEvent(name=calling.tool_name) if agentops else None  # type: ignore
-        if self._check_tool_repeated_usage(calling=calling):  # type: ignore # _check_tool_repeated_usage of "ToolUsage" does not return a value (it only ever returns None)
+        repeated_usage = self._repeated_usage_result(tool, calling)
+        if repeated_usage is not None:
+            return repeated_usage
+
+        started_at = time.time()
+        result, from_cache = self._read_cache(calling)
+
+        if result is None:
+            try:
+                self._count_delegation(calling)
+                arguments = self._tool_arguments(tool, calling)
+                try:
+                    result = await self._ainvoke_tool(tool, arguments)
+                except ToolTimeoutError:
+                    raise
+                except Exception:
+                    if arguments is calling.arguments or not calling.arguments:
+                        raise
+                    result = await self._ainvoke_tool(tool, calling.arguments)
+            except ToolTimeoutError as e:
+                return self._tool_timeout(tool, calling, e)
+            except Exception as e:
+                error = self._handle_tool_error(tool, calling, e, tool_event)
+                if error is not None:
+                    return error
+                return await self.ause(calling=calling, tool_string=tool_string)
+
+            # Spill first so the cache only ever holds the preview
+            spilled = self._spill_oversized_result(tool, result)
+            self._cache_result(tool, calling, result, spilled)
+            result = spilled
+        else:
+            result = self._spill_oversized_result(tool, result)
+
+        return self._finish_use(
+            tool, calling, result, from_cache, started_at, tool_event
+        )
+
+    def _invoke_tool(self, tool: Any, arguments: Dict[str, Any]) -> Any:
+        if isinstance(tool, CrewStructuredTool) and self.timeout is not None:
+            return tool.invoke(input=arguments, config={"timeout": self.timeout})
+        return tool.invoke(input=arguments)
+
+    async def _ainvoke_tool(self, tool: Any, arguments: Dict[str, Any]) -> Any:
+        if isinstance(tool, CrewStructuredTool) and self.timeout is not None:
+            return await tool.ainvoke(input=arguments, config={"timeout": self.timeout})
+        if hasattr(tool, "ainvoke"):
+            return await tool.ainvoke(input=arguments)
+        return await asyncio.get_running_loop().run_in_executor(
+            get_tool_executor(), functools.partial(tool.invoke, input=arguments)
+        )
+
+    def _repeated_usage_result(
+        self, tool: Any, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Optional[str]:
+        with self._state_lock:
+            repeated = self._check_tool_repeated_usage(calling=calling)  # type: ignore # _check_tool_repeated_usage of "ToolUsage" does not return a value (it only ever returns None)
+        if repeated:
             try:
                 result = self._i18n.errors("task_repeated_usage").format(
                     tool_names=self.tools_names
@@ -150,87 +321,145 @@ class ToolUsage:
                 return result  # type: ignore # Fix the return type of this function
 
             except Exception:
-                self.task.increment_tools_errors()
+                self._increment_tools_errors()
+        return None
 
-        started_at = time.time()
-        from_cache = False
-
-        result = None  # type: ignore # Incompatible types in assignment (expression has type "None", variable has type "str")
-        # check if cache is available
+    def _read_cache(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Tuple[Any, bool]:
+        result = None
         if self.tools_handler.cache:
-            result = self.tools_handler.cache.read(  # type: ignore # Incompatible types in assignment (expression has type "str | None", variable has type "str")
-                tool=calling.tool_name, input=calling.arguments
-            )
-            from_cache = result is not None
+            with self._state_lock:
+                result = self.tools_handler.cache.read(
+                    tool=calling.tool_name, input=calling.arguments
+                )
+        return result, result is not None
+
+    def _count_delegation(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> None:
+        if calling.tool_name in [
+            "Delegate work to coworker",
+            "Ask question to coworker",
+        ]:
+            coworker = calling.arguments.get("coworker") if calling.arguments else None
+            with self._state_lock:
+                self.task.increment_delegations(coworker)
+
+    def _tool_arguments(
+        self, tool: Any, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Dict[str, Any]:
+        """The call's arguments, restricted to the ones the tool accepts."""
+        if not calling.arguments:
+            return {}
+        if isinstance(tool, CrewStructuredTool):
+            acceptable_args = tool.accepted_args
+        else:
+            # Tools converted from LangChain carry no precompiled schema
+            acceptable_args = self._schema_arg_names(tool)
+        if acceptable_args is None:
+            return calling.arguments
+        return {k: v for k, v in calling.arguments.items() if k in acceptable_args}
+
+    @staticmethod
+    def _schema_arg_names(tool: Any) -> Optional[FrozenSet[str]]:
+        """Argument names from a tool's args_schema, None if it has none."""
+        args_schema: Any = getattr(tool, "args_schema", None)
+        if not hasattr(args_schema, "model_json_schema"):
+            return None
+        try:
+            return frozenset(args_schema.model_json_schema()["properties"])
+        except Exception:
+            return None
 
-        original_tool = next(
-            (ot for ot in self.original_tools if ot.name == tool.name), None
+    def _tool_timeout(
+        self,
+        tool: Any,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        e: ToolTimeoutError,
+    ) -> str:
+        """Report a timed out run to the model; retrying would only wait again."""
+        self.on_tool_error(tool=tool, tool_calling=calling, e=e)
+        self._telemetry.tool_usage_error(llm=self.function_calling_llm)
+        self._increment_tools_errors()
+        error = self._i18n.errors("tool_timeout").format(
+            tool=tool.name, timeout=f"{e.timeout:g}"
         )
+        if self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        return error
 
-        if result is None:  #! finecwg: if not result --> if result is None
-            try:
-                if calling.tool_name in [
-                    "Delegate work to coworker",
-                    "Ask question to coworker",
-                ]:
-                    coworker = (
-                        calling.arguments.get("coworker") if calling.arguments else None
-                    )
-                    self.task.increment_delegations(coworker)
-
-                if calling.arguments:
-                    try:
-                        acceptable_args = tool.args_schema.model_json_schema()["properties"].keys()  # type: ignore
-                        arguments = {
-                            k: v
-                            for k, v in calling.arguments.items()
-                            if k in acceptable_args
-                        }
-                        result = tool.invoke(input=arguments)
-                    except Exception:
-                        arguments = calling.arguments
-                        result = tool.invoke(input=arguments)
-                else:
-                    result = tool.invoke(input={})
-            except Exception as e:
-                self.on_tool_error(tool=tool, tool_calling=calling, e=e)
-                self._run_attempts += 1
-                if self._run_attempts > self._max_parsing_attempts:
-                    self._telemetry.tool_usage_error(llm=self.function_calling_llm)
-                    error_message = self._i18n.errors("tool_usage_exception").format(
-                        error=e, tool=tool.name, tool_inputs=tool.description
-                    )
-                    error = ToolUsageErrorException(
-                        f'\n{error_message}.\nMoving on then. {self._i18n.slice("format").format(tool_names=self.tools_names)}'
-                    ).message
-                    self.task.increment_tools_errors()
-                    if self.agent.verbose:
-                        self._printer.print(
-                            content=f"\n\n{error_message}\n", color="red"
-                        )
-                    return error  # type: ignore # No return value expected
+    def _handle_tool_error(
+        self,
+        tool: Any,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        e: Exception,
+        tool_event: Any,
+    ) -> Optional[str]:
+        """Record a failed run; return the error once no attempts are left."""
+        self.on_tool_error(tool=tool, tool_calling=calling, e=e)
+        self._run_attempts += 1
+        if self._run_attempts > self._max_parsing_attempts:
+            self._telemetry.tool_usage_error(llm=self.function_calling_llm)
+            error_message = self._i18n.errors("tool_usage_exception").format(
+                error=e, tool=tool.name, tool_inputs=tool.description
+            )
+            error = ToolUsageErrorException(
+                f'\n{error_message}.\nMoving on then. {self._format_slice()}'
+            ).message
+            self._increment_tools_errors()
+            if self.agent.verbose:
+                self._printer.print(content=f"\n\n{error_message}\n", color="red")
+            return error
 
-                self.task.increment_tools_errors()
-                if agentops:
-                    agentops.record(
-                        agentops.ErrorEvent(exception=e, trigger_event=tool_event)
-                    )
-                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
+        self._increment_tools_errors()
+        if agentops:
+            agentops.record(agentops.ErrorEvent(exception=e, trigger_event=tool_event))
+        return None
 
-            if self.tools_handler:
-                should_cache = True
-                if (
-                    hasattr(original_tool, "cache_function")
-                    and original_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                ):
-                    should_cache = original_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                        calling.arguments, result
-                    )
+    def _original_tool(self, tool: Any) -> Any:
+        return next((ot for ot in self.original_tools if ot.name == tool.name), None)
 
+    def _cache_result(
+        self,
+        tool: Any,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        result: Any,
+        output: Any,
+    ) -> None:
+        """
+        Cache `output`, the result as shown to the agent, if the tool allows
+        caching `result`. Spilled results point at a file of this process, so
+        they are kept out of persistent storage.
+        """
+        if self.tools_handler:
+            original_tool = self._original_tool(tool)
+            should_cache = True
+            if (
+                hasattr(original_tool, "cache_function")
+                and original_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+            ):
+                should_cache = original_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+                    calling.arguments, result
+                )
+
+            with self._state_lock:
                 self.tools_handler.on_tool_use(
-                    calling=calling, output=result, should_cache=should_cache
+                    calling=calling,
+                    output=output,
+                    should_cache=should_cache,
+                    persist=output is result,
                 )
 
+    def _finish_use(
+        self,
+        tool: Any,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        result: Any,
+        from_cache: bool,
+        started_at: float,
+        tool_event: Any,
+    ) -> str:
         if agentops:
             agentops.record(tool_event)
         self._telemetry.tool_usage(
@@ -252,6 +481,7 @@ class ToolUsage:
             started_at=started_at,
         )
 
+        original_tool = self._original_tool(tool)
         if (
             hasattr(original_tool, "result_as_answer")
             and original_tool.result_as_answer  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
@@ -259,13 +489,41 @@ class ToolUsage:
             result_as_answer = original_tool.result_as_answer  # type: ignore # Item "None" of "Any | None" has no attribute "result_as_answer"
             data["result_as_answer"] = result_as_answer
 
-        self.agent.tools_results.append(data)
+        with self._state_lock:
+            self.agent.tools_results.append(data)
 
         return result  # type: ignore # No return value expected
 
+    def _spill_oversized_result(self, tool: Any, result: Any) -> Any:
+        """
+        Store a result longer than the agent's max_tool_result_size and return
+        a preview with its handle instead. Only done when the agent has the
+        tool to read it back.
+        """
+        max_size = getattr(self.agent, "max_tool_result_size", None)
+        if not max_size or not isinstance(result, str) or len(result) <= max_size:
+            return result
+        spilled_template = self._i18n.slice("spilled_tool_result")
+        if result.startswith(spilled_template.split("{size}")[0]):
+            # Already a preview, read from the cache
+            return result
+        reader_name = self._i18n.tools("read_tool_result")["name"]  # type: ignore
+        if tool.name == reader_name or reader_name not in self.tool_registry:
+            return result
+        store = get_tool_result_store()
+        handle = store.put(result)
+        return self._i18n.slice("spilled_tool_result").format(
+            size=store.size(handle),
+            handle=handle,
+            preview=result[: min(max_size, SPILLED_RESULT_PREVIEW_CHARS)],
+            tool=reader_name,
+        )
+
     def _format_result(self, result: Any) -> None:
-        self.task.used_tools += 1
-        if self._should_remember_format():  # type: ignore # "_should_remember_format" of "ToolUsage" does not return a value (it only ever returns None)
+        with self._state_lock:
+            self.task.used_tools += 1
+            remember_format = self._should_remember_format()
+        if remember_format:  # type: ignore # "_should_remember_format" of "ToolUsage" does not return a value (it only ever returns None)
             result = self._remember_format(result=result)  # type: ignore # "_remember_format" of "ToolUsage" does not return a value (it only ever returns None)
         return result
 
@@ -274,6 +532,9 @@ class ToolUsage:
 
     def _remember_format(self, result: str) -> None:
         result = str(result)
+        if getattr(self.agent, "stable_prompt_prefix", False):
+            # The full format already sits in the cached system prompt
+            return result + self._i18n.slice("tools_reminder")  # type: ignore # No return value expected
         result += "\n\n" + self._i18n.slice("tools").format(
             tools=self.tools_description, tool_names=self.tools_names
         )
@@ -290,23 +551,10 @@ class ToolUsage:
             )
 
     def _select_tool(self, tool_name: str) -> Any:
-        order_tools = sorted(
-            self.tools,
-            key=lambda tool: SequenceMatcher(
-                None, tool.name.lower().strip(), tool_name.lower().strip()
-            ).ratio(),
-            reverse=True,
-        )
-        for tool in order_tools:
-            if (
-                tool.name.lower().strip() == tool_name.lower().strip()
-                or SequenceMatcher(
-                    None, tool.name.lower().strip(), tool_name.lower().strip()
-                ).ratio()
-                > 0.85
-            ):
-                return tool
-        self.task.increment_tools_errors()
+        tool = self.tool_registry.resolve(tool_name)
+        if tool is not None:
+            return tool
+        self._increment_tools_errors()
         if tool_name and tool_name != "":
             raise Exception(
                 f"Action '{tool_name}' don't exist, these are the only available Actions:\n{self.tools_description}"
@@ -399,45 +647,43 @@ class ToolUsage:
             self._run_attempts += 1
             if self._run_attempts > self._max_parsing_attempts:
                 self._telemetry.tool_usage_error(llm=self.function_calling_llm)
-                self.task.increment_tools_errors()
+                self._increment_tools_errors()
                 if self.agent.verbose:
                     self._printer.print(content=f"\n\n{e}\n", color="red")
                 return ToolUsageErrorException(  # type: ignore # Incompatible return value type (got "ToolUsageErrorException", expected "ToolCalling | InstructorToolCalling")
-                    f'{self._i18n.errors("tool_usage_error").format(error=e)}\nMoving on then. {self._i18n.slice("format").format(tool_names=self.tools_names)}'
+                    f'{self._i18n.errors("tool_usage_error").format(error=e)}\nMoving on then. {self._format_slice()}'
                 )
             return self._tool_calling(tool_string)
 
     def _validate_tool_input(self, tool_input: str) -> Dict[str, Any]:
-        try:
-            # Replace Python literals with JSON equivalents
-            replacements = {
-                r"'": '"',
-                r"None": "null",
-                r"True": "true",
-                r"False": "false",
-            }
-            for pattern, replacement in replacements.items():
-                tool_input = re.sub(pattern, replacement, tool_input)
-
-            arguments = json.loads(tool_input)
-        except json.JSONDecodeError:
-            # Attempt to repair JSON string
-            repaired_input = repair_json(tool_input)
-            try:
-                arguments = json.loads(repaired_input)
-            except json.JSONDecodeError as e:
-                raise Exception(f"Invalid tool input JSON: {e}")
-
+        """
+        Decode the tool arguments in a single json_repair pass. Strict JSON
+        goes through json.loads inside json_repair; anything else (single
+        quotes, None, True, False, trailing commas) is parsed once by its
+        lenient parser.
+        """
+        arguments = repair_json(tool_input, return_objects=True)
+        if not isinstance(arguments, dict):
+            raise Exception(f"Invalid tool input JSON: {tool_input!r}")
         return arguments
 
-    def on_tool_error(self, tool: Any, tool_calling: ToolCalling, e: Exception) -> None:
+    def on_tool_error(
+        self,
+        tool: Any,
+        tool_calling: Union[ToolCalling, InstructorToolCalling],
+        e: Exception,
+    ) -> None:
         event_data = self._prepare_event_data(tool, tool_calling)
         events.emit(
             source=self, event=ToolUsageError(**{**event_data, "error": str(e)})
         )
 
     def on_tool_use_finished(
-        self, tool: Any, tool_calling: ToolCalling, from_cache: bool, started_at: float
+        self,
+        tool: Any,
+        tool_calling: Union[ToolCalling, InstructorToolCalling],
+        from_cache: bool,
+        started_at: float,
     ) -> None:
         finished_at = time.time()
         event_data = self._prepare_event_data(tool, tool_calling)
@@ -450,7 +696,9 @@ class ToolUsage:
         )
         events.emit(source=self, event=ToolUsageFinished(**event_data))
 
-    def _prepare_event_data(self, tool: Any, tool_calling: ToolCalling) -> dict:
+    def _prepare_event_data(
+        self, tool: Any, tool_calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> dict:
         return {
             "agent_key": self.agent.key,
             "agent_role": (self.agent._original_role or self.agent.role),
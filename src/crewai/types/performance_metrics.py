@@ -0,0 +1,154 @@
+import math
+from collections import deque
+from typing import Deque, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class LLMCallRecord(BaseModel):
+    """
+    Timing of a single LLM request.
+
+    Attributes:
+        model: Model that served the request.
+        agent_role: Role of the agent that made the request, if any.
+        task_id: Id of the task being executed, if any.
+        latency: Wall-clock seconds from sending the request to the full response.
+        time_to_first_token: Seconds until the first streamed token, if streaming.
+        retries: Number of fallback attempts made after a failure.
+        hedges: Number of duplicate requests sent because this one was slow.
+        error: Error message if the request failed.
+    """
+
+    model: str = Field(description="Model that served the request.")
+    agent_role: Optional[str] = Field(
+        default=None, description="Role of the agent that made the request."
+    )
+    task_id: Optional[str] = Field(
+        default=None, description="Id of the task being executed."
+    )
+    latency: float = Field(description="Wall-clock latency of the request, in seconds.")
+    time_to_first_token: Optional[float] = Field(
+        default=None, description="Seconds until the first streamed token."
+    )
+    retries: int = Field(default=0, description="Fallback attempts made.")
+    hedges: int = Field(default=0, description="Duplicate requests sent.")
+    error: Optional[str] = Field(
+        default=None, description="Error message if the request failed."
+    )
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(percentile / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class PerformanceMetrics(BaseModel):
+    """
+    Summary of the latency of the LLM calls made during the crew's execution.
+
+    Only aggregates are kept, so the summary has the same size however many
+    calls were made.
+
+    Attributes:
+        llm_calls: Number of LLM requests made.
+        llm_errors: Number of LLM requests that failed.
+        llm_retries: Number of fallback attempts made after failed LLM requests.
+        llm_hedges: Number of duplicate requests sent for slow LLM requests.
+        total_llm_time: Seconds spent waiting on LLM requests.
+        latency_p50: Median LLM request latency, in seconds.
+        latency_p95: 95th percentile LLM request latency, in seconds.
+        latency_p99: 99th percentile LLM request latency, in seconds.
+        time_to_first_token_p50: Median time to first token for streamed requests.
+        time_to_first_token_p95: 95th percentile time to first token for streamed requests.
+        time_to_first_token_p99: 99th percentile time to first token for streamed requests.
+    """
+
+    llm_calls: int = Field(default=0, description="Number of LLM requests made.")
+    llm_errors: int = Field(
+        default=0, description="Number of LLM requests that failed."
+    )
+    llm_retries: int = Field(
+        default=0, description="Number of fallback attempts made for LLM requests."
+    )
+    llm_hedges: int = Field(
+        default=0, description="Number of duplicate requests sent for LLM requests."
+    )
+    total_llm_time: float = Field(
+        default=0.0, description="Seconds spent waiting on LLM requests."
+    )
+    latency_p50: Optional[float] = Field(default=None)
+    latency_p95: Optional[float] = Field(default=None)
+    latency_p99: Optional[float] = Field(default=None)
+    time_to_first_token_p50: Optional[float] = Field(default=None)
+    time_to_first_token_p95: Optional[float] = Field(default=None)
+    time_to_first_token_p99: Optional[float] = Field(default=None)
+
+    @classmethod
+    def from_records(cls, records: Iterable[LLMCallRecord]) -> "PerformanceMetrics":
+        stats = PerformanceStats(max_samples=None)
+        for record in records:
+            stats.add(record)
+        return stats.summary()
+
+
+# Latencies kept per aggregate to compute percentiles from
+MAX_LATENCY_SAMPLES = 1000
+
+
+class PerformanceStats:
+    """
+    Running aggregate of LLM call records.
+
+    Counts and total time are exact. Percentiles come from the latest
+    `max_samples` latencies, so memory stays bounded however many calls an
+    agent makes over its lifetime. Pass `max_samples=None` to keep them all.
+    """
+
+    def __init__(self, max_samples: Optional[int] = MAX_LATENCY_SAMPLES) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.hedges = 0
+        self.total_time = 0.0
+        self.latencies: Deque[float] = deque(maxlen=max_samples)
+        self.first_tokens: Deque[float] = deque(maxlen=max_samples)
+
+    def add(self, record: LLMCallRecord) -> None:
+        self.calls += 1
+        self.errors += 1 if record.error else 0
+        self.retries += record.retries
+        self.hedges += record.hedges
+        self.total_time += record.latency
+        self.latencies.append(record.latency)
+        if record.time_to_first_token is not None:
+            self.first_tokens.append(record.time_to_first_token)
+
+    def merge(self, other: "PerformanceStats") -> None:
+        self.calls += other.calls
+        self.errors += other.errors
+        self.retries += other.retries
+        self.hedges += other.hedges
+        self.total_time += other.total_time
+        self.latencies.extend(other.latencies)
+        self.first_tokens.extend(other.first_tokens)
+
+    def summary(self) -> PerformanceMetrics:
+        latencies = sorted(self.latencies)
+        first_tokens = sorted(self.first_tokens)
+        return PerformanceMetrics(
+            llm_calls=self.calls,
+            llm_errors=self.errors,
+            llm_retries=self.retries,
+            llm_hedges=self.hedges,
+            total_llm_time=self.total_time,
+            latency_p50=_percentile(latencies, 50),
+            latency_p95=_percentile(latencies, 95),
+            latency_p99=_percentile(latencies, 99),
+            time_to_first_token_p50=_percentile(first_tokens, 50),
+            time_to_first_token_p95=_percentile(first_tokens, 95),
+            time_to_first_token_p99=_percentile(first_tokens, 99),
+        )
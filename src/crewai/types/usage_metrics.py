@@ -11,6 +11,12 @@ class UsageMetrics(BaseModel):
         cached_prompt_tokens: Number of cached prompt tokens used.
         completion_tokens: Number of tokens used in completions.
         successful_requests: Number of successful requests made.
+        llm_cache_hits: Number of LLM calls served from the response cache.
+        llm_cache_misses: Number of LLM calls that missed the response cache.
+        llm_cache_evictions: Number of entries evicted from the response cache.
+        tool_cache_hits: Number of tool calls served from the tool cache.
+        tool_cache_misses: Number of tool calls that missed the tool cache.
+        tool_cache_evictions: Number of entries evicted from the tool cache.
     """
 
     total_tokens: int = Field(default=0, description="Total number of tokens used.")
@@ -26,6 +32,31 @@ class UsageMetrics(BaseModel):
     successful_requests: int = Field(
         default=0, description="Number of successful requests made."
     )
+    llm_cache_hits: int = Field(
+        default=0, description="Number of LLM calls served from the response cache."
+    )
+    llm_cache_misses: int = Field(
+        default=0, description="Number of LLM calls that missed the response cache."
+    )
+    llm_cache_evictions: int = Field(
+        default=0, description="Number of entries evicted from the response cache."
+    )
+    tool_cache_hits: int = Field(
+        default=0, description="Number of tool calls served from the tool cache."
+    )
+    tool_cache_misses: int = Field(
+        default=0, description="Number of tool calls that missed the tool cache."
+    )
+    tool_cache_evictions: int = Field(
+        default=0, description="Number of entries evicted from the tool cache."
+    )
+
+    @property
+    def prompt_cache_hit_ratio(self) -> float:
+        """Share of prompt tokens served from the provider's prompt cache."""
+        if not self.prompt_tokens:
+            return 0.0
+        return self.cached_prompt_tokens / self.prompt_tokens
 
     def add_usage_metrics(self, usage_metrics: "UsageMetrics"):
         """
@@ -39,3 +70,9 @@ class UsageMetrics(BaseModel):
         self.cached_prompt_tokens += usage_metrics.cached_prompt_tokens
         self.completion_tokens += usage_metrics.completion_tokens
         self.successful_requests += usage_metrics.successful_requests
+        self.llm_cache_hits += usage_metrics.llm_cache_hits
+        self.llm_cache_misses += usage_metrics.llm_cache_misses
+        self.llm_cache_evictions += usage_metrics.llm_cache_evictions
+        self.tool_cache_hits += usage_metrics.tool_cache_hits
+        self.tool_cache_misses += usage_metrics.tool_cache_misses
+        self.tool_cache_evictions += usage_metrics.tool_cache_evictions
@@ -2,6 +2,7 @@ from .converter import Converter, ConverterError
 from .file_handler import FileHandler
 from .i18n import I18N
 from .internal_instructor import InternalInstructor
+from .llm_response_cache import LLMResponseCache
 from .logger import Logger
 from .parser import YamlParser
 from .printer import Printer
@@ -18,6 +19,7 @@ __all__ = [
     "FileHandler",
     "I18N",
     "InternalInstructor",
+    "LLMResponseCache",
     "Logger",
     "Printer",
     "Prompts",
@@ -0,0 +1,21 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+def run_awaitable(awaitable: Any) -> Any:
+    """
+    Run an awaitable to completion from sync code. Inside a running event
+    loop (e.g. a sync call made during `akickoff`) `asyncio.run` would fail,
+    so the awaitable runs on a fresh loop in a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_await(awaitable))
+    with ThreadPoolExecutor(max_workers=1) as helper:
+        return helper.submit(asyncio.run, _await(awaitable)).result()
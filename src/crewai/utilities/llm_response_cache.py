@@ -0,0 +1,249 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.printer import Printer
+
+# Request fields that never change the response: credentials, transport
+# settings and callbacks. Everything else is part of the cache key.
+CACHE_KEY_EXCLUDED_FIELDS = frozenset(
+    {
+        "api_key",
+        "callbacks",
+        "stream",
+        "stream_options",
+        "timeout",
+    }
+)
+
+
+class LLMResponseCache:
+    """
+    Content-addressed SQLite cache for LLM responses.
+
+    Entries are keyed on a canonical hash of the request, expire after `ttl`
+    seconds (if set) and are evicted least-recently-used first once the cache
+    holds more than `max_entries`. Identical calls that are in flight at the
+    same time are deduplicated: only one of them reaches the provider and the
+    others wait for its result.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        max_entries: int = 10_000,
+    ) -> None:
+        if db_path is None:
+            db_path = str(Path(db_storage_path()).parent / "llm_response_cache.db")
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._printer: Printer = Printer()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, threading.Event] = {}
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _initialize_db(self) -> None:
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_responses (
+                        key TEXT PRIMARY KEY,
+                        response TEXT,
+                        expires_at REAL,
+                        last_accessed REAL
+                    )
+                """
+                )
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS llm_responses_last_accessed
+                    ON llm_responses (last_accessed)
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM CACHE ERROR: An error occurred during database initialization: {e}",
+                color="red",
+            )
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Hash the normalized request, minus credentials and callbacks."""
+        payload = {
+            field: value
+            for field, value in params.items()
+            if field not in CACHE_KEY_EXCLUDED_FIELDS and value is not None
+        }
+        canonical = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if missing or expired."""
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT response, expires_at FROM llm_responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None or (row[1] is not None and row[1] <= now):
+                    return None
+                conn.execute(
+                    "UPDATE llm_responses SET last_accessed = ? WHERE key = ?",
+                    (now, key),
+                )
+                conn.commit()
+                return row[0]
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM CACHE ERROR: An error occurred while reading the cache: {e}",
+                color="red",
+            )
+        return None
+
+    def set(self, key: str, response: str) -> int:
+        """Store a response and return the number of entries evicted."""
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_responses (key, response, expires_at, last_accessed)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    (key, response, expires_at, now),
+                )
+                evicted = conn.execute(
+                    "DELETE FROM llm_responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (now,),
+                ).rowcount
+                overflow = (
+                    conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+                    - self.max_entries
+                )
+                if overflow > 0:
+                    evicted += conn.execute(
+                        """
+                        DELETE FROM llm_responses WHERE key IN (
+                            SELECT key FROM llm_responses
+                            ORDER BY last_accessed ASC
+                            LIMIT ?
+                        )
+                    """,
+                        (overflow,),
+                    ).rowcount
+                conn.commit()
+                return evicted
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM CACHE ERROR: An error occurred while writing the cache: {e}",
+                color="red",
+            )
+        return 0
+
+    def get_or_compute(
+        self, key: str, compute: Callable[[], str]
+    ) -> Tuple[str, bool, int]:
+        """
+        Return `(response, hit, evictions)` for `key`, calling `compute` on a miss.
+
+        Concurrent callers for the same key wait for the first one instead of
+        issuing their own request.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True, 0
+
+        event, leader = self._claim(key)
+        if not leader:
+            event.wait()
+            cached = self.get(key)
+            if cached is not None:
+                return cached, True, 0
+            return self._compute_and_store(key, compute, None)
+        return self._compute_and_store(key, compute, event)
+
+    async def aget_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[str]]
+    ) -> Tuple[str, bool, int]:
+        """Asynchronous counterpart of `get_or_compute`."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True, 0
+
+        claimed, leader = self._claim(key)
+        event: Optional[threading.Event] = claimed
+        if not leader:
+            await asyncio.to_thread(claimed.wait)
+            cached = self.get(key)
+            if cached is not None:
+                return cached, True, 0
+            event = None
+        try:
+            response = await compute()
+            evictions = self._store(key, response)
+            return response, False, evictions
+        finally:
+            if event is not None:
+                self._release(key, event)
+
+    def _claim(self, key: str) -> Tuple[threading.Event, bool]:
+        with self._lock:
+            event = self._in_flight.get(key)
+            if event is not None:
+                return event, False
+            event = threading.Event()
+            self._in_flight[key] = event
+            return event, True
+
+    def _release(self, key: str, event: threading.Event) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+        event.set()
+
+    def _compute_and_store(
+        self,
+        key: str,
+        compute: Callable[[], str],
+        event: Optional[threading.Event],
+    ) -> Tuple[str, bool, int]:
+        try:
+            response = compute()
+            return response, False, self._store(key, response)
+        finally:
+            if event is not None:
+                self._release(key, event)
+
+    def _store(self, key: str, response: Any) -> int:
+        if not isinstance(response, str) or not response:
+            return 0
+        return self.set(key, response)
+
+    def reset(self) -> None:
+        """Remove every cached response."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_responses")
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM CACHE ERROR: An error occurred while clearing the cache: {e}",
+                color="red",
+            )
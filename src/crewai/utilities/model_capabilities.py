@@ -0,0 +1,112 @@
+import logging
+import threading
+import warnings
+from typing import Any, Dict, Iterable, Optional
+
+from pydantic import BaseModel, Field
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", UserWarning)
+    import litellm
+    from litellm import get_supported_openai_params
+
+
+class ModelCapabilities(BaseModel):
+    """
+    What a model supports, as far as CrewAI is concerned.
+
+    Attributes:
+        supports_stop_words: Whether the provider accepts the `stop` parameter.
+        supports_function_calling: Whether the model can produce structured output.
+        context_window: Maximum context window, in tokens.
+        max_output_tokens: Maximum completion size, in tokens, if known.
+    """
+
+    supports_stop_words: bool = Field(default=False)
+    supports_function_calling: bool = Field(default=False)
+    context_window: int = Field(default=0)
+    max_output_tokens: Optional[int] = Field(default=None)
+
+
+class ModelCapabilityRegistry:
+    """
+    Thread-safe, memoized capability lookup keyed by model name.
+
+    Each model is resolved through litellm once per process; later lookups
+    are a dictionary read. Overrides take precedence over resolved values and
+    `warm` resolves a set of models up front, e.g. at application startup.
+    """
+
+    def __init__(
+        self, context_window_sizes: Dict[str, int], default_context_window: int
+    ) -> None:
+        self._context_window_sizes = context_window_sizes
+        self._default_context_window = default_context_window
+        # Longest prefix first, so the most specific entry wins
+        self._context_window_prefixes = sorted(
+            context_window_sizes, key=len, reverse=True
+        )
+        self._capabilities: Dict[str, ModelCapabilities] = {}
+        self._overrides: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model: str) -> ModelCapabilities:
+        capabilities = self._capabilities.get(model)
+        if capabilities is not None:
+            return capabilities
+
+        resolved = self._resolve(model)
+        with self._lock:
+            capabilities = self._capabilities.get(model)
+            if capabilities is None:
+                capabilities = resolved.model_copy(
+                    update=self._overrides.get(model, {})
+                )
+                self._capabilities[model] = capabilities
+            return capabilities
+
+    def override(self, model: str, **capabilities: Any) -> None:
+        """Force capability values for a model, e.g. for self-hosted deployments."""
+        unknown = set(capabilities) - set(ModelCapabilities.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown model capabilities: {sorted(unknown)}")
+        with self._lock:
+            self._overrides.setdefault(model, {}).update(capabilities)
+            self._capabilities.pop(model, None)
+
+    def warm(self, models: Iterable[str]) -> None:
+        for model in models:
+            self.get(model)
+
+    def clear(self) -> None:
+        """Forget resolved capabilities and overrides."""
+        with self._lock:
+            self._capabilities.clear()
+            self._overrides.clear()
+
+    def _resolve(self, model: str) -> ModelCapabilities:
+        try:
+            params = get_supported_openai_params(model=model) or []
+        except Exception as e:
+            logging.error(f"Failed to get supported params: {str(e)}")
+            params = []
+
+        return ModelCapabilities(
+            supports_stop_words="stop" in params,
+            supports_function_calling="response_format" in params,
+            context_window=self._context_window(model),
+            max_output_tokens=self._max_output_tokens(model),
+        )
+
+    def _context_window(self, model: str) -> int:
+        for prefix in self._context_window_prefixes:
+            if model.startswith(prefix):
+                return self._context_window_sizes[prefix]
+        return self._default_context_window
+
+    @staticmethod
+    def _max_output_tokens(model: str) -> Optional[int]:
+        try:
+            return litellm.get_model_info(model).get("max_output_tokens")
+        except Exception:
+            return None
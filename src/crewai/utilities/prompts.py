@@ -14,6 +14,8 @@ class Prompts(BaseModel):
     prompt_template: Optional[str] = None
     response_template: Optional[str] = None
     use_system_prompt: Optional[bool] = False
+    stable_prefix: bool = False
+    parallel_actions: bool = False
     agent: Any
 
     def task_execution(self) -> dict[str, str]:
@@ -21,11 +23,16 @@ class Prompts(BaseModel):
         slices = ["role_playing"]
         if len(self.tools) > 0:
             slices.append("tools")
+            if self.parallel_actions:
+                slices.append("parallel_actions")
         else:
             slices.append("no_tools")
         system = self._build_prompt(slices)
         slices.append("task")
 
+        if self.stable_prefix and not self.system_template and not self.prompt_template:
+            return self._stable_prefix_task_execution(slices)
+
         if (
             not self.system_template
             and not self.prompt_template
@@ -46,6 +53,23 @@ class Prompts(BaseModel):
                 )
             }
 
+    def _stable_prefix_task_execution(self, slices: list[str]) -> dict[str, str]:
+        """
+        Put everything that stays the same for the whole kickoff (role, goal,
+        backstory and tools, already interpolated) ahead of the task, so every
+        call of the kickoff shares one byte-stable prefix. Models without a
+        system role get the same text as a single user prompt.
+        """
+        system = self._build_prompt(slices[:-1])
+        user = self._build_prompt(["task"])
+        if not self.use_system_prompt:
+            return {"prompt": system + user}
+        return {
+            "system": system,
+            "user": user,
+            "prompt": system + user,
+        }
+
     def _build_prompt(
         self,
         components: list[str],
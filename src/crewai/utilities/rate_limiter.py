@@ -0,0 +1,367 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Optional, Sequence, Tuple
+
+from crewai.utilities.paths import db_storage_path
+
+"""Sliding-window rate limiting for requests and tokens."""
+
+RATE_LIMIT_BACKEND_ENV = "CREWAI_RATE_LIMIT_BACKEND"
+RATE_LIMIT_DB_ENV = "CREWAI_RATE_LIMIT_DB"
+
+
+def _window_delay(
+    request_times: Sequence[float],
+    token_entries: Sequence[Tuple[float, int]],
+    tokens_in_window: int,
+    max_rpm: Optional[int],
+    max_tpm: Optional[int],
+    tokens: int,
+    window_start: float,
+) -> float:
+    """Seconds until a request of `tokens` fits in both budgets of a pruned window."""
+    delay = 0.0
+    if max_rpm is not None and len(request_times) >= max_rpm:
+        delay = request_times[len(request_times) - max_rpm] - window_start
+
+    if max_tpm is not None and token_entries:
+        # Free the oldest entries until the request fits; an empty window
+        # always admits, so oversized requests cannot starve.
+        excess = tokens_in_window + tokens - max_tpm
+        for timestamp, used in token_entries:
+            if excess <= 0:
+                break
+            delay = max(delay, timestamp - window_start)
+            excess -= used
+    return delay
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for rate-limit windows. Implementations shared between processes
+    let every worker on a machine draw from the same provider budget.
+    """
+
+    @abstractmethod
+    def reserve(
+        self,
+        key: str,
+        max_rpm: Optional[int],
+        max_tpm: Optional[int],
+        tokens: int,
+        period: float,
+    ) -> float:
+        """
+        Record a request for `key` if it fits both budgets and return 0,
+        otherwise record nothing and return the seconds to wait before retrying.
+        """
+        pass
+
+    @abstractmethod
+    def record_tokens(self, key: str, tokens: int, period: float) -> None:
+        """Count tokens used by a request against the TPM budget of `key`."""
+        pass
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """In-process backend holding one sliding window per key."""
+
+    def __init__(self) -> None:
+        self._windows: Dict[str, "_SlidingWindow"] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key, max_rpm, max_tpm, tokens, period) -> float:
+        with self._lock:
+            window = self._windows.setdefault(key, _SlidingWindow())
+            now = time.monotonic()
+            delay = window.delay(now, now - period, max_rpm, max_tpm, tokens)
+            if delay <= 0:
+                window.record(now, tokens)
+            return delay
+
+    def record_tokens(self, key, tokens, period) -> None:
+        with self._lock:
+            window = self._windows.setdefault(key, _SlidingWindow())
+            window.record_tokens(time.monotonic(), tokens)
+
+
+class _SlidingWindow:
+    def __init__(self) -> None:
+        self.requests: Deque[float] = deque()
+        self.tokens: Deque[Tuple[float, int]] = deque()
+        self.tokens_in_window = 0
+
+    def delay(self, now, window_start, max_rpm, max_tpm, tokens) -> float:
+        while self.requests and self.requests[0] <= window_start:
+            self.requests.popleft()
+        while self.tokens and self.tokens[0][0] <= window_start:
+            self.tokens_in_window -= self.tokens.popleft()[1]
+        return _window_delay(
+            self.requests,
+            self.tokens,
+            self.tokens_in_window,
+            max_rpm,
+            max_tpm,
+            tokens,
+            window_start,
+        )
+
+    def record(self, now: float, tokens: int) -> None:
+        self.requests.append(now)
+        self.record_tokens(now, tokens)
+
+    def record_tokens(self, now: float, tokens: int) -> None:
+        if tokens:
+            self.tokens.append((now, tokens))
+            self.tokens_in_window += tokens
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    Machine-wide backend storing windows in a SQLite file. Each reservation
+    runs in an immediate transaction, so the database file lock serializes
+    concurrent processes.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        if db_path is None:
+            db_path = str(Path(db_storage_path()).parent / "rate_limits.db")
+        self.db_path = db_path
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rate_limit_usage (
+                    key TEXT,
+                    timestamp REAL,
+                    requests INTEGER,
+                    tokens INTEGER
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS rate_limit_usage_key_timestamp
+                ON rate_limit_usage (key, timestamp)
+            """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def reserve(self, key, max_rpm, max_tpm, tokens, period) -> float:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                window_start = now - period
+                conn.execute(
+                    "DELETE FROM rate_limit_usage WHERE key = ? AND timestamp <= ?",
+                    (key, window_start),
+                )
+                request_times = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT timestamp FROM rate_limit_usage WHERE key = ? AND requests > 0 ORDER BY timestamp",
+                        (key,),
+                    )
+                ]
+                token_entries = [
+                    (row[0], row[1])
+                    for row in conn.execute(
+                        "SELECT timestamp, tokens FROM rate_limit_usage WHERE key = ? AND tokens > 0 ORDER BY timestamp",
+                        (key,),
+                    )
+                ]
+                delay = _window_delay(
+                    request_times,
+                    token_entries,
+                    sum(used for _, used in token_entries),
+                    max_rpm,
+                    max_tpm,
+                    tokens,
+                    window_start,
+                )
+                if delay <= 0:
+                    conn.execute(
+                        "INSERT INTO rate_limit_usage (key, timestamp, requests, tokens) VALUES (?, ?, 1, ?)",
+                        (key, now, tokens),
+                    )
+                conn.execute("COMMIT")
+                return delay
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def record_tokens(self, key, tokens, period) -> None:
+        if not tokens:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO rate_limit_usage (key, timestamp, requests, tokens) VALUES (?, ?, 0, ?)",
+                (key, time.time(), tokens),
+            )
+
+
+# Window storage for shared limiters when no backend is configured
+_process_backend = LocalRateLimitBackend()
+
+
+class RateLimiter:
+    """
+    Sliding-window limiter with requests-per-minute and tokens-per-minute budgets.
+
+    Callers only wait until the oldest request in the window expires (never a
+    fixed minute), the lock is released while waiting, and waiters are
+    admitted in FIFO order. With an explicit `backend`, every limiter using
+    the same `key` on it, in this or another process, draws from the same
+    budget. Otherwise the backend set with `set_rate_limit_backend` is looked
+    up on every request, so switching it also applies to existing limiters;
+    without one the window is private to this instance, or shared by every
+    `shared` limiter of this process with the same `key`.
+    """
+
+    def __init__(
+        self,
+        max_rpm: Optional[int] = None,
+        max_tpm: Optional[int] = None,
+        period: float = 60.0,
+        key: str = "default",
+        backend: Optional[RateLimitBackend] = None,
+        shared: bool = False,
+    ) -> None:
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self.period = period
+        self.key = key
+        self.shared = shared
+        self._backend = backend
+        self._local_backend = _process_backend if shared else LocalRateLimitBackend()
+        self._condition = threading.Condition()
+        self._waiters: Deque[int] = deque()
+        self._next_ticket = 0
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until a request fits in both budgets and record it.
+
+        Args:
+            tokens: Tokens to reserve up front, if the request size is known.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        started = time.monotonic()
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._waiters.append(ticket)
+            try:
+                while True:
+                    timeout = None
+                    if self._waiters[0] == ticket:
+                        timeout = self._reserve(tokens)
+                        if timeout <= 0:
+                            return time.monotonic() - started
+                    self._condition.wait(timeout)
+            finally:
+                self._waiters.remove(ticket)
+                self._condition.notify_all()
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Asynchronous `acquire` that does not block the event loop."""
+        if self.try_acquire(tokens):
+            return 0.0
+        return await asyncio.to_thread(self.acquire, tokens)
+
+    def try_acquire(self, tokens: int = 0) -> bool:
+        """Record a request if it fits right now and nobody is queued ahead."""
+        with self._condition:
+            if self._waiters:
+                return False
+            return self._reserve(tokens) <= 0
+
+    @property
+    def backend(self) -> RateLimitBackend:
+        if self._backend is not None:
+            return self._backend
+        return get_rate_limit_backend() or self._local_backend
+
+    def record_tokens(self, tokens: int) -> None:
+        """Count tokens actually used by a request against the TPM budget."""
+        if not tokens or self.max_tpm is None:
+            return
+        self.backend.record_tokens(self.key, tokens, self.period)
+
+    def _reserve(self, tokens: int) -> float:
+        return self.backend.reserve(
+            self.key,
+            self.max_rpm,
+            self.max_tpm,
+            tokens if self.max_tpm is not None else 0,
+            self.period,
+        )
+
+
+_rate_limit_backend: Optional[RateLimitBackend] = None
+_rate_limit_backend_resolved = False
+_rate_limiters: Dict[Tuple[str, Optional[int], Optional[int]], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def set_rate_limit_backend(backend: Optional[RateLimitBackend]) -> None:
+    """
+    Share rate-limit windows through `backend`, e.g. a SQLiteRateLimitBackend
+    so that worker processes coordinate. Takes effect immediately for every
+    limiter created without an explicit backend, including existing ones.
+    """
+    global _rate_limit_backend, _rate_limit_backend_resolved
+    with _rate_limiters_lock:
+        _rate_limit_backend = backend
+        # Without an explicit backend, look at the environment again
+        _rate_limit_backend_resolved = backend is not None
+
+
+def get_rate_limit_backend() -> Optional[RateLimitBackend]:
+    """
+    Return the shared backend, if any. Setting CREWAI_RATE_LIMIT_BACKEND=sqlite
+    enables a SQLiteRateLimitBackend (at CREWAI_RATE_LIMIT_DB, if set).
+    """
+    global _rate_limit_backend, _rate_limit_backend_resolved
+    # Checked on every request: skip the lock once the backend is resolved
+    if _rate_limit_backend_resolved:
+        return _rate_limit_backend
+    with _rate_limiters_lock:
+        if (
+            _rate_limit_backend is None
+            and os.environ.get(RATE_LIMIT_BACKEND_ENV, "").lower() == "sqlite"
+        ):
+            _rate_limit_backend = SQLiteRateLimitBackend(
+                os.environ.get(RATE_LIMIT_DB_ENV)
+            )
+        _rate_limit_backend_resolved = True
+        return _rate_limit_backend
+
+
+def get_rate_limiter(
+    key: str, max_rpm: Optional[int] = None, max_tpm: Optional[int] = None
+) -> RateLimiter:
+    """
+    Return the process-wide limiter for `key` (e.g. a model name) and budget.
+    Limiters for the same `key` with different budgets share one window, and
+    each one admits requests only while the window fits its own budget.
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get((key, max_rpm, max_tpm))
+        if limiter is None:
+            limiter = RateLimiter(
+                max_rpm=max_rpm, max_tpm=max_tpm, key=key, shared=True
+            )
+            _rate_limiters[(key, max_rpm, max_tpm)] = limiter
+        return limiter
@@ -1,77 +1,57 @@
-import threading
-import time
 from typing import Optional
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from crewai.utilities.logger import Logger
+from crewai.utilities.rate_limiter import RateLimiter
 
 """Controls request rate limiting for API calls."""
 
 
 class RPMController(BaseModel):
-    """Manages requests per minute limiting."""
+    """
+    Manages requests per minute limiting.
+
+    When a shared rate-limit backend is configured, every controller with the
+    same `key` (in this or another process) draws from one budget.
+    """
 
     max_rpm: Optional[int] = Field(default=None)
+    key: str = Field(default="default")
     logger: Logger = Field(default_factory=lambda: Logger(verbose=False))
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: Optional[threading.Timer] = PrivateAttr(default=None)
-    _lock: Optional[threading.Lock] = PrivateAttr(default=None)
-    _shutdown_flag: bool = PrivateAttr(default=False)
+    _limiter: Optional[RateLimiter] = PrivateAttr(default=None)
 
     @model_validator(mode="after")
-    def reset_counter(self):
+    def set_limiter(self):
         if self.max_rpm is not None:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
+            self._limiter = RateLimiter(max_rpm=self.max_rpm, key=self.key)
         return self
 
-    def check_or_wait(self):
-        if self.max_rpm is None:
-            return True
+    @property
+    def limiter(self) -> Optional[RateLimiter]:
+        return self._limiter
+
+    def share_limiter(self, other: "RPMController") -> None:
+        """Draw from the same request budget as `other`, e.g. across crew copies."""
+        if other.limiter is not None and other.max_rpm == self.max_rpm:
+            self._limiter = other.limiter
 
-        def _check_and_increment():
-            if self.max_rpm is not None and self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            elif self.max_rpm is not None:
-                self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
-                )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
+    def check_or_wait(self):
+        if self._limiter is None:
             return True
 
-        if self._lock:
-            with self._lock:
-                return _check_and_increment()
-        else:
-            return _check_and_increment()
+        if not self._limiter.try_acquire():
+            self.logger.log(
+                "info",
+                "Max RPM reached, waiting for the oldest request to leave the window.",
+            )
+            self._wait_for_next_minute()
+        return True
 
     def stop_rpm_counter(self):
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
+        """Kept for compatibility: the sliding window needs no reset timer."""
 
     def _wait_for_next_minute(self):
-        time.sleep(60)
-        self._current_rpm = 0
-
-    def _reset_request_count(self):
-        def _reset():
-            self._current_rpm = 0
-            if not self._shutdown_flag:
-                self._timer = threading.Timer(60.0, self._reset_request_count)
-                self._timer.start()
-
-        if self._lock:
-            with self._lock:
-                _reset()
-        else:
-            _reset()
-
-        if self._timer:
-            self._shutdown_flag = True
-            self._timer.cancel()
+        """Wait only until the window frees a slot, in FIFO order."""
+        if self._limiter is not None:
+            self._limiter.acquire()
@@ -0,0 +1,131 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Optional, Tuple
+
+TASK_WORKERS_ENV = "CREWAI_MAX_TASK_WORKERS"
+
+
+class TaskPool:
+    """
+    Runs task executions on a shared executor with at most `max_workers` of
+    them in flight for this pool.
+
+    Submissions over the cap wait in a queue instead of holding executor
+    threads, so crews with small caps never starve each other. Every call
+    returns its own Future, which receives the result or the exception and
+    can be cancelled until it starts.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, executor: Optional[Executor] = None
+    ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queue: Deque[
+            Tuple["Future[Any]", Callable[..., Any], Tuple[Any, ...], dict]
+        ] = deque()
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        with self._lock:
+            if self.max_workers is not None and self._running >= self.max_workers:
+                self._queue.append((future, fn, args, kwargs))
+                return future
+            self._running += 1
+        self._start(future, fn, args, kwargs)
+        return future
+
+    def cancel_pending(self) -> int:
+        """Cancel every submission that has not started. Returns how many."""
+        with self._lock:
+            queued = list(self._queue)
+            self._queue.clear()
+        return sum(
+            1
+            for future, _, _, _ in queued
+            if not future.cancelled() and future.cancel()
+        )
+
+    def _start(
+        self,
+        future: "Future[Any]",
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: dict,
+    ) -> None:
+        executor = self._executor or get_task_executor()
+        executor.submit(self._run, future, fn, args, kwargs)
+
+    def _run(
+        self,
+        future: "Future[Any]",
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: dict,
+    ) -> None:
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            with self._lock:
+                following = self._queue.popleft() if self._queue else None
+                if following is None:
+                    self._running -= 1
+            if following is not None:
+                self._start(*following)
+
+
+_task_executor: Optional[ThreadPoolExecutor] = None
+_task_pool: Optional[TaskPool] = None
+_task_executor_lock = threading.Lock()
+
+
+def set_task_executor_max_workers(max_workers: int) -> None:
+    """
+    Resize the process-wide executor. Runs already submitted finish on the
+    previous one.
+    """
+    global _task_executor
+    with _task_executor_lock:
+        previous = _task_executor
+        _task_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="crewai-task"
+        )
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def get_task_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide executor shared by every crew. Its size comes
+    from CREWAI_MAX_TASK_WORKERS, or the ThreadPoolExecutor default.
+    """
+    global _task_executor
+    with _task_executor_lock:
+        if _task_executor is None:
+            max_workers = os.environ.get(TASK_WORKERS_ENV)
+            _task_executor = ThreadPoolExecutor(
+                max_workers=int(max_workers) if max_workers else None,
+                thread_name_prefix="crewai-task",
+            )
+        return _task_executor
+
+
+def get_task_pool() -> TaskPool:
+    """Uncapped pool over the shared executor, for tasks run outside a crew."""
+    global _task_pool
+    with _task_executor_lock:
+        if _task_pool is None:
+            _task_pool = TaskPool()
+        return _task_pool
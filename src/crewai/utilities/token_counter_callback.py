@@ -5,11 +5,19 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.types.utils import Usage
 
 from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.types.performance_metrics import LLMCallRecord
 
 
 class TokenCalcHandler(CustomLogger):
-    def __init__(self, token_cost_process: Optional[TokenProcess]):
+    def __init__(
+        self,
+        token_cost_process: Optional[TokenProcess],
+        agent_role: Optional[str] = None,
+        task_id: Optional[str] = None,
+    ):
         self.token_cost_process = token_cost_process
+        self.agent_role = agent_role
+        self.task_id = task_id
 
     def log_success_event(
         self,
@@ -35,3 +43,34 @@ class TokenCalcHandler(CustomLogger):
                         self.token_cost_process.sum_cached_prompt_tokens(
                             usage.prompt_tokens_details.cached_tokens
                         )
+
+    def log_llm_cache_event(self, hit: bool, evictions: int = 0) -> None:
+        if self.token_cost_process is None:
+            return
+
+        self.token_cost_process.sum_llm_cache_event(hit, evictions)
+
+    def log_llm_call(
+        self,
+        model: str,
+        latency: float,
+        time_to_first_token: Optional[float] = None,
+        retries: int = 0,
+        error: Optional[str] = None,
+        hedges: int = 0,
+    ) -> None:
+        if self.token_cost_process is None:
+            return
+
+        self.token_cost_process.record_llm_call(
+            LLMCallRecord(
+                model=model,
+                agent_role=self.agent_role,
+                task_id=self.task_id,
+                latency=latency,
+                time_to_first_token=time_to_first_token,
+                retries=retries,
+                hedges=hedges,
+                error=error,
+            )
+        )
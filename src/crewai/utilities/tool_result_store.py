@@ -0,0 +1,87 @@
+import atexit
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import Optional
+
+HANDLE_PREFIX = "result-"
+_HANDLE_PATTERN = re.compile(rf"^{HANDLE_PREFIX}[0-9a-f]{{32}}$")
+
+
+class ToolResultStore:
+    """
+    Local blob store for tool results too large to keep in the prompt.
+
+    Each result is written once to its own file, as UTF-8, and read back in
+    slices through a memory map, so a large result is neither held in
+    memory nor resent to the LLM on every step.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self._directory = directory
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        with self._lock:
+            if self._directory is None:
+                self._directory = tempfile.mkdtemp(prefix="crewai-tool-results-")
+            os.makedirs(self._directory, exist_ok=True)
+            return self._directory
+
+    def put(self, content: str) -> str:
+        """Store `content` and return the handle to read it back with."""
+        handle = f"{HANDLE_PREFIX}{uuid.uuid4().hex}"
+        with open(os.path.join(self.directory, handle), "wb") as f:
+            f.write(content.encode("utf-8"))
+        return handle
+
+    def size(self, handle: str) -> int:
+        """Size in bytes of the stored result."""
+        return os.path.getsize(self._path(handle))
+
+    def read(self, handle: str, offset: int = 0, length: int = 4000) -> str:
+        """
+        Read `length` bytes starting at byte `offset`. Characters cut at
+        either end of the slice are dropped.
+        """
+        offset = max(0, offset)
+        with open(self._path(handle), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as blob:
+                data = blob[offset : offset + max(0, length)]
+        return data.decode("utf-8", errors="ignore")
+
+    def clear(self) -> None:
+        """Delete every stored result."""
+        with self._lock:
+            if self._directory is not None:
+                shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _path(self, handle: str) -> str:
+        if not _HANDLE_PATTERN.match(handle):
+            raise KeyError(f"Unknown tool result handle: {handle}")
+        path = os.path.join(self.directory, handle)
+        if not os.path.exists(path):
+            raise KeyError(f"Unknown tool result handle: {handle}")
+        return path
+
+
+_result_store: Optional[ToolResultStore] = None
+_result_store_lock = threading.Lock()
+
+
+def get_tool_result_store() -> ToolResultStore:
+    """Process-wide store, removed when the interpreter exits."""
+    global _result_store
+    if _result_store is None:
+        with _result_store_lock:
+            if _result_store is None:
+                _result_store = ToolResultStore()
+                atexit.register(_result_store.clear)
+    return _result_store
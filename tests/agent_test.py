@@ -230,10 +230,14 @@ def test_cache_hitting():
 
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-    }
+    assert cache_handler.stats()["entries"] == 2
+    assert (
+        cache_handler.read("multiplier", {"second_number": 6, "first_number": 2})
+        == 12
+    )
+    assert (
+        cache_handler.read("multiplier", {"first_number": 3, "second_number": 3}) == 9
+    )
 
     task = Task(
         description="What is 2 times 6 times 3? Return only the number",
@@ -243,11 +247,11 @@ def test_cache_hitting():
     output = agent.execute_task(task)
     assert output == "36"
 
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
-    }
+    assert cache_handler.stats()["entries"] == 3
+    assert (
+        cache_handler.read("multiplier", {"first_number": 12, "second_number": 3})
+        == 36
+    )
 
     with (
         patch.object(CacheHandler, "read") as read,
@@ -303,10 +307,7 @@ def test_disabling_cache_for_agent():
 
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
-    assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-    }
+    assert cache_handler.stats()["entries"] == 0
 
     task = Task(
         description="What is 2 times 6 times 3? Return only the number",
@@ -316,11 +317,7 @@ def test_disabling_cache_for_agent():
     output = agent.execute_task(task)
     assert output == "36"
 
-    assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
-    }
+    assert cache_handler.stats()["entries"] == 0
 
     with patch.object(CacheHandler, "read") as read:
         read.return_value = "0"
@@ -568,7 +565,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         )
         assert output == "The final answer is 42."
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting for the oldest request to leave the window." in captured.out
         moveon.assert_called()
 
 
@@ -606,7 +603,7 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." not in captured.out
+        assert "Max RPM reached, waiting for the oldest request to leave the window." not in captured.out
         moveon.assert_not_called()
 
 
@@ -666,7 +663,7 @@ def test_agent_without_max_rpm_respects_crew_rpm(capsys):
         crew.kickoff()
         captured = capsys.readouterr()
         assert "get_final_answer" in captured.out
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting for the oldest request to leave the window." in captured.out
         moveon.assert_called_once()
 
 
@@ -1044,6 +1041,259 @@ def test_using_system_prompt():
     assert agent.agent_executor.prompt.get("system")
 
 
+def test_stable_prompt_prefix_keeps_system_prompt_identical_within_a_kickoff():
+    from crewai.tools import tool
+
+    @tool
+    def zeta_tool(query: str) -> str:
+        """Search zeta."""
+        return query
+
+    @tool
+    def alpha_tool(query: str) -> str:
+        """Search alpha."""
+        return query
+
+    agent = Agent(
+        role="{topic} specialist",
+        goal="Figure {topic} out",
+        backstory="I am the master of {topic}",
+        stable_prompt_prefix=True,
+        use_system_prompt=True,
+    )
+
+    agent.interpolate_inputs({"topic": "Sales"})
+    agent.create_agent_executor(tools=[zeta_tool, alpha_tool])
+    first = agent.agent_executor.prompt
+    agent.create_agent_executor(tools=[alpha_tool, zeta_tool])
+    second = agent.agent_executor.prompt
+
+    assert first["system"] == second["system"]
+    assert "Sales specialist" in first["system"]
+    assert "{topic}" not in first["system"]
+    assert first["prompt"].startswith(first["system"])
+    assert agent.agent_executor.tools_names == "alpha_tool, zeta_tool"
+
+
+def test_stable_prompt_prefix_without_system_prompt_uses_a_single_prompt():
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        stable_prompt_prefix=True,
+        use_system_prompt=False,
+    )
+
+    agent.create_agent_executor()
+    prompt = agent.agent_executor.prompt
+
+    assert set(prompt) == {"prompt"}
+    assert prompt["prompt"].startswith("You are test role.")
+    assert prompt["prompt"].index("test goal") < prompt["prompt"].index(
+        "Current Task"
+    )
+
+
+def test_stable_prompt_prefix_warns_when_templates_are_set():
+    with pytest.warns(UserWarning, match="stable_prompt_prefix is ignored"):
+        Agent(
+            role="test role",
+            goal="test goal",
+            backstory="test backstory",
+            stable_prompt_prefix=True,
+            system_template="{{ .System }}",
+            prompt_template="{{ .Prompt }}",
+            response_template="{{ .Response }}",
+        )
+
+
+def test_agent_reuses_compiled_executor_until_inputs_change():
+    @tool
+    def search_tool(query: str) -> str:
+        """Search the web."""
+        return query
+
+    agent = Agent(
+        role="{topic} researcher",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[search_tool],
+    )
+
+    with patch.object(Agent, "_parse_tools", wraps=agent._parse_tools) as parse:
+        agent.create_agent_executor()
+        first = agent.agent_executor
+        agent.create_agent_executor()
+        second = agent.agent_executor
+
+        assert parse.call_count == 0
+        assert first is not second
+        assert first.prompt is second.prompt
+        assert first.tool_registry is second.tool_registry
+        assert agent.llm.stop.count("\nObservation:") == 1
+
+        agent.interpolate_inputs({"topic": "AI"})
+        agent.create_agent_executor()
+        assert parse.call_count == 1
+        assert "AI researcher" in agent.agent_executor.prompt["prompt"]
+
+        agent.tools = []
+        agent.create_agent_executor()
+        assert parse.call_count == 2
+        assert agent.agent_executor.tools == []
+
+
+def test_agent_reuses_compiled_prompts_for_equivalent_tool_instances():
+    from crewai.tools.agent_tools.agent_tools import AgentTools
+
+    coworker = Agent(role="writer", goal="write", backstory="writes")
+    agent = Agent(role="researcher", goal="research", backstory="researches")
+
+    agent.create_agent_executor(tools=AgentTools(agents=[coworker]).tools())
+    first = agent.agent_executor
+    # Every kickoff builds new delegation tool instances
+    new_tools = AgentTools(agents=[coworker]).tools()
+    agent.create_agent_executor(tools=new_tools)
+    second = agent.agent_executor
+
+    assert first.prompt is second.prompt
+    assert second.original_tools == new_tools
+    assert second.tool_registry is not first.tool_registry
+
+
+def test_agent_does_not_mutate_a_shared_llm_stop_list():
+    llm = LLM(model="gpt-4o-mini", stop=["STOP"])
+    first = Agent(role="first", goal="goal", backstory="backstory", llm=llm)
+    second = Agent(
+        role="second",
+        goal="goal",
+        backstory="backstory",
+        llm=llm,
+        response_template="{{ .Response }}<END>",
+    )
+
+    first.create_agent_executor()
+    second.create_agent_executor()
+
+    assert llm.stop == ["STOP"]
+    assert first.llm.stop == ["STOP", "\nObservation:"]
+    assert second.llm.stop == ["STOP", "\nObservation:", "<END>"]
+    assert first.agent_executor.llm is first.llm
+
+
+def test_agent_runs_parallel_actions_concurrently():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    @tool
+    def get_price(item: str) -> str:
+        """Get the price of an item."""
+        barrier.wait()
+        return f"{item} costs 3"
+
+    @tool
+    def get_stock(item: str) -> str:
+        """Get the stock of an item."""
+        barrier.wait()
+        return f"{item} stock is 7"
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[get_price, get_stock],
+        parallel_actions=True,
+    )
+    task = Task(
+        description="Get the price and stock of apples.",
+        expected_output="The price and stock.",
+        agent=agent,
+    )
+    responses = [
+        "Thought: I need both\n"
+        "Action: get_price\n"
+        'Action Input: {"item": "apple"}\n'
+        "Action: get_stock\n"
+        'Action Input: {"item": "apple"}',
+        "Thought: I know both\nFinal Answer: 3 and 7",
+    ]
+
+    with patch.object(LLM, "call", side_effect=responses) as call:
+        output = agent.execute_task(task)
+
+    assert output == "3 and 7"
+    assert call.call_count == 2
+    observation = agent.agent_executor.messages[-2]["content"]
+    assert "get_price: apple costs 3" in observation
+    assert "get_stock: apple stock is 7" in observation
+
+
+def test_parallel_actions_keep_actions_after_hallucinated_observations():
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        parallel_actions=True,
+    )
+    task = Task(description="d", expected_output="o", agent=agent)
+    agent.create_agent_executor(task=task)
+    executor = agent.agent_executor
+    executor.use_stop_words = False
+
+    actions = executor._process_llm_response(
+        "Thought: I need both\n"
+        "Action: get_price\n"
+        'Action Input: {"item": "apple"}\n'
+        "Observation: apple costs 3\n"
+        "Action: get_stock\n"
+        'Action Input: {"item": "apple"}\n'
+        "Observation: apple stock is 7\n"
+        "Thought: I know both\n"
+        "Final Answer: 3 and 7"
+    )
+
+    assert [action.tool for action in actions] == ["get_price", "get_stock"]
+    assert [action.tool_input for action in actions] == ['{"item": "apple"}'] * 2
+
+
+def test_stable_prompt_prefix_uses_short_format_reminder():
+    from crewai.tools.tool_usage import ToolUsage
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        stable_prompt_prefix=True,
+    )
+    tool_usage = ToolUsage(
+        tools_handler=agent.tools_handler,
+        tools=[],
+        original_tools=[],
+        tools_description="a very long tools description",
+        tools_names="",
+        task=Task(description="d", expected_output="o", agent=agent),
+        function_calling_llm=agent.llm,
+        agent=agent,
+        action=None,
+    )
+
+    result = tool_usage._remember_format("42")
+
+    assert result == "42" + agent.i18n.slice("tools_reminder")
+    assert "a very long tools description" not in result
+
+
+def test_usage_metrics_prompt_cache_hit_ratio():
+    from crewai.types.usage_metrics import UsageMetrics
+
+    assert UsageMetrics().prompt_cache_hit_ratio == 0.0
+    assert (
+        UsageMetrics(prompt_tokens=200, cached_prompt_tokens=150).prompt_cache_hit_ratio
+        == 0.75
+    )
+
+
 def test_system_and_prompt_template():
     agent = Agent(
         role="{topic} specialist",
@@ -0,0 +1,227 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from crewai import Agent, Crew, Task
+from crewai.agents.cache import CacheHandler, ToolCacheStorage
+from crewai.agents.tools_handler import ToolsHandler
+from crewai.tools import tool
+from crewai.tools.cache_tools.cache_tools import CacheTools
+from crewai.tools.tool_calling import ToolCalling
+from crewai.tools.tool_usage import ToolUsage
+
+
+def test_keys_ignore_argument_order():
+    cache = CacheHandler()
+    cache.add("search", {"query": "crewai", "limit": 3}, "result")
+
+    assert cache.read("search", {"limit": 3, "query": "crewai"}) == "result"
+    assert cache.read("search", {"limit": 4, "query": "crewai"}) is None
+    assert cache.read("other", {"limit": 3, "query": "crewai"}) is None
+
+
+def test_cache_tool_reads_results_stored_from_dict_arguments():
+    cache = CacheHandler()
+    cache.add("search", {"query": "crewai", "limit": 3}, "result")
+
+    key = "tool:search|input:{'limit': 3, 'query': 'crewai'}"
+    assert CacheTools(cache_handler=cache).hit_cache(key) == "result"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = CacheHandler(max_entries=2)
+    cache.add("tool", {"n": 1}, "one")
+    cache.add("tool", {"n": 2}, "two")
+    cache.read("tool", {"n": 1})
+    cache.add("tool", {"n": 3}, "three")
+
+    assert cache.read("tool", {"n": 2}) is None
+    assert cache.read("tool", {"n": 1}) == "one"
+    assert cache.read("tool", {"n": 3}) == "three"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_max_bytes_bounds_total_size():
+    cache = CacheHandler(max_entries=None, max_bytes=10)
+    cache.add("tool", {"n": 1}, "aaaaa")
+    cache.add("tool", {"n": 2}, "bbbbb")
+    cache.add("tool", {"n": 3}, "ccccc")
+    cache.add("tool", {"n": 4}, "x" * 11)
+
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] == 10
+    assert cache.read("tool", {"n": 1}) is None
+    assert cache.read("tool", {"n": 4}) is None
+
+
+def test_entries_expire_after_the_tool_ttl():
+    cache = CacheHandler(ttl=60, tool_ttls={"weather": 5})
+    with patch("crewai.agents.cache.cache_handler.time.monotonic", return_value=0):
+        cache.add("weather", {"city": "Lisbon"}, "sunny")
+        cache.add("search", {"query": "crewai"}, "result")
+
+    with patch("crewai.agents.cache.cache_handler.time.monotonic", return_value=10):
+        assert cache.read("weather", {"city": "Lisbon"}) is None
+        assert cache.read("search", {"query": "crewai"}) == "result"
+
+    assert cache.stats()["entries"] == 1
+
+
+def test_stats_are_consistent_under_concurrent_use():
+    cache = CacheHandler(max_entries=50)
+
+    def work(n: int) -> None:
+        cache.add("tool", {"n": n}, str(n))
+        cache.read("tool", {"n": n})
+        cache.read("tool", {"n": -n - 1})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(200)))
+
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 400
+    assert stats["entries"] == 50
+    assert stats["evictions"] == 150
+
+
+def test_crew_configures_the_cache_and_reports_its_stats():
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(description="test", expected_output="test", agent=agent)
+    crew = Crew(
+        agents=[agent],
+        tasks=[task],
+        tool_cache_config={"max_entries": 1, "tool_ttls": {"search": 30}},
+    )
+
+    assert crew._cache_handler.max_entries == 1
+    assert crew._cache_handler.tool_ttls == {"search": 30}
+
+    crew._cache_handler.add("search", {"query": "a"}, "a")
+    crew._cache_handler.add("search", {"query": "b"}, "b")
+    crew._cache_handler.read("search", {"query": "b"})
+    crew._cache_handler.read("search", {"query": "a"})
+    usage_metrics = crew.calculate_usage_metrics()
+
+    assert usage_metrics.tool_cache_hits == 1
+    assert usage_metrics.tool_cache_misses == 1
+    assert usage_metrics.tool_cache_evictions == 1
+
+
+def test_persistent_results_are_shared_between_handlers(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    first = CacheHandler(persistent=True, db_path=db_path)
+    first.add("search", {"query": "crewai"}, {"hits": [1, 2]})
+
+    second = CacheHandler(persistent=True, db_path=db_path)
+    assert second.read("search", {"query": "crewai"}) == {"hits": [1, 2]}
+    assert second.stats() == {
+        "hits": 1,
+        "misses": 0,
+        "evictions": 0,
+        "storage_evictions": 0,
+        "entries": 1,
+        "bytes": len(str({"hits": [1, 2]})),
+    }
+    assert CacheHandler().read("search", {"query": "crewai"}) is None
+
+
+def test_persistent_results_are_shared_between_processes(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    script = (
+        "from crewai.agents.cache import CacheHandler;"
+        f"CacheHandler(persistent=True, db_path={db_path!r})"
+        ".add('search', {'query': 'crewai'}, 'result')"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+    cache = CacheHandler(persistent=True, db_path=db_path)
+    assert cache.read("search", {"query": "crewai"}) == "result"
+
+
+def test_persistent_results_expire_after_the_tool_ttl(tmp_path):
+    storage = ToolCacheStorage(db_path=str(tmp_path / "tool_cache.db"))
+    with patch("crewai.agents.cache.tool_cache_storage.time.time", return_value=1000):
+        storage.set("key", "weather", "sunny", ttl=5)
+
+    with patch("crewai.agents.cache.tool_cache_storage.time.time", return_value=1004):
+        assert storage.get("key") == ("sunny", 1005)
+    with patch("crewai.agents.cache.tool_cache_storage.time.time", return_value=1005):
+        assert storage.get("key") is None
+
+
+def test_persistent_cache_honours_cache_function(tmp_path):
+    @tool
+    def lookup(term: str) -> str:
+        """Look a term up."""
+        return f"definition of {term}"
+
+    lookup.cache_function = lambda args, result: args["term"] != "secret"
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(description="test", expected_output="test", agent=agent)
+    cache = CacheHandler(persistent=True, db_path=str(tmp_path / "tool_cache.db"))
+    tool_usage = ToolUsage(
+        tools_handler=ToolsHandler(cache=cache),
+        tools=[lookup.to_structured_tool()],
+        original_tools=[lookup],
+        tools_description="",
+        tools_names=lookup.name,
+        task=task,
+        function_calling_llm=None,
+        agent=agent,
+        action=MagicMock(),
+    )
+
+    for term in ("crewai", "secret"):
+        tool_usage.use(ToolCalling(tool_name=lookup.name, arguments={"term": term}), "")
+
+    shared = CacheHandler(persistent=True, db_path=cache.db_path)
+    assert shared.read(lookup.name, {"term": "crewai"}) == "definition of crewai"
+    assert shared.read(lookup.name, {"term": "secret"}) is None
+
+
+def test_crew_copies_share_the_persistent_cache(tmp_path):
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(description="test", expected_output="test", agent=agent)
+    crew = Crew(
+        agents=[agent],
+        tasks=[task],
+        tool_cache_config={
+            "persistent": True,
+            "db_path": str(tmp_path / "tool_cache.db"),
+        },
+    )
+    crew._cache_handler.add("search", {"query": "crewai"}, "result")
+
+    copied_crew = crew.copy()
+
+    assert copied_crew._cache_handler is not crew._cache_handler
+    assert copied_crew._cache_handler._storage is crew._cache_handler._storage
+    assert (
+        copied_crew.agents[0].cache_handler.read("search", {"query": "crewai"})
+        == "result"
+    )
+
+
+def test_oversized_result_replaces_the_stale_entry():
+    cache = CacheHandler(max_bytes=10)
+    cache.add("tool", {"n": 1}, "small")
+
+    cache.add("tool", {"n": 1}, "x" * 11)
+
+    assert cache.read("tool", {"n": 1}) is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_storage_evictions_are_counted_apart(tmp_path):
+    cache = CacheHandler(
+        persistent=True, db_path=str(tmp_path / "tool_cache.db"), max_entries=10
+    )
+    cache._storage.max_entries = 1
+
+    cache.add("tool", {"n": 1}, "one")
+    cache.add("tool", {"n": 2}, "two")
+
+    stats = cache.stats()
+    assert stats["evictions"] == 0
+    assert stats["storage_evictions"] == 1
@@ -0,0 +1,115 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai.agents.context_manager import ContextWindowManager
+
+
+def _llm(context_window=200, on_call=None):
+    llm = MagicMock()
+    llm.model = "gpt-4o-mini"
+    llm.get_context_window_size.return_value = context_window
+    calls = []
+
+    def call(messages, callbacks=None):
+        content = messages[1]["content"]
+        calls.append(content)
+        if on_call:
+            on_call()
+        return "summary of " + ", ".join(
+            word.rstrip(":") for word in content.split() if word.rstrip(":").isdigit()
+        )
+
+    llm.call.side_effect = call
+    return llm, calls
+
+
+def _history(turns, words=30):
+    messages = [
+        {"role": "system", "content": "You are a researcher."},
+        {"role": "user", "content": "Find the answer."},
+    ]
+    for i in range(turns):
+        messages.append(
+            {"role": "assistant", "content": f"Observation {i}: " + "data " * words}
+        )
+    return messages
+
+
+def test_fits_counts_tokens_without_calling_the_llm():
+    llm, calls = _llm(context_window=10_000)
+    manager = ContextWindowManager(llm)
+
+    assert manager.fits(_history(3))
+    assert calls == []
+
+
+def test_compact_keeps_prompt_and_recent_turns_and_summarizes_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    llm, calls = _llm(context_window=80, on_call=barrier.wait)
+    manager = ContextWindowManager(llm)
+    messages = _history(4)
+
+    compacted = manager.compact(messages)
+
+    # Two chunks of old observations, summarized at the same time
+    assert len(calls) == 2
+    assert compacted[:2] == messages[:2]
+    assert compacted[-2:] == messages[-2:]
+    assert "summary of 0" in compacted[2]["content"]
+    assert "summary of 1" in compacted[2]["content"]
+
+
+def test_compacted_prefix_is_not_summarized_again():
+    llm, calls = _llm(context_window=80)
+    manager = ContextWindowManager(llm)
+
+    compacted = manager.compact(_history(4))
+    assert len(calls) == 2
+
+    # Only the earlier summary is left to compact: nothing to summarize
+    manager.compact(compacted)
+    assert len(calls) == 2
+
+    compacted.append({"role": "assistant", "content": "Observation 4: done"})
+    compacted = manager.compact(compacted)
+
+    assert len(calls) == 3
+    assert calls[2].endswith("Observation 2: " + "data " * 30)
+    assert "summary of 0" in compacted[2]["content"]
+    assert "summary of 2" in compacted[2]["content"]
+
+
+def test_oversized_message_is_split_by_tokens():
+    llm, calls = _llm(context_window=100)
+    manager = ContextWindowManager(llm)
+    messages = [{"role": "user", "content": "word " * 400}]
+
+    compacted = manager.compact(messages)
+
+    assert len(calls) >= 8
+    prefix_tokens = manager.count_tokens(
+        [{"content": manager._summary_request("")[1]["content"]}]
+    )
+    assert all(
+        manager.count_tokens([{"content": call}]) <= 50 + prefix_tokens
+        for call in calls
+    )
+    assert compacted[0]["role"] == "user"
+
+
+@pytest.mark.asyncio
+async def test_acompact_summarizes_with_acall():
+    llm, _ = _llm(context_window=80)
+
+    async def acall(messages, callbacks=None):
+        return "async summary"
+
+    llm.acall.side_effect = acall
+    manager = ContextWindowManager(llm)
+
+    compacted = await manager.acompact(_history(4))
+
+    llm.call.assert_not_called()
+    assert "async summary" in compacted[2]["content"]
@@ -372,9 +372,77 @@ def test_integration_valid_and_invalid(parser):
     assert isinstance(results[3], OutputParserException)
 
 
+def test_parsing_large_outputs(parser):
+    observation = "Observation: " + "lorem ipsum dolor sit amet " * 8000
+    cases = [
+        # Many actions without an input made the lazy regex backtrack
+        ("Thought: retry\n" + "Action: search\n" * 20000, OutputParserException),
+        (
+            "Thought: done\nFinal Answer: " + "lorem ipsum dolor sit amet " * 8000,
+            AgentFinish,
+        ),
+        (
+            "Thought: look\nAction: search\nAction Input: "
+            + '{"query": "%s"}' % ("x" * 200_000),
+            AgentAction,
+        ),
+        (
+            observation + "\nThought: next\nAction: search\nAction Input: {}",
+            AgentAction,
+        ),
+    ]
+
+    for text, expected in cases:
+        assert len(text) > 100_000
+        try:
+            result = parser.parse(text)
+        except OutputParserException as e:
+            result = e
+
+        assert isinstance(result, expected)
+
+
 class MockAgent:
     def increment_formatting_errors(self):
         pass
 
 
 # TODO: ADD TEST TO MAKE SURE ** REMOVAL DOESN'T MESS UP ANYTHING
+
+
+def test_parse_actions_with_several_actions(parser):
+    text = (
+        "Thought: I need both numbers\n\n"
+        "Action: get_price\n"
+        'Action Input: {"item": "apple"}\n'
+        "Action: get_stock\n"
+        'Action Input: {"item": "apple"}\n'
+    )
+    actions = parser.parse_actions(text)
+    assert [action.tool for action in actions] == ["get_price", "get_stock"]
+    assert [action.tool_input for action in actions] == [
+        '{"item": "apple"}',
+        '{"item": "apple"}',
+    ]
+    assert all(action.thought == "Thought: I need both numbers" for action in actions)
+
+
+def test_parse_actions_with_single_action_or_final_answer(parser):
+    actions = parser.parse_actions(
+        'Thought: search\nAction: search\nAction Input: {"query": "x"}'
+    )
+    assert len(actions) == 1
+    assert actions[0].tool == "search"
+
+    result = parser.parse_actions("Thought: done\nFinal Answer: 42")
+    assert isinstance(result, AgentFinish)
+    assert result.output == "42"
+
+
+def test_parse_actions_with_final_answer_and_actions(parser):
+    text = (
+        "Thought: both\nAction: a\nAction Input: {}\n"
+        "Action: b\nAction Input: {}\nFinal Answer: done"
+    )
+    with pytest.raises(OutputParserException):
+        parser.parse_actions(text)
@@ -0,0 +1,238 @@
+"""Test CrewSpec serialization and the process batch runner."""
+
+import multiprocessing
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from crewai.agent import Agent
+from crewai.crew import Crew
+from crewai.crews.crew_output import CrewOutput
+from crewai.crews.crew_spec import CrewSpec
+from crewai.crews.process_batch_runner import (
+    ProcessBatchRunner,
+    _init_worker,
+    _run_input,
+)
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.llm import LLM, HedgingPolicy
+from crewai.process import Process
+from crewai.task import Task
+from crewai.tools import tool
+from crewai.tools.base_tool import Tool
+from crewai.types.usage_metrics import UsageMetrics
+
+
+@tool
+def lookup(query: str) -> str:
+    """Look up a query."""
+    return query
+
+
+def search_web(query: str) -> str:
+    """Search."""
+    return query
+
+
+def before_kickoff(inputs):
+    return inputs
+
+
+def on_step(step):
+    pass
+
+
+class Summary(BaseModel):
+    text: str
+
+
+class ErrorWithArgs(Exception):
+    def __init__(self, code, reason):
+        super().__init__(f"{code}: {reason}")
+
+
+def _spec_crew():
+    researcher = Agent(
+        role="{topic} Researcher",
+        goal="Research {topic}",
+        backstory="A researcher.",
+        llm=LLM(model="gpt-4o-mini", temperature=0.2, api_key="secret"),
+        tools=[lookup],
+        max_iter=5,
+    )
+    writer = Agent(role="Writer", goal="Write", backstory="A writer.")
+    research = Task(
+        description="Research {topic}.",
+        expected_output="Notes",
+        agent=researcher,
+        async_execution=True,
+    )
+    summary = Task(
+        description="Summarize {topic}.",
+        expected_output="A summary",
+        agent=writer,
+        context=[research],
+        output_pydantic=Summary,
+    )
+    return Crew(
+        agents=[researcher, writer],
+        tasks=[research, summary],
+        process=Process.sequential,
+        max_rpm=30,
+    )
+
+
+def _fake_kickoff(crew, inputs=None):
+    if inputs["topic"] == "error":
+        raise ErrorWithArgs(500, "provider down")
+    crew.usage_metrics = UsageMetrics(total_tokens=10, successful_requests=1)
+    return CrewOutput(raw=f"{crew.agents[0].role} done")
+
+
+def test_crew_spec_round_trips_through_json():
+    spec = CrewSpec.from_crew(_spec_crew())
+    assert "secret" not in spec.model_dump_json()
+
+    crew = CrewSpec.model_validate_json(spec.model_dump_json()).build()
+
+    researcher, writer = crew.agents
+    assert researcher.role == "{topic} Researcher"
+    assert researcher.max_iter == 5
+    assert researcher.llm.model == "gpt-4o-mini"
+    assert researcher.llm.temperature == 0.2
+    assert [agent_tool.name for agent_tool in researcher.tools] == ["lookup"]
+    assert researcher.tools[0].run(query="crewai") == "crewai"
+    research, summary = crew.tasks
+    assert research.agent is researcher and summary.agent is writer
+    assert research.async_execution
+    assert summary.context == [research]
+    assert summary.output_pydantic is Summary
+    assert crew.max_rpm == 30
+
+
+def test_crew_spec_uses_original_templates_after_interpolation():
+    crew = _spec_crew()
+    crew._interpolate_inputs({"topic": "AI"})
+
+    spec = CrewSpec.from_crew(crew)
+
+    assert spec.agents[0].role == "{topic} Researcher"
+    assert spec.tasks[0].description == "Research {topic}."
+
+
+def test_crew_spec_rejects_objects_without_import_path():
+    crew = _spec_crew()
+    crew.tasks[1].callback = lambda output: None
+
+    with pytest.raises(ValueError, match="cannot be imported by path"):
+        CrewSpec.from_crew(crew)
+
+
+def test_crew_spec_keeps_explicit_tool_names_and_descriptions():
+    crew = _spec_crew()
+    crew.agents[1].tools = [
+        Tool(
+            name="web_lookup",
+            description="Searches the web for recent news.",
+            func=search_web,
+            timeout=5,
+        )
+    ]
+
+    spec = CrewSpec.model_validate_json(CrewSpec.from_crew(crew).model_dump_json())
+    (rebuilt,) = spec.build().agents[1].tools
+
+    assert rebuilt.name == "web_lookup"
+    assert rebuilt.description == crew.agents[1].tools[0].description
+    assert rebuilt.timeout == 5
+    assert rebuilt.run(query="crewai") == "crewai"
+
+
+def test_crew_spec_round_trips_manager_agent_and_callbacks():
+    crew = _spec_crew()
+    crew.agents[0].llm.hedging_policy = HedgingPolicy(percentile=90, min_samples=5)
+    manager = Agent(
+        role="Manager",
+        goal="Manage",
+        backstory="A manager.",
+        llm=LLM(model="gpt-4o", stream=True),
+    )
+    crew = Crew(
+        agents=crew.agents,
+        tasks=crew.tasks,
+        process=Process.hierarchical,
+        manager_agent=manager,
+        step_callback=on_step,
+        before_kickoff_callbacks=[before_kickoff],
+    )
+
+    spec = CrewSpec.model_validate_json(CrewSpec.from_crew(crew).model_dump_json())
+    rebuilt = spec.build()
+
+    assert rebuilt.manager_agent.role == "Manager"
+    assert rebuilt.manager_agent.llm.stream
+    assert rebuilt.step_callback is on_step
+    assert rebuilt.before_kickoff_callbacks == [before_kickoff]
+    hedging_policy = rebuilt.agents[0].llm.hedging_policy
+    assert (hedging_policy.percentile, hedging_policy.min_samples) == (90, 5)
+
+
+def test_crew_spec_rejects_knowledge_sources():
+    crew = _spec_crew()
+    crew.knowledge_sources = [StringKnowledgeSource(content="Facts.")]
+
+    with pytest.raises(ValueError, match="Crew.knowledge_sources cannot be serialized"):
+        CrewSpec.from_crew(crew)
+
+
+def test_crew_spec_tool_paths_override():
+    spec = CrewSpec.from_crew(
+        _spec_crew(), tool_paths={"lookup": "crew_spec_test_tools:configured"}
+    )
+
+    assert spec.agents[0].tools[0].path == "crew_spec_test_tools:configured"
+
+
+def test_worker_reuses_one_crew_and_reports_metrics():
+    _init_worker(CrewSpec.from_crew(_spec_crew()).model_dump_json())
+
+    with patch.object(Crew, "kickoff", autospec=True, side_effect=_fake_kickoff):
+        result, (usage_metrics, stats) = _run_input(0, {"topic": "AI"})
+        failed, _ = _run_input(1, {"topic": "error"})
+
+    assert result.output.raw == "{topic} Researcher done"
+    assert usage_metrics.total_tokens == 10
+    assert stats.calls == 0
+    assert not failed.succeeded
+    # The original class needs constructor arguments, so it cannot be unpickled
+    assert isinstance(failed.error, RuntimeError)
+    assert "ErrorWithArgs: 500: provider down" in str(failed.error)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="patching kickoff in workers needs the fork start method",
+)
+def test_process_batch_runner_runs_inputs_on_workers():
+    with patch.object(Crew, "kickoff", autospec=True, side_effect=_fake_kickoff):
+        with ProcessBatchRunner.from_crew(
+            _spec_crew(), processes=2, mp_context=multiprocessing.get_context("fork")
+        ) as runner:
+            results = list(
+                runner.kickoff_batch(
+                    ({"topic": topic} for topic in ["AI", "error", "ML"]),
+                    ordered=True,
+                )
+            )
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert results[0].output.raw == "{topic} Researcher done"
+    assert runner.usage_metrics.total_tokens == 20
+    assert runner.usage_metrics.successful_requests == 2
+
+
+def test_process_batch_runner_rejects_zero_processes():
+    with pytest.raises(ValueError, match="processes must be at least 1"):
+        ProcessBatchRunner(CrewSpec.from_crew(_spec_crew()), processes=0)
@@ -1,7 +1,9 @@
 """Test Agent creation and execution basic functionality."""
 
+import asyncio
 import hashlib
 import json
+import threading
 from concurrent.futures import Future
 from unittest import mock
 from unittest.mock import MagicMock, patch
@@ -889,7 +891,7 @@ def test_api_calls_throttling(capsys):
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting for the oldest request to leave the window." in captured.out
         moveon.assert_called()
 
 
@@ -924,6 +926,12 @@ def test_crew_kickoff_usage_metrics():
         assert result.token_usage.completion_tokens > 0
         assert result.token_usage.successful_requests > 0
         assert result.token_usage.cached_prompt_tokens == 0
+        assert result.performance_metrics.llm_calls > 0
+        assert result.performance_metrics.latency_p50 is not None
+
+    assert crew.performance_metrics.llm_calls == sum(
+        result.performance_metrics.llm_calls for result in results
+    )
 
 
 def test_agents_rpm_is_never_set_if_crew_max_RPM_is_not_set():
@@ -1396,6 +1404,50 @@ async def test_async_kickoff_for_each_async_empty_input():
     assert results == [], "Result should be an empty list when input is empty"
 
 
+@pytest.mark.asyncio
+async def test_crew_akickoff_awaits_llm_natively():
+    """Tests that akickoff runs the tasks through LLM.acall."""
+    from unittest.mock import AsyncMock
+
+    from crewai.llm import LLM
+
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+    )
+
+    first_task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="1 bullet point about {topic} that's under 15 words.",
+        agent=agent,
+        async_execution=True,
+    )
+    second_task = Task(
+        description="Summarize the analysis around {topic}.",
+        expected_output="1 sentence about {topic}.",
+        agent=agent,
+    )
+
+    crew = Crew(agents=[agent], tasks=[first_task, second_task])
+
+    with (
+        patch.object(
+            LLM,
+            "acall",
+            new_callable=AsyncMock,
+            return_value="Thought: I now know the final answer\nFinal Answer: Dogs are loyal.",
+        ) as acall,
+        patch.object(LLM, "call") as call,
+    ):
+        result = await crew.akickoff(inputs={"topic": "dog"})
+
+    assert result.raw == "Dogs are loyal."
+    assert len(result.tasks_output) == 2
+    assert acall.await_count == 2
+    call.assert_not_called()
+
+
 def test_set_agents_step_callback():
     from unittest.mock import patch
 
@@ -1985,6 +2037,7 @@ def test_tools_with_custom_caching():
                 tool="multiplcation_tool",
                 input={"first_number": 2, "second_number": 6},
                 output=12,
+                persist=True,
             )
             assert result.raw == "3"
 
@@ -3247,6 +3300,24 @@ def test_multimodal_flag_adds_multimodal_tools():
         assert len(used_tools) == 1, "Should only have the AddImageTool"
 
 
+def test_max_tool_result_size_adds_the_result_reader_tool():
+    from crewai.tools.agent_tools.read_tool_result_tool import ReadToolResultTool
+
+    agent = Agent(
+        role="Scraper",
+        goal="Scrape pages",
+        backstory="You scrape pages.",
+        allow_delegation=False,
+        max_tool_result_size=10_000,
+    )
+    task = Task(description="Scrape", expected_output="Pages", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task])
+
+    tools = crew._prepare_tools(agent, task, [])
+
+    assert [type(tool) for tool in tools] == [ReadToolResultTool]
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 def test_multimodal_agent_image_tool_handling():
     """
@@ -3596,3 +3667,403 @@ def test_before_kickoff_without_inputs():
     # Verify that the inputs were initialized and modified inside the before_kickoff method
     assert test_crew_instance.received_inputs is not None
     assert test_crew_instance.received_inputs.get("modified") is True
+
+
+
+def _graph_agents(count):
+    return [
+        Agent(role=f"Analyst {i}", goal="Analyze", backstory="An analyst.")
+        for i in range(count)
+    ]
+
+
+def _fake_execute_core(on_start=None):
+    def execute_core(task, agent=None, context=None, tools=None):
+        if on_start:
+            on_start(task, context)
+        task.output = TaskOutput(
+            description=task.description, raw=f"{task.name} done", agent=agent.role
+        )
+        return task.output
+
+    return execute_core
+
+
+def test_graph_process_runs_independent_branches_in_parallel():
+    agents = _graph_agents(4)
+    branches = [
+        Task(
+            name=f"branch {i}",
+            description=f"Branch {i}",
+            expected_output="x",
+            agent=agents[i],
+            context=[],
+        )
+        for i in range(3)
+    ]
+    summary = Task(
+        name="summary",
+        description="Summarize",
+        expected_output="x",
+        agent=agents[3],
+        context=branches,
+        async_execution=True,
+    )
+    # All three branches must be in flight at once to get past the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    contexts = {}
+
+    def on_start(task, context):
+        contexts[task.name] = context
+        if task is not summary:
+            barrier.wait()
+
+    crew = Crew(agents=agents, tasks=[*branches, summary], process=Process.graph)
+    with patch.object(
+        Task, "_execute_core", autospec=True, side_effect=_fake_execute_core(on_start)
+    ):
+        result = crew.kickoff()
+
+    assert result.raw == "summary done"
+    assert [output.raw for output in result.tasks_output] == [
+        "branch 0 done",
+        "branch 1 done",
+        "branch 2 done",
+        "summary done",
+    ]
+    assert all(f"branch {i} done" in contexts["summary"] for i in range(3))
+
+
+def test_graph_process_serializes_tasks_sharing_an_agent():
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def on_start(task, context):
+        with lock:
+            in_flight.append(task)
+            peak.append(len(in_flight))
+        with lock:
+            in_flight.remove(task)
+
+    agent = _graph_agents(1)[0]
+    tasks = [
+        Task(description=f"Task {i}", expected_output="x", agent=agent, context=[])
+        for i in range(4)
+    ]
+    crew = Crew(agents=[agent], tasks=tasks, process=Process.graph)
+    with patch.object(
+        Task, "_execute_core", autospec=True, side_effect=_fake_execute_core(on_start)
+    ) as execute_core:
+        crew.kickoff()
+
+    assert execute_core.call_count == 4
+    assert max(peak) == 1
+
+
+def test_graph_process_defaults_to_the_previous_task_and_stores_logs():
+    agents = _graph_agents(2)
+    first = Task(
+        name="first", description="First", expected_output="x", agent=agents[0]
+    )
+    second = Task(
+        name="second", description="Second", expected_output="x", agent=agents[1]
+    )
+    contexts = {}
+    crew = Crew(agents=agents, tasks=[first, second], process=Process.graph)
+
+    with (
+        patch.object(
+            Task,
+            "_execute_core",
+            autospec=True,
+            side_effect=_fake_execute_core(
+                lambda task, context: contexts.setdefault(task.name, context)
+            ),
+        ),
+        patch.object(Crew, "_store_execution_log") as store_execution_log,
+    ):
+        crew.kickoff()
+
+    assert contexts == {"first": "", "second": "first done"}
+    assert [call.args[2] for call in store_execution_log.call_args_list] == [0, 1]
+
+
+def test_graph_process_skips_conditional_tasks():
+    agents = _graph_agents(2)
+    first = Task(
+        name="first", description="First", expected_output="x", agent=agents[0]
+    )
+    condition = MagicMock(return_value=False)
+    second = ConditionalTask(
+        description="Second", expected_output="x", agent=agents[1], condition=condition
+    )
+    crew = Crew(agents=agents, tasks=[first, second], process=Process.graph)
+
+    with patch.object(
+        Task, "_execute_core", autospec=True, side_effect=_fake_execute_core()
+    ) as execute_core:
+        result = crew.kickoff()
+
+    assert execute_core.call_count == 1
+    condition.assert_called_once_with(first.output)
+    assert second.output is None
+    assert result.raw == "first done"
+
+
+def test_graph_process_cancels_pending_tasks_on_failure():
+    agents = _graph_agents(2)
+    failing = Task(
+        name="failing", description="Fail", expected_output="x", agent=agents[0]
+    )
+    dependent = Task(
+        name="dependent",
+        description="Depends",
+        expected_output="x",
+        agent=agents[1],
+        context=[failing],
+    )
+
+    def on_start(task, context):
+        if task is failing:
+            raise RuntimeError("provider down")
+
+    crew = Crew(agents=agents, tasks=[failing, dependent], process=Process.graph)
+    with patch.object(
+        Task, "_execute_core", autospec=True, side_effect=_fake_execute_core(on_start)
+    ) as execute_core:
+        with pytest.raises(RuntimeError, match="provider down"):
+            crew.kickoff()
+
+    assert execute_core.call_count == 1
+    assert dependent.output is None
+
+
+def test_graph_process_allows_async_tasks_in_async_context():
+    agents = _graph_agents(2)
+    first = Task(
+        description="First", expected_output="x", agent=agents[0], async_execution=True
+    )
+    second = Task(
+        description="Second",
+        expected_output="x",
+        agent=agents[1],
+        async_execution=True,
+        context=[first],
+    )
+
+    Crew(agents=agents, tasks=[first, second], process=Process.graph)
+    with pytest.raises(ValueError):
+        Crew(agents=agents, tasks=[first, second], process=Process.sequential)
+
+
+def test_async_task_failure_is_raised_and_cancels_queued_tasks():
+    agents = _graph_agents(4)
+    tasks = [
+        Task(
+            name=f"async {i}",
+            description=f"Async {i}",
+            expected_output="x",
+            agent=agents[i],
+            async_execution=True,
+        )
+        for i in range(3)
+    ]
+    final = Task(
+        name="final", description="Final", expected_output="x", agent=agents[3]
+    )
+    started = []
+    release = threading.Event()
+
+    def on_start(task, context):
+        started.append(task.name)
+        if task.name == "async 0":
+            raise RuntimeError("provider down")
+        # Keeps "async 2" queued until the failure has been raised
+        release.wait(5)
+
+    crew = Crew(agents=agents, tasks=[*tasks, final], max_parallel_tasks=1)
+    with patch.object(
+        Task, "_execute_core", autospec=True, side_effect=_fake_execute_core(on_start)
+    ):
+        with pytest.raises(RuntimeError, match="provider down"):
+            crew.kickoff()
+        release.set()
+
+    assert started[0] == "async 0"
+    assert "async 2" not in started
+    assert tasks[2].output is None
+
+
+@pytest.mark.asyncio
+async def test_akickoff_async_task_failure_cancels_sibling_tasks():
+    agents = _graph_agents(3)
+    tasks = [
+        Task(
+            name=f"async {i}",
+            description=f"Async {i}",
+            expected_output="x",
+            agent=agents[i],
+            async_execution=True,
+        )
+        for i in range(2)
+    ]
+    final = Task(
+        name="final", description="Final", expected_output="x", agent=agents[2]
+    )
+    cancelled = []
+
+    async def aexecute_sync(task, agent=None, context=None, tools=None):
+        if task.name == "async 0":
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(task.name)
+            raise
+
+    crew = Crew(agents=agents, tasks=[*tasks, final])
+    with patch.object(Task, "aexecute_sync", autospec=True, side_effect=aexecute_sync):
+        with pytest.raises(RuntimeError, match="provider down"):
+            await crew.akickoff()
+
+    assert cancelled == ["async 1"]
+
+
+
+def _batch_crew():
+    agent = Agent(role="{topic} Researcher", goal="Research", backstory="A researcher.")
+    task = Task(description="Analyze {topic}.", expected_output="x", agent=agent)
+    return Crew(agents=[agent], tasks=[task])
+
+
+def _fake_kickoff(on_kickoff=None):
+    def kickoff(crew, inputs=None):
+        if on_kickoff:
+            on_kickoff(inputs)
+        crew.usage_metrics = UsageMetrics(total_tokens=10, successful_requests=1)
+        return CrewOutput(raw=f"{inputs['topic']} done")
+
+    return kickoff
+
+
+def test_kickoff_batch_yields_in_completion_or_input_order():
+    for ordered in (False, True):
+        cat_done = threading.Event()
+        first_yielded = threading.Event()
+
+        def on_kickoff(inputs):
+            if inputs["topic"] == "dog":
+                # Unordered, hold dog until cat has been yielded on its own
+                (cat_done if ordered else first_yielded).wait(5)
+            else:
+                cat_done.set()
+
+        crew = _batch_crew()
+        with patch.object(
+            Crew, "kickoff", autospec=True, side_effect=_fake_kickoff(on_kickoff)
+        ):
+            batch = crew.kickoff_batch(
+                [{"topic": "dog"}, {"topic": "cat"}],
+                max_concurrency=2,
+                ordered=ordered,
+            )
+            results = [next(batch)]
+            first_yielded.set()
+            results.extend(batch)
+
+        order = [result.output.raw for result in results]
+        if ordered:
+            assert order == ["dog done", "cat done"]
+        else:
+            assert order == ["cat done", "dog done"]
+
+
+def test_kickoff_batch_reads_inputs_lazily_and_bounds_concurrency():
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+    pulled = []
+
+    def inputs():
+        for i in range(8):
+            pulled.append(i)
+            yield {"topic": str(i)}
+
+    def on_kickoff(input_data):
+        with lock:
+            in_flight.append(input_data)
+            peak.append(len(in_flight))
+        with lock:
+            in_flight.remove(input_data)
+
+    crew = _batch_crew()
+    with (
+        patch.object(
+            Crew, "kickoff", autospec=True, side_effect=_fake_kickoff(on_kickoff)
+        ),
+        patch.object(Crew, "copy", autospec=True, side_effect=Crew.copy) as copy,
+    ):
+        results = crew.kickoff_batch(inputs(), max_concurrency=2)
+        next(results)
+        assert len(pulled) <= 3
+        assert copy.call_count <= 3
+        assert len(list(results)) == 7
+
+    assert max(peak) <= 2
+    assert crew.usage_metrics.total_tokens == 80
+    assert crew.usage_metrics.successful_requests == 8
+
+
+def test_kickoff_batch_isolates_failures():
+    def on_kickoff(inputs):
+        if inputs["topic"] == "cat":
+            raise RuntimeError("provider down")
+
+    crew = _batch_crew()
+    with patch.object(
+        Crew, "kickoff", autospec=True, side_effect=_fake_kickoff(on_kickoff)
+    ):
+        results = list(
+            crew.kickoff_batch(
+                [{"topic": "dog"}, {"topic": "cat"}, {"topic": "apple"}],
+                ordered=True,
+            )
+        )
+
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert str(results[1].error) == "provider down"
+    assert results[1].inputs == {"topic": "cat"}
+    assert results[2].output.raw == "apple done"
+    assert crew.usage_metrics.successful_requests == 2
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        next(crew.kickoff_batch([{"topic": "dog"}], max_concurrency=0))
+
+
+@pytest.mark.asyncio
+async def test_akickoff_batch_accepts_async_inputs():
+    async def inputs():
+        for topic in ("dog", "cat", "apple"):
+            yield {"topic": topic}
+
+    async def kickoff_async(crew, inputs=None):
+        if inputs["topic"] == "cat":
+            raise RuntimeError("provider down")
+        crew.usage_metrics = UsageMetrics(total_tokens=10)
+        return CrewOutput(raw=f"{inputs['topic']} done")
+
+    crew = _batch_crew()
+    with patch.object(Crew, "kickoff_async", autospec=True, side_effect=kickoff_async):
+        results = [
+            result
+            async for result in crew.akickoff_batch(
+                inputs(), max_concurrency=2, ordered=True
+            )
+        ]
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert results[0].output.raw == "dog done"
+    assert isinstance(results[1].error, RuntimeError)
+    assert crew.usage_metrics.total_tokens == 20
@@ -37,3 +37,677 @@ def test_llm_callback_replacement():
     assert usage_metrics_1.successful_requests == 1
     assert usage_metrics_2.successful_requests == 1
     assert usage_metrics_1 == calc_handler_1.token_cost_process.get_summary()
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_uses_acompletion():
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    llm = LLM(model="gpt-4o-mini")
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content="Hi!", tool_calls=[]))]
+
+    with (
+        patch("litellm.acompletion", new_callable=AsyncMock) as acompletion,
+        patch("litellm.completion") as completion,
+    ):
+        acompletion.return_value = response
+        result = await llm.acall(messages=[{"role": "user", "content": "Hello"}])
+
+    assert result == "Hi!"
+    acompletion.assert_awaited_once()
+    completion.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_awaits_coroutine_functions():
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    llm = LLM(model="gpt-4o-mini")
+    tool_call = MagicMock()
+    tool_call.id = "call_1"
+    tool_call.function.name = "get_weather"
+    tool_call.function.arguments = '{"city": "Lisbon"}'
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content="", tool_calls=[tool_call]))]
+    follow_up = MagicMock()
+    follow_up.choices = [MagicMock(message=MagicMock(content="Sunny.", tool_calls=[]))]
+
+    async def get_weather(city: str) -> str:
+        return f"Sunny in {city}"
+
+    with patch("litellm.acompletion", new_callable=AsyncMock) as acompletion:
+        acompletion.side_effect = [response, follow_up]
+        result = await llm.acall(
+            messages=[{"role": "user", "content": "Weather?"}],
+            tools=[{"type": "function", "function": {"name": "get_weather"}}],
+            available_functions={"get_weather": get_weather},
+        )
+
+    assert result == "Sunny."
+    assert acompletion.call_args_list[1].kwargs["messages"][-1]["content"] == (
+        "Sunny in Lisbon"
+    )
+
+
+def _stream_chunk(content=None, usage=None):
+    from unittest.mock import MagicMock
+
+    chunk = MagicMock()
+    chunk.choices = [MagicMock(delta=MagicMock(content=content))] if content else []
+    chunk.usage = usage
+    return chunk
+
+
+def test_llm_stream_stops_at_observation():
+    from unittest.mock import MagicMock, patch
+
+    consumed = []
+
+    def chunks():
+        for content in [
+            "Thought: search\nAction: Search\n",
+            'Action Input: {"q": "x"}\nObserv',
+            "ation: made up result",
+            "\nFinal Answer: hallucinated",
+        ]:
+            consumed.append(content)
+            yield _stream_chunk(content)
+
+    streamed = []
+    llm = LLM(
+        model="gpt-4o-mini",
+        stop=["\nObservation:"],
+        stream=True,
+        stream_callback=streamed.append,
+    )
+    response = MagicMock()
+    response.__iter__.side_effect = lambda: chunks()
+
+    with patch("litellm.completion", return_value=response) as completion:
+        result = llm.call(messages=[{"role": "user", "content": "Hello"}])
+
+    assert result == 'Thought: search\nAction: Search\nAction Input: {"q": "x"}'
+    assert "".join(streamed) == result
+    assert "Observ" not in "".join(streamed)
+    assert len(consumed) == 3
+    assert completion.call_args.kwargs["stream"] is True
+
+
+def test_llm_stream_reports_usage():
+    from unittest.mock import MagicMock, patch
+
+    from litellm import Usage
+
+    usage = Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+    response = MagicMock()
+    response.__iter__.side_effect = lambda: iter(
+        [_stream_chunk("Final Answer: "), _stream_chunk("done"), _stream_chunk(usage=usage)]
+    )
+    token_process = TokenProcess()
+    llm = LLM(model="gpt-4o-mini", stream=True)
+
+    with patch("litellm.completion", return_value=response):
+        result = llm.call(
+            messages=[{"role": "user", "content": "Hello"}],
+            callbacks=[TokenCalcHandler(token_process)],
+        )
+
+    assert result == "Final Answer: done"
+    summary = token_process.get_summary()
+    assert summary.prompt_tokens == 10
+    assert summary.completion_tokens == 5
+    assert summary.successful_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_astream_stops_at_observation():
+    from unittest.mock import AsyncMock, patch
+
+    class AsyncChunks:
+        def __init__(self, contents):
+            self.contents = iter(contents)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return _stream_chunk(next(self.contents))
+            except StopIteration:
+                raise StopAsyncIteration
+
+    llm = LLM(model="gpt-4o-mini", stop=["\nObservation:"], stream=True)
+
+    with patch("litellm.acompletion", new_callable=AsyncMock) as acompletion:
+        acompletion.return_value = AsyncChunks(
+            ["Action: Search\nAction Input: {}", "\nObservation: nope"]
+        )
+        result = await llm.acall(messages=[{"role": "user", "content": "Hello"}])
+
+    assert result == "Action: Search\nAction Input: {}"
+
+
+def test_llm_response_cache_serves_identical_calls(tmp_path):
+    from unittest.mock import MagicMock, patch
+
+    from crewai.utilities.llm_response_cache import LLMResponseCache
+
+    cache = LLMResponseCache(db_path=str(tmp_path / "cache.db"))
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content="Paris", tool_calls=[]))]
+    response.usage = None
+    token_process = TokenProcess()
+    callbacks = [TokenCalcHandler(token_process)]
+    messages = [{"role": "user", "content": "Capital of France?"}]
+
+    with patch("litellm.completion", return_value=response) as completion:
+        first = LLM(model="gpt-4o-mini", response_cache=cache).call(
+            messages, callbacks=callbacks
+        )
+        second = LLM(model="gpt-4o-mini", response_cache=cache).call(
+            messages, callbacks=callbacks
+        )
+        LLM(model="gpt-4o-mini", temperature=0.5, response_cache=cache).call(
+            messages, callbacks=callbacks
+        )
+
+    assert first == second == "Paris"
+    assert completion.call_count == 2
+    summary = token_process.get_summary()
+    assert summary.llm_cache_hits == 1
+    assert summary.llm_cache_misses == 2
+
+
+def test_llm_response_cache_ttl_and_lru_eviction(tmp_path):
+    from unittest.mock import patch
+
+    from crewai.utilities.llm_response_cache import LLMResponseCache
+
+    cache = LLMResponseCache(db_path=str(tmp_path / "cache.db"), max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    assert cache.set("c", "3") == 1
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+    ttl_cache = LLMResponseCache(db_path=str(tmp_path / "ttl.db"), ttl=10)
+    with patch("time.time", return_value=1000.0):
+        ttl_cache.set("a", "1")
+    with patch("time.time", return_value=1011.0):
+        assert ttl_cache.get("a") is None
+
+
+def test_llm_response_cache_key_covers_every_generation_param():
+    from crewai.utilities.llm_response_cache import LLMResponseCache
+
+    messages = [{"role": "user", "content": "Hi"}]
+    base = LLM(model="gpt-4o-mini", api_key="key-1")._prepare_completion_params(
+        messages
+    )
+    key = LLMResponseCache.make_key(base)
+
+    for llm in (
+        LLM(model="gpt-4o-mini", stop=["\nObservation:"]),
+        LLM(model="gpt-4o-mini", max_tokens=10),
+        LLM(model="gpt-4o-mini", top_p=0.5),
+        LLM(model="gpt-4o-mini", n=2),
+        LLM(model="gpt-4o-mini", logit_bias={1: 1.0}),
+    ):
+        assert LLMResponseCache.make_key(
+            llm._prepare_completion_params(messages)
+        ) != key
+
+    same = LLM(model="gpt-4o-mini", api_key="key-2", timeout=5)
+    assert LLMResponseCache.make_key(same._prepare_completion_params(messages)) == key
+
+
+def test_llm_response_cache_single_flight(tmp_path):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from crewai.utilities.llm_response_cache import LLMResponseCache
+
+    cache = LLMResponseCache(db_path=str(tmp_path / "cache.db"))
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(cache.get_or_compute, "key", compute) for _ in range(4)]
+        while not calls:
+            sleep(0.01)
+        sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert [result[0] for result in results] == ["result"] * 4
+    assert sorted(result[1] for result in results) == [False, True, True, True]
+
+
+def _tool_call(call_id, name, arguments):
+    from unittest.mock import MagicMock
+
+    tool_call = MagicMock()
+    tool_call.id = call_id
+    tool_call.function.name = name
+    tool_call.function.arguments = arguments
+    return tool_call
+
+
+def test_llm_executes_parallel_tool_calls_concurrently():
+    import threading
+    from unittest.mock import MagicMock, patch
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_weather(city: str) -> str:
+        barrier.wait()
+        return f"Sunny in {city}"
+
+    first = MagicMock()
+    first.choices = [
+        MagicMock(
+            message=MagicMock(
+                content="",
+                tool_calls=[
+                    _tool_call("call_1", "get_weather", '{"city": "Lisbon"}'),
+                    _tool_call("call_2", "get_weather", '{"city": "Porto"}'),
+                    _tool_call("call_3", "get_weather", '{"city": "Faro"}'),
+                ],
+            )
+        )
+    ]
+    second = MagicMock()
+    second.choices = [MagicMock(message=MagicMock(content="All sunny.", tool_calls=[]))]
+
+    llm = LLM(model="gpt-4o-mini")
+    tools = [{"type": "function", "function": {"name": "get_weather"}}]
+    with patch("litellm.completion", side_effect=[first, second]) as completion:
+        result = llm.call(
+            messages=[{"role": "user", "content": "Weather?"}],
+            tools=tools,
+            available_functions={"get_weather": get_weather},
+        )
+
+    assert result == "All sunny."
+    assert completion.call_count == 2
+    follow_up = completion.call_args_list[1].kwargs["messages"]
+    assert [message["role"] for message in follow_up] == [
+        "user",
+        "assistant",
+        "tool",
+        "tool",
+        "tool",
+    ]
+    assert [message["content"] for message in follow_up[2:]] == [
+        "Sunny in Lisbon",
+        "Sunny in Porto",
+        "Sunny in Faro",
+    ]
+
+
+def _tool_response(content, tool_calls):
+    from unittest.mock import MagicMock
+
+    response = MagicMock()
+    response.choices = [
+        MagicMock(message=MagicMock(content=content, tool_calls=tool_calls))
+    ]
+    return response
+
+
+def test_llm_single_tool_call_result_goes_back_to_the_model():
+    from unittest.mock import patch
+
+    llm = LLM(model="gpt-4o-mini")
+    responses = [
+        _tool_response("", [_tool_call("call_1", "add", '{"a": 1, "b": 2}')]),
+        _tool_response("The sum is 3.", []),
+    ]
+    with patch("litellm.completion", side_effect=responses) as completion:
+        result = llm.call(
+            messages=[{"role": "user", "content": "1 + 2?"}],
+            tools=[{"type": "function", "function": {"name": "add"}}],
+            available_functions={"add": lambda a, b: a + b},
+        )
+
+    assert result == "The sum is 3."
+    assert completion.call_args_list[1].kwargs["messages"][-1]["content"] == "3"
+
+
+def test_llm_keeps_running_tools_the_model_requests_in_follow_up_turns():
+    from unittest.mock import patch
+
+    llm = LLM(model="gpt-4o-mini")
+    responses = [
+        _tool_response(
+            "",
+            [
+                _tool_call("call_1", "add", '{"a": 1, "b": 2}'),
+                _tool_call("call_2", "add", '{"a": 3, "b": 4}'),
+            ],
+        ),
+        _tool_response("", [_tool_call("call_3", "add", '{"a": 3, "b": 7}')]),
+        _tool_response("The total is 10.", []),
+    ]
+    with patch("litellm.completion", side_effect=responses) as completion:
+        result = llm.call(
+            messages=[{"role": "user", "content": "(1 + 2) + (3 + 4)?"}],
+            tools=[{"type": "function", "function": {"name": "add"}}],
+            available_functions={"add": lambda a, b: a + b},
+        )
+
+    assert result == "The total is 10."
+    assert completion.call_count == 3
+    last_messages = completion.call_args_list[2].kwargs["messages"]
+    assert [message["content"] for message in last_messages[-4:]] == [
+        "3",
+        "7",
+        None,
+        "10",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_executes_parallel_tool_calls():
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    started = []
+
+    async def get_weather(city: str) -> str:
+        started.append(city)
+        await asyncio.sleep(0.05)
+        assert len(started) == 2
+        return f"Sunny in {city}"
+
+    def broken(city: str) -> str:
+        raise RuntimeError("boom")
+
+    first = MagicMock()
+    first.choices = [
+        MagicMock(
+            message=MagicMock(
+                content="",
+                tool_calls=[
+                    _tool_call("call_1", "get_weather", '{"city": "Lisbon"}'),
+                    _tool_call("call_2", "get_weather", '{"city": "Porto"}'),
+                    _tool_call("call_3", "broken", '{"city": "Faro"}'),
+                ],
+            )
+        )
+    ]
+    second = MagicMock()
+    second.choices = [MagicMock(message=MagicMock(content="Done.", tool_calls=[]))]
+
+    llm = LLM(model="gpt-4o-mini")
+    with patch("litellm.acompletion", new_callable=AsyncMock) as acompletion:
+        acompletion.side_effect = [first, second]
+        result = await llm.acall(
+            messages=[{"role": "user", "content": "Weather?"}],
+            tools=[{"type": "function", "function": {"name": "get_weather"}}],
+            available_functions={"get_weather": get_weather, "broken": broken},
+        )
+
+    assert result == "Done."
+    tool_messages = acompletion.call_args_list[1].kwargs["messages"][2:]
+    assert tool_messages[0]["content"] == "Sunny in Lisbon"
+    assert "boom" in tool_messages[2]["content"]
+
+
+def test_model_capabilities_are_resolved_once_per_model():
+    from unittest.mock import patch
+
+    from crewai.llm import DEFAULT_CONTEXT_WINDOW_SIZE, LLM_CONTEXT_WINDOW_SIZES
+    from crewai.utilities.model_capabilities import ModelCapabilityRegistry
+
+    registry = ModelCapabilityRegistry(
+        LLM_CONTEXT_WINDOW_SIZES, DEFAULT_CONTEXT_WINDOW_SIZE
+    )
+    with patch(
+        "crewai.utilities.model_capabilities.get_supported_openai_params",
+        return_value=["stop", "response_format"],
+    ) as get_params:
+        registry.warm(["gpt-4o-mini"])
+        capabilities = registry.get("gpt-4o-mini")
+        registry.get("gpt-4o-mini")
+
+    get_params.assert_called_once()
+    assert capabilities.supports_stop_words is True
+    assert capabilities.supports_function_calling is True
+    assert capabilities.context_window == 128000
+    assert registry.get("gpt-4-0613").context_window == 8192
+    assert registry.get("unknown-model").context_window == DEFAULT_CONTEXT_WINDOW_SIZE
+
+
+def test_model_capabilities_override():
+    from crewai.llm import MODEL_CAPABILITIES
+
+    MODEL_CAPABILITIES.override("my-local-model", context_window=32000)
+    try:
+        llm = LLM(model="my-local-model")
+        assert llm.get_context_window_size() == int(32000 * 0.75)
+        with pytest.raises(ValueError):
+            MODEL_CAPABILITIES.override("my-local-model", unknown=True)
+    finally:
+        MODEL_CAPABILITIES.clear()
+
+
+def test_llm_call_records_latency_and_errors():
+    from unittest.mock import MagicMock, patch
+
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content="Hi!", tool_calls=[]))]
+    response.usage = None
+    token_process = TokenProcess()
+    handler = TokenCalcHandler(token_process, agent_role="Researcher", task_id="t-1")
+    llm = LLM(model="gpt-4o-mini")
+
+    with patch("litellm.completion", return_value=response):
+        llm.call([{"role": "user", "content": "Hello"}], callbacks=[handler])
+    with patch("litellm.completion", side_effect=RuntimeError("503 upstream")):
+        with pytest.raises(RuntimeError):
+            llm.call([{"role": "user", "content": "Hello"}], callbacks=[handler])
+
+    success, failure = token_process.llm_call_records
+    assert success.model == "gpt-4o-mini"
+    assert success.agent_role == "Researcher"
+    assert success.task_id == "t-1"
+    assert success.latency >= 0
+    assert success.error is None
+    assert failure.error == "503 upstream"
+
+    summary = token_process.performance.summary()
+    assert summary.llm_calls == 2
+    assert summary.llm_errors == 1
+
+
+def test_llm_stream_records_time_to_first_token():
+    from unittest.mock import MagicMock, patch
+
+    def chunks():
+        sleep(0.05)
+        yield _stream_chunk("Final Answer: ")
+        sleep(0.05)
+        yield _stream_chunk("done")
+
+    response = MagicMock()
+    response.__iter__.side_effect = lambda: chunks()
+    token_process = TokenProcess()
+    llm = LLM(model="gpt-4o-mini", stream=True)
+
+    with patch("litellm.completion", return_value=response):
+        llm.call(
+            [{"role": "user", "content": "Hello"}],
+            callbacks=[TokenCalcHandler(token_process)],
+        )
+
+    (record,) = token_process.llm_call_records
+    assert 0.04 < record.time_to_first_token < record.latency
+
+
+def test_performance_metrics_percentiles():
+    from crewai.types.performance_metrics import LLMCallRecord, PerformanceMetrics
+
+    records = [
+        LLMCallRecord(model="gpt-4o-mini", latency=float(latency))
+        for latency in range(1, 101)
+    ]
+    metrics = PerformanceMetrics.from_records(records)
+
+    assert metrics.llm_calls == 100
+    assert metrics.latency_p50 == 50.0
+    assert metrics.latency_p95 == 95.0
+    assert metrics.latency_p99 == 99.0
+    assert metrics.time_to_first_token_p50 is None
+    assert "records" not in metrics.model_dump()
+    assert PerformanceMetrics.from_records([]).latency_p50 is None
+
+
+def test_performance_stats_keep_exact_counts_with_bounded_samples():
+    from crewai.types.performance_metrics import LLMCallRecord, PerformanceStats
+
+    stats = PerformanceStats(max_samples=10)
+    for latency in range(1, 101):
+        stats.add(LLMCallRecord(model="gpt-4o-mini", latency=float(latency)))
+    other = PerformanceStats(max_samples=10)
+    other.add(LLMCallRecord(model="gpt-4o-mini", latency=1.0, error="timeout"))
+    stats.merge(other)
+
+    summary = stats.summary()
+    assert summary.llm_calls == 101
+    assert summary.llm_errors == 1
+    assert summary.total_llm_time == sum(range(1, 101)) + 1.0
+    assert len(stats.latencies) == 10
+    # Percentiles come from the latest samples only
+    assert summary.latency_p99 == 100.0
+
+
+def _text_response(content):
+    from unittest.mock import MagicMock
+
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content, tool_calls=[]))]
+    response.usage = None
+    return response
+
+
+def test_llm_fails_over_to_fallback_on_server_error():
+    from unittest.mock import patch
+
+    import litellm
+
+    token_process = TokenProcess()
+    llm = LLM(
+        model="gpt-4o-mini",
+        api_key="openai-key",
+        base_url="https://openai.example.com",
+        fallbacks=["anthropic/claude-3-5-haiku-latest"],
+    )
+    unavailable = litellm.ServiceUnavailableError(
+        message="overloaded", llm_provider="openai", model="gpt-4o-mini"
+    )
+
+    with patch(
+        "litellm.completion", side_effect=[unavailable, _text_response("Hi!")]
+    ) as completion:
+        result = llm.call(
+            [{"role": "user", "content": "Hello"}],
+            callbacks=[TokenCalcHandler(token_process)],
+        )
+
+    assert result == "Hi!"
+    primary, fallback = completion.call_args_list
+    assert primary.kwargs["model"] == "gpt-4o-mini"
+    assert primary.kwargs["api_key"] == "openai-key"
+    assert fallback.kwargs["model"] == "anthropic/claude-3-5-haiku-latest"
+    # The fallback's provider resolves its own credentials and endpoint
+    assert "api_key" not in fallback.kwargs
+    assert "api_base" not in fallback.kwargs
+    assert fallback.kwargs["messages"] == primary.kwargs["messages"]
+    assert token_process.llm_call_records[0].retries == 1
+
+    # Client errors are not retried on another model
+    with patch("litellm.completion", side_effect=ValueError("bad request")):
+        with pytest.raises(ValueError):
+            llm.call([{"role": "user", "content": "Hello"}])
+
+
+def test_llm_hedges_slow_requests():
+    from unittest.mock import patch
+
+    from crewai.llm import HedgingPolicy
+
+    def completion(**params):
+        if params["model"] == "gpt-4o-mini":
+            sleep(1)
+            return _text_response("slow")
+        return _text_response("fast")
+
+    token_process = TokenProcess()
+    llm = LLM(
+        model="gpt-4o-mini",
+        fallbacks=["gpt-4o"],
+        hedging_policy=HedgingPolicy(initial_delay=0.05, min_delay=0.01),
+    )
+    with patch("litellm.completion", side_effect=completion):
+        result = llm.call(
+            [{"role": "user", "content": "Hello"}],
+            callbacks=[TokenCalcHandler(token_process)],
+        )
+
+    assert result == "fast"
+    (record,) = token_process.llm_call_records
+    assert (record.retries, record.hedges) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_llm_acall_hedge_cancels_slow_request():
+    import asyncio
+    from unittest.mock import patch
+
+    from crewai.llm import HedgingPolicy
+
+    cancelled = asyncio.Event()
+
+    async def acompletion(**params):
+        if params["model"] == "gpt-4o-mini":
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return _text_response(params["model"])
+
+    llm = LLM(
+        model="gpt-4o-mini",
+        fallbacks=["gpt-4o"],
+        hedging_policy=HedgingPolicy(initial_delay=0.05, min_delay=0.01),
+    )
+    with patch("litellm.acompletion", side_effect=acompletion):
+        result = await llm.acall([{"role": "user", "content": "Hello"}])
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert result == "gpt-4o"
+
+
+def test_hedging_policy_delay_tracks_latency_percentile():
+    from crewai.llm import HedgingPolicy
+
+    policy = HedgingPolicy(
+        percentile=90, initial_delay=3.0, min_delay=0.1, min_samples=10
+    )
+    assert policy.delay("gpt-4o-mini") == 3.0
+
+    for latency in range(1, 11):
+        policy.record("gpt-4o-mini", latency / 10)
+
+    assert policy.delay("gpt-4o-mini") == pytest.approx(0.9)
+    assert policy.delay("gpt-4o") == 3.0
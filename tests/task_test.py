@@ -202,6 +202,25 @@ def test_async_execution():
         execute.assert_called_once_with(task=task, context=None, tools=[])
 
 
+def test_execute_async_sets_the_exception_on_the_future():
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher.",
+        allow_delegation=False,
+    )
+    task = Task(
+        description="Give me a list of 5 interesting ideas.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        async_execution=True,
+        agent=researcher,
+    )
+
+    with patch.object(Agent, "execute_task", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError, match="boom"):
+            task.execute_async(agent=researcher).result(timeout=5)
+
+
 def test_multiple_output_type_error():
     class Output(BaseModel):
         field: str
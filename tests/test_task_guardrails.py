@@ -127,3 +127,29 @@ def test_guardrail_error_in_context():
 
     assert "Task failed guardrail validation" in str(exc_info.value)
     assert "Expected JSON, got string" in str(exc_info.value)
+
+
+def test_output_file_receives_output_before_guardrail():
+    """Test that the output file keeps the agent's output, not the guardrail's."""
+    from unittest.mock import patch
+
+    def guardrail(result: TaskOutput):
+        return (True, result.raw.upper())
+
+    agent = Mock()
+    agent.role = "test_agent"
+    agent.execute_task.return_value = "test result"
+    agent.crew = None
+
+    task = Task(
+        description="Test task",
+        expected_output="Output",
+        guardrail=guardrail,
+        output_file="output.txt",
+    )
+
+    with patch.object(Task, "_save_file") as save_file:
+        result = task.execute_sync(agent=agent)
+
+    assert result.raw == "TEST RESULT"
+    save_file.assert_called_once_with("test result")
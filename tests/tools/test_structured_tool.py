@@ -144,3 +144,160 @@ class InternalCrewStructuredTool:
             {"required_param": "test", "optional_param": "custom", "nullable_param": 42}
         )
         assert result == "test custom 42"
+
+
+def _fast_path_tool():
+    def search(query: str, limit: int = 10, exact: Optional[bool] = None) -> str:
+        """Search for something."""
+        return f"{query} {limit} {exact}"
+
+    return CrewStructuredTool.from_function(func=search, name="search")
+
+
+@pytest.mark.parametrize(
+    "raw_args",
+    [
+        {"query": "crewai"},
+        {"query": "crewai", "limit": 3, "exact": True},
+        {"query": "crewai", "exact": None, "unknown": "ignored"},
+        {"query": "crewai", "limit": "3"},
+        {"query": "crewai", "limit": True},
+    ],
+)
+def test_parse_args_fast_path_matches_validation(raw_args):
+    tool = _fast_path_tool()
+
+    expected = tool.args_schema.model_validate(raw_args).model_dump()
+    assert tool._parse_args(raw_args) == expected
+    assert type(tool._parse_args(raw_args)["limit"]) is int
+
+
+def test_parse_args_takes_fast_path_for_exact_types():
+    from unittest.mock import patch
+
+    tool = _fast_path_tool()
+    expected = tool.args_schema.model_validate({"query": "crewai"}).model_dump()
+
+    with patch.object(tool.args_schema, "model_validate", side_effect=AssertionError):
+        assert tool._parse_args({"query": "crewai"}) == expected
+
+
+def test_parse_args_fast_path_still_reports_missing_fields():
+    tool = _fast_path_tool()
+
+    assert tool._fast_fields is not None
+    with pytest.raises(ValueError, match="Arguments validation failed"):
+        tool._parse_args({"limit": 3})
+
+
+def test_fast_path_is_skipped_for_validated_schemas():
+    from pydantic import field_validator
+
+    class UpperSchema(BaseModel):
+        query: str
+
+        @field_validator("query")
+        @classmethod
+        def upper(cls, value: str) -> str:
+            return value.upper()
+
+    class ConstrainedSchema(BaseModel):
+        query: str = Field(max_length=3)
+
+    def search(query: str) -> str:
+        """Search for something."""
+        return query
+
+    upper = CrewStructuredTool.from_function(
+        func=search, name="search", args_schema=UpperSchema
+    )
+    constrained = CrewStructuredTool.from_function(
+        func=search, name="search", args_schema=ConstrainedSchema
+    )
+
+    assert upper.invoke({"query": "crew"}) == "CREW"
+    with pytest.raises(ValueError):
+        constrained.invoke({"query": "crewai"})
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"str_strip_whitespace": True},
+        {"str_to_lower": True},
+        {"strict": True},
+        {"coerce_numbers_to_str": True},
+        {"validate_default": True},
+    ],
+)
+def test_fast_path_is_skipped_for_transforming_config(config):
+    from pydantic import ConfigDict
+
+    class ConfiguredSchema(BaseModel):
+        model_config = ConfigDict(**config)
+
+        query: str
+        limit: int = 10
+
+    def search(query: str, limit: int = 10) -> str:
+        """Search for something."""
+        return query
+
+    tool = CrewStructuredTool.from_function(
+        func=search, name="search", args_schema=ConfiguredSchema
+    )
+
+    assert tool._fast_fields is None
+    assert tool._parse_args({"query": " CrewAI "}) == (
+        ConfiguredSchema.model_validate({"query": " CrewAI "}).model_dump()
+    )
+
+
+def test_schema_is_generated_once():
+    from unittest.mock import patch
+
+    tool = _fast_path_tool()
+
+    with patch.object(
+        tool.args_schema, "model_json_schema", side_effect=AssertionError
+    ):
+        for _ in range(3):
+            assert tool.accepted_args == {"query", "limit", "exact"}
+            assert set(tool.args) == {"query", "limit", "exact"}
+            tool.invoke({"query": "crewai"})
+
+
+def test_large_nested_schema_is_not_regenerated_per_call():
+    from unittest.mock import patch
+
+    from pydantic import create_model
+
+    leaf = create_model(
+        "Leaf", **{f"field_{i}": (Optional[str], None) for i in range(20)}
+    )
+    branch = create_model(
+        "Branch", **{f"leaf_{i}": (Optional[leaf], None) for i in range(10)}
+    )
+    schema = create_model(
+        "LargeSchema",
+        query=(str, ...),
+        **{f"branch_{i}": (Optional[branch], None) for i in range(10)},
+    )
+
+    def run(**kwargs) -> str:
+        """Run with a large schema."""
+        return kwargs["query"]
+
+    tool = CrewStructuredTool.from_function(func=run, name="run", args_schema=schema)
+    arguments = {"query": "crewai", "branch_0": {"leaf_0": {"field_0": "x"}}}
+
+    # Nested fields take the full validation path, but the schema is never
+    # rendered again and the result matches plain pydantic validation
+    assert tool._fast_fields is None
+    with patch.object(schema, "model_json_schema", side_effect=AssertionError):
+        for _ in range(3):
+            accepted = tool.accepted_args
+            assert (
+                tool._parse_args({k: v for k, v in arguments.items() if k in accepted})
+                == schema.model_validate(arguments).model_dump()
+            )
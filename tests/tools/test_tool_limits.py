@@ -0,0 +1,193 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai import Agent, Task
+from crewai.agents.tools_handler import ToolsHandler
+from crewai.tools import BaseTool, tool
+from crewai.tools.tool_calling import ToolCalling
+from crewai.tools.tool_limits import (
+    ToolTimeoutError,
+    acall_with_limits,
+    call_with_limits,
+    get_tool_semaphore,
+)
+from crewai.tools.tool_usage import ToolUsage
+
+
+def test_call_with_limits_abandons_a_hung_call():
+    release = threading.Event()
+
+    with pytest.raises(ToolTimeoutError, match="within 0.05 seconds"):
+        call_with_limits("hung", lambda: release.wait(5), timeout=0.05)
+    release.set()
+
+
+def test_call_with_limits_caps_in_flight_runs_across_callers():
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def run() -> None:
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.pop()
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        for _ in range(12):
+            pool.submit(call_with_limits, "capped", run, max_concurrency=2)
+
+    assert max(peak) == 2
+    assert get_tool_semaphore("capped", 2) is get_tool_semaphore("capped", 2)
+
+
+def test_call_with_limits_times_out_waiting_for_a_slot():
+    semaphore = get_tool_semaphore("busy", 1)
+    semaphore.acquire()
+    try:
+        with pytest.raises(ToolTimeoutError):
+            call_with_limits("busy", lambda: "ok", timeout=0.05, max_concurrency=1)
+    finally:
+        semaphore.release()
+
+    assert call_with_limits("busy", lambda: "ok", timeout=1, max_concurrency=1) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_acall_with_limits_cancels_coroutines():
+    cancelled = asyncio.Event()
+
+    async def hang() -> None:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(ToolTimeoutError):
+        await acall_with_limits("async-hung", hang, timeout=0.05, max_concurrency=1)
+
+    assert cancelled.is_set()
+    # The slot was released when the coroutine was cancelled
+    assert (
+        await acall_with_limits(
+            "async-hung", lambda: "ok", timeout=1, max_concurrency=1
+        )
+        == "ok"
+    )
+
+
+def test_timed_calls_run_on_the_shared_tool_pool():
+    thread_names = []
+
+    def run() -> str:
+        thread_names.append(threading.current_thread().name)
+        return "ok"
+
+    assert call_with_limits("pooled", run, timeout=1, max_concurrency=1) == "ok"
+    assert thread_names[0].startswith("crewai-tool")
+    # The slot is handed back once the pooled run is done
+    assert get_tool_semaphore("pooled", 1).acquire(blocking=False)
+    get_tool_semaphore("pooled", 1).release()
+
+
+@pytest.mark.asyncio
+async def test_acall_with_limits_waits_for_a_released_slot():
+    semaphore = get_tool_semaphore("async-busy", 1)
+    semaphore.acquire()
+    waiter = asyncio.create_task(
+        acall_with_limits("async-busy", lambda: "ok", timeout=5, max_concurrency=1)
+    )
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    semaphore.release()
+
+    assert await waiter == "ok"
+    assert semaphore.acquire(blocking=False)
+    semaphore.release()
+
+
+def test_base_tool_limits_reach_the_structured_tool():
+    class SlowTool(BaseTool):
+        name: str = "slow"
+        description: str = "Takes its time."
+        timeout: float = 0.05
+        max_concurrency: int = 3
+
+        def _run(self, seconds: float) -> str:
+            time.sleep(seconds)
+            return "done"
+
+    structured_tool = SlowTool().to_structured_tool()
+
+    assert structured_tool.timeout == 0.05
+    assert structured_tool.max_concurrency == 3
+    with pytest.raises(ToolTimeoutError):
+        structured_tool.invoke({"seconds": 1})
+    # A per-call timeout can only shorten the tool's own
+    assert structured_tool.invoke({"seconds": 0}, config={"timeout": 5}) == "done"
+
+
+def test_tool_usage_reports_timeouts_without_retrying():
+    calls = []
+    release = threading.Event()
+
+    @tool
+    def search(query: str) -> str:
+        """Search for something."""
+        calls.append(query)
+        release.wait(5)
+        return "late"
+
+    search.timeout = 0.05
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(description="test", expected_output="test", agent=agent)
+    tool_usage = ToolUsage(
+        tools_handler=ToolsHandler(),
+        tools=[search.to_structured_tool()],
+        original_tools=[search],
+        tools_description="",
+        tools_names=search.name,
+        task=task,
+        function_calling_llm=None,
+        agent=agent,
+        action=MagicMock(),
+    )
+
+    result = tool_usage.use(
+        ToolCalling(tool_name=search.name, arguments={"query": "crewai"}), ""
+    )
+    release.set()
+
+    assert result == agent.i18n.errors("tool_timeout").format(
+        tool=search.name, timeout="0.05"
+    )
+    assert calls == ["crewai"]
+    assert task.tools_errors == 1
+
+
+def test_executor_bounds_tools_by_the_agent_execution_time():
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        max_execution_time=30,
+    )
+    agent.create_agent_executor()
+    executor = agent.agent_executor
+
+    assert executor._remaining_time() is None
+    executor._start_clock()
+    assert 0 < executor._tool_usage(MagicMock()).timeout <= 30
+    assert not executor._is_out_of_time()
+
+    executor._deadline = time.monotonic() - 1
+    assert executor._is_out_of_time()
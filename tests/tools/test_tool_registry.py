@@ -0,0 +1,91 @@
+import random
+import string
+from difflib import SequenceMatcher
+from unittest.mock import patch
+
+from crewai.tools import BaseTool
+from crewai.tools.tool_registry import ToolRegistry
+
+
+class NamedTool(BaseTool):
+    description: str = "Test tool"
+
+    def _run(self, **kwargs) -> str:
+        return self.name
+
+
+def _tools(count=150):
+    rng = random.Random(7)
+    return [
+        NamedTool(
+            name=f"{rng.choice(['search', 'fetch', 'update', 'list'])}_"
+            f"{''.join(rng.choices(string.ascii_lowercase, k=8))}_{i}"
+        )
+        for i in range(count)
+    ]
+
+
+def _select_tool_by_scanning(tools, tool_name):
+    """The previous sort-everything implementation, used as a reference."""
+    order_tools = sorted(
+        tools,
+        key=lambda tool: SequenceMatcher(
+            None, tool.name.lower().strip(), tool_name.lower().strip()
+        ).ratio(),
+        reverse=True,
+    )
+    for tool in order_tools:
+        if (
+            tool.name.lower().strip() == tool_name.lower().strip()
+            or SequenceMatcher(
+                None, tool.name.lower().strip(), tool_name.lower().strip()
+            ).ratio()
+            > 0.85
+        ):
+            return tool
+    return None
+
+
+def test_get_matches_name_variants():
+    tool = NamedTool(name="Search the internet")
+    registry = ToolRegistry([tool, NamedTool(name="read_file")])
+
+    assert registry.get("Search the internet") is tool
+    assert registry.get("  search the INTERNET ") is tool
+    assert registry.get("search_the_internet") is tool
+    assert registry.get("read file").name == "read_file"
+    assert registry.get("search the web") is None
+    assert "SEARCH_THE_INTERNET" in registry
+    assert registry.names == ("search the internet", "read_file")
+
+
+def test_resolve_matches_previous_fuzzy_selection():
+    tools = _tools()
+    registry = ToolRegistry(tools)
+    rng = random.Random(3)
+
+    for tool in rng.sample(tools, 40):
+        name = list(tool.name)
+        name[rng.randrange(len(name))] = rng.choice(string.ascii_lowercase)
+        misspelled = "".join(name)
+        assert registry.resolve(misspelled) is _select_tool_by_scanning(
+            tools, misspelled
+        )
+
+    assert registry.resolve("delete everything") is None
+    assert registry.resolve("") is None
+
+
+def test_resolve_memoizes_misspellings():
+    tool = NamedTool(name="Search the internet")
+    registry = ToolRegistry([tool])
+
+    with patch.object(
+        registry, "_fuzzy_match", wraps=registry._fuzzy_match
+    ) as fuzzy_match:
+        assert registry.resolve("Serch the internet") is tool
+        assert registry.resolve("serch the internet ") is tool
+        assert registry.resolve("Fetch a page") is None
+        assert registry.resolve("Fetch a page") is None
+
+    assert fuzzy_match.call_count == 2
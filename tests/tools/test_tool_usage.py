@@ -226,8 +226,294 @@ def test_validate_tool_input_with_special_characters():
     )
 
     # Input with special characters
-    tool_input = '{"message": "Hello, world! \u263A", "valid": True}'
+    tool_input = '{"message": "Hello, world! \u263a", "valid": True}'
     expected_arguments = {"message": "Hello, world! ☺", "valid": True}
 
     arguments = tool_usage._validate_tool_input(tool_input)
     assert arguments == expected_arguments
+
+
+def test_validate_tool_input_keeps_apostrophes_in_strings():
+    tool_usage = ToolUsage(
+        tools_handler=MagicMock(),
+        tools=[],
+        original_tools=[],
+        tools_description="",
+        tools_names="",
+        task=MagicMock(),
+        function_calling_llm=MagicMock(),
+        agent=MagicMock(),
+        action=MagicMock(),
+    )
+
+    assert tool_usage._validate_tool_input(
+        "{'query': \"what's new\", 'exact': True}"
+    ) == {"query": "what's new", "exact": True}
+    assert tool_usage._validate_tool_input('{"query": "it\'s None"}') == {
+        "query": "it's None"
+    }
+
+
+def test_tool_arguments_filters_tools_without_accepted_args():
+    from crewai.tools.tool_calling import ToolCalling
+
+    class SearchInput(BaseModel):
+        query: str
+
+    tool_usage = ToolUsage(
+        tools_handler=MagicMock(),
+        tools=[],
+        original_tools=[],
+        tools_description="",
+        tools_names="",
+        task=MagicMock(),
+        function_calling_llm=MagicMock(),
+        agent=MagicMock(),
+        action=MagicMock(),
+    )
+    calling = ToolCalling(
+        tool_name="search", arguments={"query": "crewai", "extra": True}
+    )
+    # LangChain-style tools expose args_schema but no accepted_args
+    langchain_tool = MagicMock(spec=["name", "args_schema", "invoke"])
+    langchain_tool.args_schema = SearchInput
+    schemaless_tool = MagicMock(spec=["name", "invoke"])
+
+    assert tool_usage._tool_arguments(langchain_tool, calling) == {"query": "crewai"}
+    assert tool_usage._tool_arguments(schemaless_tool, calling) == calling.arguments
+
+
+def _async_tool_usage(tool):
+    from crewai.agents.tools_handler import ToolsHandler
+
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(description="test", expected_output="test", agent=agent)
+    structured_tool = tool.to_structured_tool()
+    return ToolUsage(
+        tools_handler=ToolsHandler(),
+        tools=[structured_tool],
+        original_tools=[tool],
+        tools_description="",
+        tools_names=tool.name,
+        task=task,
+        function_calling_llm=None,
+        agent=agent,
+        action=MagicMock(tool=tool.name, tool_input='{"query": "crewai"}'),
+    )
+
+
+@pytest.mark.asyncio
+async def test_ause_awaits_coroutine_tools_on_the_event_loop():
+    import threading
+
+    from crewai.tools import tool
+
+    threads = []
+
+    @tool
+    async def async_search(query: str) -> str:
+        """Search asynchronously."""
+        threads.append(threading.current_thread())
+        return f"found {query}"
+
+    tool_usage = _async_tool_usage(async_search)
+    calling = await tool_usage.aparse_tool_calling("")
+
+    assert await tool_usage.ause(calling, "") == "found crewai"
+    assert threads == [threading.current_thread()]
+
+
+@pytest.mark.asyncio
+async def test_ause_runs_sync_tools_on_the_shared_tool_pool():
+    import threading
+
+    from crewai.tools import tool
+
+    thread_names = []
+
+    @tool
+    def sync_search(query: str) -> str:
+        """Search synchronously."""
+        thread_names.append(threading.current_thread().name)
+        return f"found {query}"
+
+    tool_usage = _async_tool_usage(sync_search)
+    calling = await tool_usage.aparse_tool_calling("")
+
+    assert await tool_usage.ause(calling, "") == "found crewai"
+    assert thread_names[0].startswith("crewai-tool")
+
+
+def test_use_runs_coroutine_tools_from_sync_code():
+    from crewai.tools import tool
+
+    @tool
+    async def async_search(query: str) -> str:
+        """Search asynchronously."""
+        return f"found {query}"
+
+    tool_usage = _async_tool_usage(async_search)
+    calling = tool_usage.parse_tool_calling("")
+
+    assert tool_usage.use(calling, "") == "found crewai"
+
+
+@pytest.mark.asyncio
+async def test_sync_invoke_of_coroutine_tool_inside_running_loop():
+    from crewai.tools import tool
+
+    @tool
+    async def async_search(query: str) -> str:
+        """Search asynchronously."""
+        return f"found {query}"
+
+    structured_tool = async_search.to_structured_tool()
+
+    assert structured_tool.invoke({"query": "crewai"}) == "found crewai"
+
+
+def test_concurrent_tool_usages_keep_shared_counters_consistent():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from crewai.tools import tool
+    from crewai.tools.tool_calling import ToolCalling
+
+    @tool
+    def search(query: str) -> str:
+        """Search for something."""
+        return f"found {query}"
+
+    tool_usage = _async_tool_usage(search)
+    calls = 200
+
+    def run(i: int) -> str:
+        calling = ToolCalling(tool_name=search.name, arguments={"query": str(i)})
+        return tool_usage.use(calling, "")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(run, range(calls)))
+
+    assert all(result.startswith(f"found {i}") for i, result in enumerate(results))
+    assert tool_usage.task.used_tools == calls
+    assert len(tool_usage.agent.tools_results) == calls
+
+
+def test_format_reminder_follows_parallel_actions():
+    tool_usage = ToolUsage(
+        tools_handler=MagicMock(),
+        tools=[],
+        original_tools=[],
+        tools_description="",
+        tools_names="search",
+        task=MagicMock(),
+        function_calling_llm=MagicMock(),
+        agent=MagicMock(i18n=example_agent.i18n),
+        action=MagicMock(),
+    )
+    assert "use one at time" in tool_usage._format_slice()
+
+    tool_usage.parallel_actions = True
+    assert "use one at time" not in tool_usage._format_slice()
+    assert "[search]" in tool_usage._format_slice()
+
+
+def test_oversized_results_are_stored_and_read_back_in_slices():
+    from crewai.agents.tools_handler import ToolsHandler
+    from crewai.tools import tool
+    from crewai.tools.agent_tools.read_tool_result_tool import ReadToolResultTool
+    from crewai.tools.tool_calling import ToolCalling
+    from crewai.utilities.tool_result_store import get_tool_result_store
+
+    page = "<p>" + "scraped text " * 2000 + "</p>"
+
+    @tool
+    def scrape(url: str) -> str:
+        """Scrape a page."""
+        return page
+
+    reader = ReadToolResultTool()
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        max_tool_result_size=500,
+    )
+    task = Task(description="test", expected_output="test", agent=agent)
+    tool_usage = ToolUsage(
+        tools_handler=ToolsHandler(),
+        tools=[scrape.to_structured_tool(), reader.to_structured_tool()],
+        original_tools=[scrape, reader],
+        tools_description="",
+        tools_names="",
+        task=task,
+        function_calling_llm=None,
+        agent=agent,
+        action=MagicMock(),
+    )
+
+    result = tool_usage.use(
+        ToolCalling(tool_name=scrape.name, arguments={"url": "https://crewai.com"}),
+        "",
+    )
+    handle = result.split("handle ")[1].split(".")[0]
+
+    assert len(result) < 1000
+    assert result.startswith(f"The result is {len(page)} bytes long")
+    assert agent.tools_results[-1]["result"] == result
+    assert get_tool_result_store().read(handle, 0, len(page)) == page
+    assert reader.run(handle=handle, offset=len(page) - 4, length=100) == (
+        f"</p>\n\n[bytes {len(page) - 4}-{len(page)} of {len(page)}]"
+    )
+
+
+def test_oversized_results_are_cached_as_previews():
+    from crewai.agents.cache import CacheHandler
+    from crewai.agents.tools_handler import ToolsHandler
+    from crewai.tools import tool
+    from crewai.tools.agent_tools.read_tool_result_tool import ReadToolResultTool
+    from crewai.tools.tool_calling import ToolCalling
+
+    calls = []
+
+    @tool
+    def scrape(url: str) -> str:
+        """Scrape a page."""
+        calls.append(url)
+        return "scraped text " * 2000
+
+    reader = ReadToolResultTool()
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        max_tool_result_size=500,
+    )
+    task = Task(description="test", expected_output="test", agent=agent)
+    cache = CacheHandler()
+    tool_usage = ToolUsage(
+        tools_handler=ToolsHandler(cache=cache),
+        tools=[scrape.to_structured_tool(), reader.to_structured_tool()],
+        original_tools=[scrape, reader],
+        tools_description="",
+        tools_names="",
+        task=task,
+        function_calling_llm=None,
+        agent=agent,
+        action=MagicMock(),
+    )
+    calling = ToolCalling(
+        tool_name=scrape.name, arguments={"url": "https://crewai.com"}
+    )
+
+    first = tool_usage.use(calling, "")
+    cached = cache.read(scrape.name, {"url": "https://crewai.com"})
+    # Another step asking for the same page is served from the cache
+    tool_usage.tools_handler.last_used_tool = {}
+    second = tool_usage.use(
+        ToolCalling(tool_name=scrape.name, arguments={"url": "https://crewai.com"}), ""
+    )
+
+    assert calls == ["https://crewai.com"]
+    assert len(cached) < 1000
+    assert first.startswith(cached)
+    assert second.startswith(cached)
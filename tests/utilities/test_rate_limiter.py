@@ -0,0 +1,158 @@
+import threading
+import time
+
+import pytest
+
+from crewai.utilities.rate_limiter import RateLimiter, get_rate_limiter
+from crewai.utilities.rpm_controller import RPMController
+
+
+def test_rate_limiter_waits_only_until_window_frees():
+    limiter = RateLimiter(max_rpm=2, period=0.2)
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+    waited = limiter.acquire()
+
+    assert 0.1 < waited < 0.5
+
+
+def test_rate_limiter_tokens_per_minute_budget():
+    limiter = RateLimiter(max_tpm=100, period=0.2)
+    assert limiter.try_acquire()
+    limiter.record_tokens(150)
+    assert not limiter.try_acquire()
+
+    time.sleep(0.25)
+    assert limiter.try_acquire()
+
+
+def test_rate_limiter_admits_waiters_in_fifo_order():
+    limiter = RateLimiter(max_rpm=1, period=0.1)
+    limiter.acquire()
+    order = []
+
+    def worker(index):
+        limiter.acquire()
+        order.append(index)
+
+    threads = []
+    for index in range(3):
+        thread = threading.Thread(target=worker, args=(index,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_async_acquire():
+    limiter = RateLimiter(max_rpm=1, period=0.1)
+    assert await limiter.aacquire() == 0.0
+    assert await limiter.aacquire() > 0
+
+
+def test_get_rate_limiter_is_shared_per_key():
+    limiter = get_rate_limiter("test-shared-model", max_rpm=5)
+    assert get_rate_limiter("test-shared-model", max_rpm=5) is limiter
+    assert get_rate_limiter("another-test-model", max_rpm=5) is not limiter
+
+
+def test_get_rate_limiter_keeps_each_budget_on_a_shared_window():
+    strict = get_rate_limiter("test-budget-model", max_rpm=1)
+    loose = get_rate_limiter("test-budget-model", max_rpm=3)
+
+    assert strict is not loose
+    assert (strict.max_rpm, loose.max_rpm) == (1, 3)
+    assert loose.try_acquire()
+    # The request made through `loose` counts against the shared window
+    assert not strict.try_acquire()
+    assert loose.try_acquire()
+
+
+def test_set_rate_limit_backend_applies_to_existing_limiters(tmp_path):
+    from crewai.utilities.rate_limiter import (
+        SQLiteRateLimitBackend,
+        set_rate_limit_backend,
+    )
+
+    controller = RPMController(max_rpm=1, key="agent:existing")
+    backend = SQLiteRateLimitBackend(str(tmp_path / "limits.db"))
+    set_rate_limit_backend(backend)
+    try:
+        assert controller.limiter.backend is backend
+        other_process = RateLimiter(max_rpm=1, key="agent:existing", backend=backend)
+        assert other_process.try_acquire()
+        assert not controller.limiter.try_acquire()
+    finally:
+        set_rate_limit_backend(None)
+    assert controller.limiter.backend is not backend
+
+
+def test_agent_copy_shares_rate_limiter():
+    from crewai import Agent
+
+    agent = Agent(role="role", goal="goal", backstory="backstory", max_rpm=1)
+    copied_agent = agent.copy()
+
+    assert copied_agent._rpm_controller.limiter is agent._rpm_controller.limiter
+
+
+def test_rpm_controller_shares_limiter():
+    controller = RPMController(max_rpm=1)
+    copy = RPMController(max_rpm=1)
+    copy.share_limiter(controller)
+
+    assert controller.check_or_wait()
+    assert not copy.limiter.try_acquire()
+
+
+def test_sqlite_backend_shares_budget_between_limiters(tmp_path):
+    from crewai.utilities.rate_limiter import SQLiteRateLimitBackend
+
+    db_path = str(tmp_path / "rate_limits.db")
+    # Separate backend instances stand in for separate worker processes
+    first = RateLimiter(
+        max_rpm=2, period=0.3, key="crew:abc", backend=SQLiteRateLimitBackend(db_path)
+    )
+    second = RateLimiter(
+        max_rpm=2, period=0.3, key="crew:abc", backend=SQLiteRateLimitBackend(db_path)
+    )
+    other_key = RateLimiter(
+        max_rpm=2, period=0.3, key="crew:xyz", backend=SQLiteRateLimitBackend(db_path)
+    )
+
+    assert first.try_acquire()
+    assert second.try_acquire()
+    assert not first.try_acquire()
+    assert not second.try_acquire()
+    assert other_key.try_acquire()
+    assert 0.1 < second.acquire() < 1
+
+
+def test_rate_limit_backend_from_env(tmp_path, monkeypatch):
+    from crewai.utilities import rate_limiter
+    from crewai.utilities.rate_limiter import (
+        SQLiteRateLimitBackend,
+        get_rate_limit_backend,
+        set_rate_limit_backend,
+    )
+
+    monkeypatch.setenv("CREWAI_RATE_LIMIT_BACKEND", "sqlite")
+    monkeypatch.setenv("CREWAI_RATE_LIMIT_DB", str(tmp_path / "limits.db"))
+    set_rate_limit_backend(None)
+    try:
+        backend = get_rate_limit_backend()
+        assert isinstance(backend, SQLiteRateLimitBackend)
+        first = RPMController(max_rpm=1, key="agent:123")
+        second = RPMController(max_rpm=1, key="agent:123")
+        assert first.limiter.try_acquire()
+        assert not second.limiter.try_acquire()
+    finally:
+        set_rate_limit_backend(None)
+        monkeypatch.delenv("CREWAI_RATE_LIMIT_BACKEND")
+    assert rate_limiter.get_rate_limit_backend() is None
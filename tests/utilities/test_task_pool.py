@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from crewai.utilities.task_pool import TaskPool
+
+
+def test_exceptions_reach_the_future():
+    def fail():
+        raise RuntimeError("boom")
+
+    future = TaskPool().submit(fail)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        future.result(timeout=5)
+
+
+def test_max_workers_caps_in_flight_runs_without_holding_threads():
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+    release = threading.Event()
+
+    def run(n):
+        with lock:
+            in_flight.append(n)
+            peak.append(len(in_flight))
+        release.wait(5)
+        with lock:
+            in_flight.remove(n)
+        return n
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        capped = TaskPool(max_workers=2, executor=executor)
+        futures = [capped.submit(run, n) for n in range(6)]
+        # Queued submissions leave the executor free for other pools
+        assert TaskPool(executor=executor).submit(lambda: "free").result(5) == "free"
+        release.set()
+
+        assert [future.result(timeout=5) for future in futures] == list(range(6))
+    assert max(peak) == 2
+
+
+def test_cancel_pending_drops_queued_runs():
+    started = threading.Event()
+    release = threading.Event()
+    ran = []
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    pool = TaskPool(max_workers=1)
+    running = pool.submit(block)
+    started.wait(5)
+    queued = [pool.submit(ran.append, n) for n in range(3)]
+    queued[0].cancel()
+
+    assert pool.cancel_pending() == 2
+    release.set()
+    running.result(timeout=5)
+
+    assert all(future.cancelled() for future in queued)
+    assert pool.submit(lambda: "ok").result(timeout=5) == "ok"
+    assert ran == []
+
+
+def test_max_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        TaskPool(max_workers=0)
@@ -0,0 +1,40 @@
+import pytest
+
+from crewai.utilities.tool_result_store import ToolResultStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ToolResultStore(str(tmp_path))
+
+
+def test_put_and_read_slices(store):
+    handle = store.put("abcdefghij" * 100)
+
+    assert store.size(handle) == 1000
+    assert store.read(handle, 0, 5) == "abcde"
+    assert store.read(handle, 995, 100) == "fghij"
+    assert store.read(handle, 2000, 10) == ""
+
+
+def test_read_drops_characters_cut_by_the_slice(store):
+    handle = store.put("é" * 10)
+
+    assert store.read(handle, 1, 4) == "é"
+
+
+def test_unknown_or_malformed_handles_are_rejected(store, tmp_path):
+    (tmp_path / "secrets.txt").write_text("secret")
+
+    with pytest.raises(KeyError):
+        store.read("result-" + "0" * 32)
+    with pytest.raises(KeyError):
+        store.read("../secrets.txt")
+
+
+def test_clear_removes_stored_results(store):
+    handle = store.put("data")
+    store.clear()
+
+    with pytest.raises(KeyError):
+        store.read(handle)